@@ -17,10 +17,15 @@ from taipy.logger._taipy_logger import _TaipyLogger
 from ._backup._backup import _init_backup_file_with_storage_folder
 from ._core_cli import _CoreCLI
 from ._orchestrator._dispatcher._job_dispatcher import _JobDispatcher
+from ._orchestrator._dispatcher._standalone_job_dispatcher import _StandaloneJobDispatcher
+from ._orchestrator._metrics_registry import _MetricsRegistry
 from ._orchestrator._orchestrator import _Orchestrator
 from ._orchestrator._orchestrator_factory import _OrchestratorFactory
 from ._version._version_manager_factory import _VersionManagerFactory
 from .config import CoreSection
+from .data._sql_engine_registry import _SQLEngineRegistry
+from .exceptions.exceptions import ModeNotAvailable
+from .job._job_callback_executor import _JobCallbackExecutor
 
 
 class Core:
@@ -49,19 +54,42 @@ class Core:
         self.__update_and_check_config()
         self.__manage_version()
         self.__start_dispatcher(force_restart)
+        self.__start_metrics_server()
 
     def stop(self):
         """
         Stop the Core service.
 
-        This function stops the dispatcher and unblock the Config for update.
+        This function stops the dispatcher, closes the connections to the SQL databases and unblock the Config
+        for update.
         """
         Config.unblock_update()
+        _MetricsRegistry._stop_http_server()
+        _JobCallbackExecutor._shutdown()
+        _SQLEngineRegistry._dispose_all()
 
         if self._dispatcher:
             self._dispatcher = _OrchestratorFactory._remove_dispatcher()
             self.__logger.info("Core service has been stopped.")
 
+    def resize_workers(self, max_nb_of_workers: int, min_nb_of_workers: Optional[int] = None):
+        """
+        Change the number of workers of the running Core service in *"standalone"* mode.
+
+        The running jobs are not interrupted. If the maximum number of workers is lowered below the
+        number of running jobs, no new job starts until enough jobs are finished.
+
+        Parameters:
+            max_nb_of_workers (int): The maximum number of jobs running in parallel.
+            min_nb_of_workers (Optional[int]): The minimum number of worker processes kept alive. If
+                None, the number of worker processes is fixed to *max_nb_of_workers*.
+        Raises:
+            ModeNotAvailable^: If the Core service is not running in *"standalone"* mode.
+        """
+        if not isinstance(self._dispatcher, _StandaloneJobDispatcher):
+            raise ModeNotAvailable("Workers can only be resized when the Core service runs in standalone mode.")
+        self._dispatcher._resize(max_nb_of_workers, min_nb_of_workers)
+
     @staticmethod
     def __update_and_check_config():
         _CoreCLI.create_parser()
@@ -78,5 +106,11 @@ class Core:
         if dispatcher := _OrchestratorFactory._build_dispatcher(force_restart=force_restart):
             self._dispatcher = dispatcher
 
+        _Orchestrator._recover_jobs()
         if Config.job_config.is_development:
             _Orchestrator._check_and_execute_jobs_if_development_mode()
+
+    @staticmethod
+    def __start_metrics_server():
+        if Config.job_config.metrics_port is not None:
+            _MetricsRegistry._start_http_server(int(Config.job_config.metrics_port))
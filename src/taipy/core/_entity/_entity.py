@@ -18,6 +18,7 @@ from ..notification import _publish_event
 class _Entity:
     _MANAGER_NAME: str
     _is_in_context = False
+    _is_snapshot = False
     _in_context_attributes_changed_collector: List
 
     def __enter__(self):
@@ -10,16 +10,20 @@
 # specific language governing permissions and limitations under the License.
 
 import functools
+import threading
 
 from ..notification import EventOperation, _publish_event
 
 
 class _Reloader:
-    """The _Reloader singleton class"""
+    """The _Reloader singleton class
+
+    Within a `with _Reloader():` block, the entities are not reloaded from the repository by the current thread.
+    """
 
     _instance = None
 
-    _no_reload_context = False
+    _no_reload_contexts = threading.local()
 
     def __new__(class_, *args, **kwargs):
         if not isinstance(class_._instance, class_):
@@ -27,7 +31,7 @@ class _Reloader:
         return class_._instance
 
     def _reload(self, manager: str, obj):
-        if self._no_reload_context:
+        if getattr(self._no_reload_contexts, "depth", 0):
             return obj
 
         entity = _get_manager(manager)._get(obj, obj)
@@ -38,18 +42,19 @@ class _Reloader:
         return entity
 
     def __enter__(self):
-        self._no_reload_context = True
+        self._no_reload_contexts.depth = getattr(self._no_reload_contexts, "depth", 0) + 1
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        self._no_reload_context = False
+        self._no_reload_contexts.depth -= 1
 
 
 def _self_reload(manager):
     def __reload(fct):
         @functools.wraps(fct)
         def _do_reload(self, *args, **kwargs):
-            self = _Reloader()._reload(manager, self)
+            if not self._is_snapshot:
+                self = _Reloader()._reload(manager, self)
             return fct(self, *args, **kwargs)
 
         return _do_reload
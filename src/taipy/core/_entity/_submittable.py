@@ -34,6 +34,7 @@ class _Submittable:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ):
         raise NotImplementedError
 
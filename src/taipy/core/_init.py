@@ -39,6 +39,7 @@ from .taipy import (
     get_entities_by_config_id,
     get_jobs,
     get_latest_job,
+    get_metrics,
     get_parents,
     get_pipelines,
     get_primary,
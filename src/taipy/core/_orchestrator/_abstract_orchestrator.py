@@ -33,6 +33,7 @@ class _AbstractOrchestrator:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> List[Job]:
         raise NotImplementedError
 
@@ -47,6 +48,7 @@ class _AbstractOrchestrator:
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> Job:
         raise NotImplementedError
 
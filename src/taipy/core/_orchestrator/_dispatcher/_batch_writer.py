@@ -0,0 +1,55 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from queue import Queue
+from typing import Any, Iterator, Optional
+
+from ..._entity._reload import _Reloader
+from ...data.data_node import DataNode
+
+
+class _BatchWriter:
+    """Writes the batches yielded by a generator task in one of its outputs, on a dedicated thread.
+
+    The batches go through a bounded queue, so the generator cannot run more than a batch ahead of the write.
+    """
+
+    __END = object()
+
+    def __init__(self, data_node: DataNode, max_nb_of_pending_batches: int = 1):
+        self.data_node = data_node
+        self.error: Optional[Exception] = None
+        self._queue: Queue = Queue(max_nb_of_pending_batches)
+        self._thread = threading.Thread(target=self.__write, name="Thread-Taipy-BatchWriter", daemon=True)
+        self._thread.start()
+
+    def put(self, batch: Any):
+        self._queue.put(batch)
+
+    def close(self):
+        """Wait for all the batches to be written."""
+        self._queue.put(self.__END)
+        self._thread.join()
+
+    def __get_batches(self) -> Iterator[Any]:
+        while (batch := self._queue.get()) is not self.__END:
+            yield batch
+
+    def __write(self):
+        batches = self.__get_batches()
+        try:
+            with _Reloader():
+                self.data_node._write_batches(batches)
+        except Exception as e:
+            self.error = e
+        for _ in batches:  # The remaining batches are dropped, so a failed write never blocks the generator.
+            pass
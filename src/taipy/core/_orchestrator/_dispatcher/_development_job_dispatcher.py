@@ -39,5 +39,5 @@ class _DevelopmentJobDispatcher(_JobDispatcher):
         Parameters:
             job (Job^): The job to submit on an executor with an available worker.
         """
-        rs = self._wrapped_function(job.id, job.task)
-        self._update_job_status(job, rs)
+        rs, metadata = self._wrapped_function(job.id, job.task)
+        self._update_job_status(job, rs, metadata)
@@ -0,0 +1,100 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sys
+from contextlib import contextmanager
+from stat import S_ISREG
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # The resource module is not available on Windows.
+    resource = None  # type: ignore
+
+from ...data._abstract_file import _AbstractFileDataNode
+from ...data.data_node import DataNode
+
+
+class _ExecutionMetrics:
+    """Measures the phases of a job execution in the worker process."""
+
+    _READ = "read"
+    _COMPUTE = "compute"
+    _WRITE = "write"
+
+    def __init__(self):
+        self._durations: Dict[str, float] = {}
+        self._inputs: Dict[str, Dict[str, Any]] = {}
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def _phase(self, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._durations[name] = perf_counter() - start
+
+    def _measure_read(self, read: Callable[[DataNode], Any]) -> Callable[[DataNode], Any]:
+        return self.__measure(read, self._inputs)
+
+    def _measure_write(self, write: Callable[..., Any]) -> Callable[..., Any]:
+        return self.__measure(write, self._outputs)
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            **{f"{phase}_duration": self._durations.get(phase) for phase in (self._READ, self._COMPUTE, self._WRITE)},
+            "worker_peak_rss": self.__get_worker_peak_rss(),
+            "inputs": self._inputs,
+            "outputs": self._outputs,
+        }
+
+    @classmethod
+    def __measure(cls, fct: Callable[..., Any], metrics: Dict[str, Dict[str, Any]]) -> Callable[..., Any]:
+        def _measured(data_node: DataNode, *args, **kwargs):
+            start = perf_counter()
+            try:
+                return fct(data_node, *args, **kwargs)
+            finally:
+                metrics[data_node.id] = {
+                    "duration": perf_counter() - start,
+                    "storage_size": cls.__get_storage_size(data_node),
+                }
+
+        return _measured
+
+    @staticmethod
+    def __get_storage_size(data_node: DataNode) -> Optional[int]:
+        """Return the size in bytes of the file storing the data node.
+
+        This is the size of the whole file, not the number of bytes read or written. None is returned for the data
+        nodes not stored in a single file, such as the datasets stored as folders, to avoid walking them.
+        """
+        if not isinstance(data_node, _AbstractFileDataNode):
+            return None
+        try:
+            stat = os.stat(data_node._path)  # type: ignore
+        except (OSError, TypeError):
+            return None
+        return stat.st_size if S_ISREG(stat.st_mode) else None
+
+    @staticmethod
+    def __get_worker_peak_rss() -> Optional[int]:
+        """Return the peak resident set size in bytes of the current process since it started.
+
+        A worker process reused by several jobs reports the highest peak of all the jobs it executed so far.
+        """
+        if resource is None:
+            return None
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_rss if sys.platform == "darwin" else peak_rss * 1024  # Kilobytes on Linux.
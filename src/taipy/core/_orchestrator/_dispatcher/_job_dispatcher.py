@@ -11,7 +11,7 @@
 
 import threading
 from abc import abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from taipy.config.config import Config
 from taipy.logger._taipy_logger import _TaipyLogger
@@ -19,8 +19,10 @@ from taipy.logger._taipy_logger import _TaipyLogger
 from ...data._data_manager_factory import _DataManagerFactory
 from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job import Job
+from ...job.status import Status
 from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
+from .._metrics_registry import _MetricsRegistry
 from ._task_function_wrapper import _TaskFunctionWrapper
 
 
@@ -37,6 +39,8 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
         self.daemon = True
         self.orchestrator = orchestrator
         self.lock = self.orchestrator.lock  # type: ignore
+        self._nb_running_jobs_by_task_config: Dict[str, int] = {}
+        self._running_jobs_lock = threading.Lock()
         Config.block_update()
 
     def start(self):
@@ -57,7 +61,7 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
             try:
                 if self._can_execute():
                     with self.lock:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
+                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1, can_run=self._can_run)
                     self._execute_job(job)
             except Exception:  # In case the last job of the queue has been removed.
                 pass
@@ -66,16 +70,30 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
         """Returns True if the dispatcher have resources to execute a new job."""
         return self._nb_available_workers > 0
 
+    def _can_run(self, job: Job) -> bool:
+        """Returns True if the number of running jobs of the job's task configuration is below its limit."""
+        task_config = Config.tasks.get(job._task.config_id)
+        if task_config is None or task_config.max_concurrent_jobs is None:
+            return True
+        nb_running_jobs = self._nb_running_jobs_by_task_config.get(job._task.config_id, 0)
+        return nb_running_jobs < int(task_config.max_concurrent_jobs)
+
     def _execute_job(self, job: Job):
         if job.force or self._needs_to_run(job.task):
             if job.force:
                 self.__logger.info(f"job {job.id} is forced to be executed.")
             job.running()
+            self._update_nb_running_jobs(job, 1)
             self._dispatch(job)
+            _MetricsRegistry._increment(_MetricsRegistry._JOBS_DISPATCHED)
+            self.__observe_duration(job, Status.PENDING, Status.RUNNING, _MetricsRegistry._JOB_PENDING_SECONDS)
         else:
             job._unlock_edit_on_outputs()
             job.skipped()
             self.__logger.info(f"job {job.id} is skipped.")
+            _MetricsRegistry._increment(_MetricsRegistry._JOBS_FINISHED, labels={"status": job.status.name.lower()})
+        _MetricsRegistry._set_gauge(_MetricsRegistry._JOBS_TO_RUN, self.orchestrator.jobs_to_run.qsize())
+        _MetricsRegistry._set_gauge(_MetricsRegistry._AVAILABLE_WORKERS, self._nb_available_workers)
 
     def _execute_jobs_synchronously(self):
         while not self.orchestrator.jobs_to_run.empty():
@@ -120,10 +138,29 @@ class _JobDispatcher(threading.Thread, _TaskFunctionWrapper):
         """
         raise NotImplementedError
 
-    @staticmethod
-    def _update_job_status(job: Job, exceptions):
+    def _update_job_status(self, job: Job, exceptions, metadata: Optional[Dict[str, Any]] = None):
+        self._update_nb_running_jobs(job, -1)
+        if metadata:
+            job._metadata.update(metadata)
         job.update_status(exceptions)
         _JobManagerFactory._build_manager()._set(job)
+        _MetricsRegistry._increment(_MetricsRegistry._JOBS_FINISHED, labels={"status": job.status.name.lower()})
+        self.__observe_duration(job, Status.RUNNING, job.status, _MetricsRegistry._JOB_RUNNING_SECONDS)
+
+    @staticmethod
+    def __observe_duration(job: Job, from_status: Status, to_status: Status, metric_name: str):
+        start, end = job._status_timestamps.get(from_status), job._status_timestamps.get(to_status)
+        if start and end:
+            _MetricsRegistry._observe(metric_name, (end - start).total_seconds())
+
+    def _update_nb_running_jobs(self, job: Job, increment: int):
+        config_id = job._task.config_id
+        with self._running_jobs_lock:
+            nb_running_jobs = self._nb_running_jobs_by_task_config.pop(config_id, 0) + increment
+            if nb_running_jobs > 0:
+                self._nb_running_jobs_by_task_config[config_id] = nb_running_jobs
+        if increment < 0:
+            self.orchestrator.jobs_to_run._notify_change()
 
     @classmethod
     def _set_dispatched_processes(cls, job_id, process):
@@ -0,0 +1,166 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from ...job.job_id import JobId
+from ...task.task import Task
+from ._task_function_wrapper import _TaskFunctionWrapper
+
+
+class _PartitionedExecution:
+    """Execution of a partitioned task on a pool of processes.
+
+    A worker lists the partitions of the first input of the task, the partitions are computed in parallel by the
+    workers, and a worker writes the reduction of their results in the outputs. Each worker only loads a partition
+    at a time. The job holds a single worker: the idle workers of the pool are acquired to compute the partitions
+    in parallel, and released once no partition is left, so there are never more partitions in flight than workers
+    held by the job. The workers spill the results of the partitions to files of a temporary folder, removed when
+    the execution completes, so only the paths of the files go through the dispatcher. The `future` completes with
+    the exceptions and the metadata of the execution, like the future of a job executed at once.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[..., Future],
+        config_as_string: str,
+        job_id: JobId,
+        task: Task,
+        acquire_worker: Callable[[], bool] = lambda: False,
+        release_worker: Callable[[], None] = lambda: None,
+    ):
+        """
+        Parameters:
+            submit (Callable): The function submitting a function and its arguments to the pool of processes.
+            config_as_string (str): The serialized configuration loaded by the workers.
+            job_id (JobId): The identifier of the job executing the task.
+            task (Task^): The partitioned task.
+            acquire_worker (Callable): The function reserving an idle worker of the pool, if any. It returns False
+                if no worker is available.
+            release_worker (Callable): The function releasing a worker reserved with *acquire_worker*.
+        """
+        self.future: Future = Future()
+        self._submit = submit
+        self._config_as_string = config_as_string
+        self._job_id = job_id
+        self._task = task
+        self._acquire_worker = acquire_worker
+        self._release_worker = release_worker
+        self._result_paths: List[str] = []
+        self._pending_partitions: Deque[Tuple[Any, str]] = deque()
+        self._nb_of_remaining_partitions = 0
+        self._nb_of_acquired_workers = 0
+        self._lock = threading.Lock()
+        self._spill_folder = tempfile.mkdtemp(prefix=f"taipy-{job_id}-")
+        self.future.add_done_callback(lambda _: shutil.rmtree(self._spill_folder, ignore_errors=True))
+        self.__then(
+            submit(_TaskFunctionWrapper._get_partitions_with_config_load, config_as_string, task),
+            self.__compute_partitions,
+        )
+
+    def __compute_partitions(self, partitions: List[Any]):
+        if not partitions:
+            self.__reduce()
+            return
+        self._result_paths = [os.path.join(self._spill_folder, f"partition_{i}.pickle") for i in range(len(partitions))]
+        self._pending_partitions.extend(zip(partitions, self._result_paths))
+        self._nb_of_remaining_partitions = len(partitions)
+        self.__compute_next_partition()  # On the worker held by the job.
+        while self._pending_partitions and self._acquire_worker():
+            with self._lock:
+                is_completed = self.future.done()
+                self._nb_of_acquired_workers += not is_completed
+            if is_completed:
+                self._release_worker()
+                return
+            self.__compute_next_partition()
+
+    def __compute_next_partition(self):
+        """Compute the next pending partition, or release the worker that computed the last partition if none."""
+        partition, result_path, is_worker_released = None, None, False
+        with self._lock:
+            if self._pending_partitions:
+                partition, result_path = self._pending_partitions.popleft()
+            elif self._nb_of_acquired_workers:
+                self._nb_of_acquired_workers -= 1
+                is_worker_released = True
+        if is_worker_released:
+            self._release_worker()
+        if result_path is None:
+            return
+        future = self._submit(
+            _TaskFunctionWrapper._compute_partition_with_config_load,
+            self._config_as_string,
+            self._task,
+            partition,
+            result_path,
+        )
+        self.__then(future, self.__collect)
+
+    def __collect(self, result):
+        exceptions, _ = result
+        if exceptions:
+            self.__complete(result=(exceptions, {}))
+            return
+        with self._lock:
+            self._nb_of_remaining_partitions -= 1
+            is_last_partition = self._nb_of_remaining_partitions == 0
+        if is_last_partition:
+            self.__reduce()
+        else:
+            self.__compute_next_partition()
+
+    def __release_acquired_workers(self):
+        with self._lock:
+            nb_of_acquired_workers, self._nb_of_acquired_workers = self._nb_of_acquired_workers, 0
+        for _ in range(nb_of_acquired_workers):
+            self._release_worker()
+
+    def __reduce(self):
+        future = self._submit(
+            _TaskFunctionWrapper._reduce_partitions_with_config_load,
+            self._config_as_string,
+            self._job_id,
+            self._task,
+            self._result_paths,
+        )
+        self.__then(future, lambda result: self.__complete(result=result))
+
+    def __then(self, future: Future, callback: Callable[[Any], None]):
+        future.add_done_callback(partial(self.__on_done, callback))
+
+    def __on_done(self, callback: Callable[[Any], None], future: Future):
+        if self.future.done():
+            return  # A partition failed: the results of the other partitions are ignored.
+        try:
+            callback(future.result())
+        except BrokenProcessPool as e:
+            self.__complete(exception=e)
+        except Exception as e:
+            self.__complete(result=([e], {}))
+
+    def __complete(self, result=None, exception: Optional[BaseException] = None):
+        with self._lock:
+            if self.future.done():
+                return
+            if exception is not None:
+                self.future.set_exception(exception)
+            else:
+                self.future.set_result(result)
+        self.__release_acquired_workers()
@@ -0,0 +1,192 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from multiprocessing.connection import Connection, Listener
+from typing import Dict, List, Optional
+
+from taipy.config._serializer._toml_serializer import _TomlSerializer
+from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from ...job.job import Job
+from ...job.job_id import JobId
+from .._abstract_orchestrator import _AbstractOrchestrator
+from .._worker._protocol import (
+    _DEFAULT_ADDRESS,
+    _DEFAULT_HEARTBEAT_INTERVAL,
+    _DONE,
+    _REGISTER,
+    _RUN,
+    _parse_address,
+    _to_authkey,
+)
+from ._job_dispatcher import _JobDispatcher
+
+
+class _RemoteWorker:
+    """Connection and bookkeeping of a worker agent connected to the remote job dispatcher."""
+
+    def __init__(self, id: str, connection: Connection, max_nb_of_workers: int):
+        self.id = id
+        self.connection = connection
+        self.max_nb_of_workers = max_nb_of_workers
+        self.running_jobs: Dict[JobId, Job] = {}
+        self._send_lock = threading.Lock()
+
+    @property
+    def nb_available_workers(self) -> int:
+        return self.max_nb_of_workers - len(self.running_jobs)
+
+    def send(self, *message):
+        with self._send_lock:
+            self.connection.send(message)
+
+
+class _RemoteJobDispatcher(_JobDispatcher):
+    """Manages job dispatching (instances of `Job^` class) on worker agents connected through TCP or a Unix socket.
+
+    Each worker advertises the number of jobs it can execute in parallel. A job is dispatched to the worker with the
+    most available workers, so the idle workers take the next jobs of the queue. A worker that disconnects or misses
+    its heartbeats is removed and the jobs it was executing are queued again to run on the other workers.
+    """
+
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(self, orchestrator: Optional[_AbstractOrchestrator]):
+        super().__init__(orchestrator)
+        heartbeat_interval = float(Config.job_config.heartbeat_interval or _DEFAULT_HEARTBEAT_INTERVAL)
+        self._heartbeat_timeout = 3 * heartbeat_interval
+        self._workers: Dict[str, _RemoteWorker] = {}
+        self._workers_lock = threading.Lock()
+        self._listener = Listener(
+            _parse_address(Config.job_config.remote_address or _DEFAULT_ADDRESS),
+            authkey=_to_authkey(Config.job_config.remote_authkey),
+        )
+
+    @property
+    def address(self):
+        """The address on which the dispatcher accepts the connections of the workers."""
+        return self._listener.address
+
+    @property  # type: ignore
+    def _nb_available_workers(self) -> int:  # type: ignore
+        with self._workers_lock:
+            return sum(max(worker.nb_available_workers, 0) for worker in self._workers.values())
+
+    def start(self):
+        """Start the dispatcher and accept the connections of the workers."""
+        threading.Thread(target=self.__accept_workers, name="Thread-Taipy-RemoteWorkers", daemon=True).start()
+        super().start()
+
+    def stop(self):
+        """Stop the dispatcher and close the connections of the workers."""
+        super().stop()
+        self._listener.close()
+        with self._workers_lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            worker.connection.close()
+
+    def _dispatch(self, job: Job):
+        """Dispatches the given `Job^` on an available worker for execution.
+
+        Parameters:
+            job (Job^): The job to submit on a worker with an available capacity.
+        """
+        config_as_string = _TomlSerializer()._serialize(Config._applied_config)
+        with self._workers_lock:
+            worker = max(self._workers.values(), key=lambda w: w.nb_available_workers, default=None)
+            if worker is None or worker.nb_available_workers <= 0:
+                worker = None
+            else:
+                worker.running_jobs[job.id] = job
+        if worker is None:  # The workers disconnected in the meantime.
+            self.__requeue([job])
+            return
+        try:
+            worker.send(_RUN, job.id, job.task, config_as_string)
+        except (OSError, ValueError):
+            self.__remove_worker(worker)
+
+    def __accept_workers(self):
+        while not self._STOP_FLAG:
+            try:
+                connection = self._listener.accept()
+            except Exception as e:
+                if self._STOP_FLAG:
+                    return
+                self.__logger.warning(f"A worker could not connect to the job dispatcher: {e}")
+                continue
+            threading.Thread(
+                target=self.__serve_worker, args=(connection,), name="Thread-Taipy-RemoteWorker", daemon=True
+            ).start()
+
+    def __serve_worker(self, connection: Connection):
+        try:
+            if not connection.poll(self._heartbeat_timeout):
+                connection.close()
+                return
+            kind, worker_id, max_nb_of_workers = connection.recv()
+        except Exception:
+            connection.close()
+            return
+        if kind != _REGISTER:
+            connection.close()
+            return
+
+        worker = _RemoteWorker(worker_id, connection, int(max_nb_of_workers))
+        with self._workers_lock:
+            former_worker = self._workers.get(worker_id)
+        if former_worker:
+            self.__remove_worker(former_worker)
+        with self._workers_lock:
+            self._workers[worker_id] = worker
+        self.__logger.info(f"Worker {worker_id} is connected with {max_nb_of_workers} available workers.")
+
+        try:
+            while not self._STOP_FLAG:
+                if not connection.poll(self._heartbeat_timeout):
+                    self.__logger.warning(f"Worker {worker_id} missed its heartbeats.")
+                    break
+                message = connection.recv()
+                if message[0] == _DONE:
+                    self.__complete_job(worker, *message[1:])
+        except (EOFError, OSError):
+            pass
+        finally:
+            self.__remove_worker(worker)
+
+    def __complete_job(self, worker: _RemoteWorker, job_id: JobId, exceptions, metadata):
+        with self._workers_lock:
+            job = worker.running_jobs.pop(job_id, None)
+        if job is not None:  # The job may have been reassigned if the worker was considered as lost.
+            self._update_job_status(job, exceptions, metadata)
+
+    def __remove_worker(self, worker: _RemoteWorker):
+        with self._workers_lock:
+            if self._workers.get(worker.id) is not worker:
+                return
+            del self._workers[worker.id]
+            jobs = list(worker.running_jobs.values())
+            worker.running_jobs.clear()
+        worker.connection.close()
+        if self._STOP_FLAG:
+            return
+        self.__logger.warning(f"Worker {worker.id} is disconnected. {len(jobs)} jobs are reassigned.")
+        self.__requeue(jobs)
+
+    def __requeue(self, jobs: List[Job]):
+        for job in jobs:
+            self._update_nb_running_jobs(job, -1)
+            with self.lock:
+                job.pending()
+                self.orchestrator.jobs_to_run.put(job)  # type: ignore
@@ -9,25 +9,79 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from concurrent.futures import ProcessPoolExecutor
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import partial
-from typing import Optional
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from taipy.config._serializer._toml_serializer import _TomlSerializer
 from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
 
+from ...exceptions.exceptions import JobExecutionTimeout
 from ...job.job import Job
+from ...job.job_id import JobId
 from .._abstract_orchestrator import _AbstractOrchestrator
+from .._metrics_registry import _MetricsRegistry
 from ._job_dispatcher import _JobDispatcher
+from ._partitioned_execution import _PartitionedExecution
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor.
+
+    The worker processes belong to one or several executors. When a minimum number of workers lower than the maximum
+    is configured, the pool of processes is resized between both: it grows by adding an executor when jobs wait for
+    a worker, and the executors without running jobs are shut down, newest first, after some idle time. The jobs are
+    dispatched to the oldest executors first, so the warm worker processes are reused and never discarded while
+    they execute jobs.
+
+    A worker process terminating abruptly (segmentation fault or out-of-memory kill) breaks its executor. Only the
+    job executed by that process is failed, and the broken executor is discarded. The other jobs of that executor
+    are queued again, unless their function already returned, since running them again would repeat their side
+    effects, or they were already queued again too many times.
+
+    The jobs of a task configuration with a timeout run on their own single-process executor, so killing the worker
+    of a job exceeding its timeout does not interrupt the other jobs.
+
+    The worker processes are started with the `start_method` of the job configuration. With *"forkserver"*, the
+    Taipy modules and the `preload_modules` are imported once by the server process, so starting a worker only
+    costs a fork.
+    """
+
+    _DEFAULT_WORKER_IDLE_TIMEOUT = 60
+    _CRASHED_PROCESS_EXIT_TIMEOUT = 0.5
+    _MAX_NB_OF_REQUEUES = 3
+    __logger = _TaipyLogger._get_logger()
+    _job_pids_queue = None  # Set in each worker process by `_initialize_worker`.
 
     def __init__(self, orchestrator: Optional[_AbstractOrchestrator]):
         super().__init__(orchestrator)
-        self._executor = ProcessPoolExecutor(Config.job_config.max_nb_of_workers or 1)  # type: ignore
-        self._nb_available_workers = self._executor._max_workers  # type: ignore
+        self._max_nb_of_workers = int(Config.job_config.max_nb_of_workers or 1)
+        min_nb_of_workers = Config.job_config.min_nb_of_workers
+        self._min_nb_of_workers = self._max_nb_of_workers if min_nb_of_workers is None else int(min_nb_of_workers)
+        self._min_nb_of_workers = min(self._min_nb_of_workers, self._max_nb_of_workers)
+        self._workers_lock = threading.Lock()
+        self._last_activity = monotonic()
+        self._executors: List[ProcessPoolExecutor] = []
+        self._dedicated_executors: Dict[JobId, ProcessPoolExecutor] = {}
+        self._running_jobs: Dict[JobId, Tuple[ProcessPoolExecutor, Dict]] = {}
+        self._deadlines: Dict[JobId, float] = {}
+        self._timed_out_jobs: Set[JobId] = set()
+        self._job_pids: Dict[JobId, int] = {}
+        self._nb_of_running_calls: Dict[JobId, int] = {}
+        self._returned_jobs: Set[JobId] = set()
+        self._job_pids_lock = threading.Lock()
+        self._nb_of_requeues: Dict[JobId, int] = {}
+        self._mp_context = self.__get_mp_context()
+        self.__job_pids_queue = self._mp_context.SimpleQueue()
+        self.__add_executor(max(self._min_nb_of_workers, 1))
+        self._nb_available_workers = self._max_nb_of_workers
 
     def _dispatch(self, job: Job):
         """Dispatches the given `Job^` on an available worker for execution.
@@ -35,18 +89,282 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         Parameters:
             job (Job^): The job to submit on an executor with an available worker.
         """
-        self._nb_available_workers -= 1
+        task_config = Config.tasks.get(job._task.config_id)
+        timeout = None if task_config is None or task_config.timeout is None else float(task_config.timeout)
+        with self._workers_lock:
+            self._nb_available_workers -= 1
+            self._last_activity = monotonic()
+            if timeout is not None:
+                self._dedicated_executors[job.id] = self.__create_executor(1)
 
         config_as_string = _TomlSerializer()._serialize(Config._applied_config)
-        future = self._executor.submit(self._wrapped_function_with_config_load, config_as_string, job.id, job.task)
+        submit = partial(self.__submit, job.id)
+        if self._get_partitioning(job.task):
+            # A job with a timeout computes its partitions on its dedicated single worker.
+            acquire_worker = self.__acquire_worker if timeout is None else lambda: False
+            future = _PartitionedExecution(
+                submit, config_as_string, job.id, job.task, acquire_worker, partial(self._release_worker, None)
+            ).future
+        else:
+            future = submit(self._wrapped_function_with_config_load, config_as_string, job.id, job.task)
+
+        if timeout is not None:
+            with self._workers_lock:
+                self._deadlines[job.id] = monotonic() + timeout
 
         self._set_dispatched_processes(job.id, future)  # type: ignore
         future.add_done_callback(self._release_worker)
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
+    @classmethod
+    def _initialize_worker(cls, modules: List[str], job_pids_queue):
+        cls._job_pids_queue = job_pids_queue
+        cls._preload_modules(modules)
+
+    @staticmethod
+    def _preload_modules(modules: List[str]):
+        """Import the given modules when a worker starts, so the first job it executes does not pay for it."""
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except Exception as e:
+                _TaipyLogger._get_logger().warning(f"Module {module} could not be preloaded by the worker: {e}")
+
+    @classmethod
+    def _run_in_worker(cls, job_id: JobId, fct: Callable, *args):
+        """Report the process executing the job to the dispatcher, call the function, then report that it returned."""
+        if cls._job_pids_queue is not None:
+            cls._job_pids_queue.put((job_id, os.getpid()))
+        try:
+            return fct(*args)
+        finally:
+            if cls._job_pids_queue is not None:
+                cls._job_pids_queue.put((job_id, None))
+
+    def __submit(self, job_id: JobId, fct: Callable, *args) -> Future:
+        with self._workers_lock:
+            executor = self.__get_executor(job_id)
+        try:
+            future = executor.submit(self._run_in_worker, job_id, fct, *args)
+        except BrokenProcessPool:  # A worker of the pool died in the meantime.
+            self.__discard_broken_executor(executor)
+            with self._workers_lock:
+                executor = self.__get_executor(job_id)
+            future = executor.submit(self._run_in_worker, job_id, fct, *args)
+        with self._workers_lock:
+            self._running_jobs.setdefault(job_id, (executor, executor._processes))  # type: ignore
+        return future
+
+    def __get_executor(self, job_id: JobId) -> ProcessPoolExecutor:
+        """Return the executor dedicated to the job or already executing it, or the oldest executor with an idle worker."""
+        if executor := self._dedicated_executors.get(job_id):
+            return executor
+        if job_id in self._running_jobs and (executor := self._running_jobs[job_id][0]) in self._executors:
+            return executor  # The partitions of a job are computed by the same executor.
+        nb_of_jobs = self.__get_nb_of_jobs_by_executor()
+        for executor in self._executors:
+            if nb_of_jobs.get(executor, 0) < executor._max_workers:  # type: ignore
+                return executor
+        if self.__get_nb_of_processes() < self._max_nb_of_workers:
+            return self.__add_executor(1)
+        return min(self._executors, key=lambda e: nb_of_jobs.get(e, 0) / e._max_workers)  # type: ignore
+
+    def _can_execute(self) -> bool:
+        if self._deadlines:
+            self.__kill_timed_out_jobs()
+        self.__autoscale()
+        return super()._can_execute()
+
+    def _resize(self, max_nb_of_workers: int, min_nb_of_workers: Optional[int] = None):
+        """Change the maximum and minimum numbers of workers without interrupting the running jobs.
+
+        Parameters:
+            max_nb_of_workers (int): The new maximum number of jobs running in parallel.
+            min_nb_of_workers (Optional[int]): The new minimum number of worker processes kept alive. If None, the
+                pool of processes keeps a fixed size of *max_nb_of_workers*.
+        """
+        if max_nb_of_workers < 1:
+            raise ValueError("The maximum number of workers must be at least 1.")
+        with self._workers_lock:
+            self._nb_available_workers += max_nb_of_workers - self._max_nb_of_workers
+            self._max_nb_of_workers = max_nb_of_workers
+            if min_nb_of_workers is None:
+                self._min_nb_of_workers = max_nb_of_workers
+            else:
+                self._min_nb_of_workers = max(min(min_nb_of_workers, max_nb_of_workers), 0)
+        self.__autoscale()
+        _MetricsRegistry._set_gauge(_MetricsRegistry._AVAILABLE_WORKERS, self._nb_available_workers)
+
+    def __acquire_worker(self) -> bool:
+        with self._workers_lock:
+            if self._nb_available_workers <= 0:
+                return False
+            self._nb_available_workers -= 1
+            self._last_activity = monotonic()
+        _MetricsRegistry._set_gauge(_MetricsRegistry._AVAILABLE_WORKERS, self._nb_available_workers)
+        return True
+
     def _release_worker(self, _):
-        self._nb_available_workers += 1
+        with self._workers_lock:
+            self._nb_available_workers += 1
+            self._last_activity = monotonic()
+        _MetricsRegistry._set_gauge(_MetricsRegistry._AVAILABLE_WORKERS, self._nb_available_workers)
+
+    def __autoscale(self):
+        with self._workers_lock:
+            nb_of_processes = self.__get_nb_of_processes()
+            nb_running_jobs = self._max_nb_of_workers - self._nb_available_workers
+            nb_waiting_jobs = self.orchestrator.jobs_to_run.qsize()  # type: ignore
+            if nb_of_processes < self._min_nb_of_workers:
+                self.__add_executor(self._min_nb_of_workers - nb_of_processes)
+            elif nb_waiting_jobs and nb_running_jobs >= nb_of_processes and nb_of_processes < self._max_nb_of_workers:
+                self.__add_executor(min(nb_running_jobs + nb_waiting_jobs, self._max_nb_of_workers) - nb_of_processes)
+            elif not self.__shut_down_idle_executors(nb_of_processes):
+                return
+            self._last_activity = monotonic()
+
+    def __is_idle(self) -> bool:
+        idle_timeout = Config.job_config.worker_idle_timeout
+        idle_timeout = self._DEFAULT_WORKER_IDLE_TIMEOUT if idle_timeout is None else float(idle_timeout)
+        return monotonic() - self._last_activity >= idle_timeout
+
+    def __add_executor(self, size: int) -> ProcessPoolExecutor:
+        executor = self.__create_executor(size)
+        self._executors.append(executor)
+        return executor
+
+    def __create_executor(self, size: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            size,
+            mp_context=self._mp_context,
+            initializer=self._initialize_worker,
+            initargs=(Config.job_config.preload_modules or [], self.__job_pids_queue),
+        )
+
+    def __shut_down_idle_executors(self, nb_of_processes: int) -> bool:
+        """Shut down the executors without running jobs, newest first, that exceed the maximum number of workers, or
+        the minimum number of workers once the dispatcher is idle.
+
+        Returns:
+            True if an executor was shut down.
+        """
+        is_idle = nb_of_processes > self._min_nb_of_workers and self.__is_idle()
+        if nb_of_processes <= self._max_nb_of_workers and not is_idle:
+            return False
+        nb_of_jobs = self.__get_nb_of_jobs_by_executor()
+        shut_down = False
+        for executor in reversed(list(self._executors)):
+            size = executor._max_workers  # type: ignore
+            if nb_of_jobs.get(executor):
+                continue
+            if nb_of_processes > self._max_nb_of_workers or (
+                is_idle and nb_of_processes - size >= self._min_nb_of_workers
+            ):
+                self._executors.remove(executor)
+                executor.shutdown(wait=False)
+                nb_of_processes -= size
+                shut_down = True
+        return shut_down
+
+    def __get_nb_of_processes(self) -> int:
+        return sum(executor._max_workers for executor in self._executors)  # type: ignore
+
+    def __get_nb_of_jobs_by_executor(self) -> Dict[ProcessPoolExecutor, int]:
+        nb_of_jobs: Dict[ProcessPoolExecutor, int] = {}
+        for executor, _ in self._running_jobs.values():
+            nb_of_jobs[executor] = nb_of_jobs.get(executor, 0) + 1
+        return nb_of_jobs
 
     def _update_job_status_from_future(self, job: Job, ft):
         self._pop_dispatched_process(job.id)  # type: ignore
-        self._update_job_status(job, ft.result())
+        with self._workers_lock:
+            executor, processes = self._running_jobs.pop(job.id, (None, {}))
+            self._deadlines.pop(job.id, None)
+            is_timed_out = job.id in self._timed_out_jobs
+            self._timed_out_jobs.discard(job.id)
+            if dedicated_executor := self._dedicated_executors.pop(job.id, None):
+                dedicated_executor.shutdown(wait=False)
+        pid, has_returned = self.__pop_job_execution(job.id)
+        try:
+            exceptions, metadata = ft.result()
+        except BrokenProcessPool as e:
+            if executor is not None:
+                self.__discard_broken_executor(executor)
+            if is_timed_out:
+                exceptions, metadata = [JobExecutionTimeout(f"Job {job.id} exceeded its timeout.")], None
+            elif pid is not None and pid in processes and self.__has_terminated(processes[pid]):
+                self.__logger.error(f"The worker process executing job {job.id} terminated abruptly.")
+                exceptions, metadata = [e], None
+            elif has_returned:
+                self.__logger.error(f"The result of job {job.id} was lost when another worker process crashed.")
+                exceptions, metadata = [e], None
+            elif self._nb_of_requeues.get(job.id, 0) >= self._MAX_NB_OF_REQUEUES:
+                self.__logger.error(f"Job {job.id} was interrupted by worker process crashes too many times.")
+                exceptions, metadata = [e], None
+            else:  # The job was running or waiting on another process of the broken pool.
+                self.__requeue(job)
+                return
+        self._nb_of_requeues.pop(job.id, None)
+        self._update_job_status(job, exceptions, metadata)
+
+    @classmethod
+    def __get_mp_context(cls):
+        context = multiprocessing.get_context(Config.job_config.start_method)
+        if context.get_start_method() == "forkserver":
+            # Only effective before the server process is started, by the first executor using this start method.
+            context.set_forkserver_preload([cls.__module__, *(Config.job_config.preload_modules or [])])
+        return context
+
+    def __kill_timed_out_jobs(self):
+        now = monotonic()
+        with self._workers_lock:
+            timed_out_jobs = [job_id for job_id, deadline in self._deadlines.items() if deadline <= now]
+        for job_id in timed_out_jobs:
+            with self._workers_lock:
+                if job_id not in self._running_jobs:
+                    continue  # The job is already completed.
+                processes = list(self._running_jobs[job_id][1].values())  # The process of its dedicated executor.
+                del self._deadlines[job_id]
+                self._timed_out_jobs.add(job_id)
+            self.__logger.warning(f"Job {job_id} exceeded its timeout. Its worker process is killed.")
+            for process in processes:
+                process.kill()
+
+    @classmethod
+    def __has_terminated(cls, process) -> bool:
+        # The pool is broken as soon as the process closes its pipes, possibly before its exit code is available.
+        process.join(cls._CRASHED_PROCESS_EXIT_TIMEOUT)
+        return process.exitcode is not None
+
+    def __discard_broken_executor(self, executor: ProcessPoolExecutor):
+        with self._workers_lock:
+            if executor in self._executors:
+                self.__logger.warning("A worker process terminated abruptly. Its pool of processes is discarded.")
+                self._executors.remove(executor)
+                executor.shutdown(wait=False)
+
+    def __requeue(self, job: Job):
+        self._nb_of_requeues[job.id] = self._nb_of_requeues.get(job.id, 0) + 1
+        self._update_nb_running_jobs(job, -1)
+        with self.lock:
+            job.pending()
+            self.orchestrator.jobs_to_run.put(job)  # type: ignore
+
+    def __pop_job_execution(self, job_id: JobId) -> Tuple[Optional[int], bool]:
+        """Return the process that last executed a function of the job, and whether all its functions returned."""
+        with self._job_pids_lock:
+            self.__read_job_pids()
+            has_returned = job_id in self._returned_jobs and not self._nb_of_running_calls.get(job_id)
+            self._returned_jobs.discard(job_id)
+            self._nb_of_running_calls.pop(job_id, None)
+            return self._job_pids.pop(job_id, None), has_returned
+
+    def __read_job_pids(self):
+        while not self.__job_pids_queue.empty():
+            job_id, pid = self.__job_pids_queue.get()
+            if pid is None:  # A function of the job returned.
+                self._nb_of_running_calls[job_id] = self._nb_of_running_calls.get(job_id, 0) - 1
+                self._returned_jobs.add(job_id)
+            else:
+                self._job_pids[job_id] = pid
+                self._nb_of_running_calls[job_id] = self._nb_of_running_calls.get(job_id, 0) + 1
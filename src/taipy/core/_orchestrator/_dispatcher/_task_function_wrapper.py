@@ -9,61 +9,482 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+import inspect
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import modin.pandas as modin_pd
+import pandas as pd
 
 from taipy.config._serializer._toml_serializer import _TomlSerializer
 from taipy.config.config import Config
 
+from ..._entity._reload import _Reloader
+from ...config.task_config import TaskConfig
 from ...data._data_manager_factory import _DataManagerFactory
 from ...data.data_node import DataNode
+from ...data.parquet import ParquetDataNode
 from ...exceptions import DataNodeWritingError
+from ...exceptions.exceptions import PartitioningNotSupported
+from ...job._job_manager_factory import _JobManagerFactory
+from ...job.job import Job
 from ...job.job_id import JobId
 from ...task.task import Task
+from .._stream_channel import _StreamChannel
+from ._batch_writer import _BatchWriter
+from ._execution_metrics import _ExecutionMetrics
+from ._worker_read_cache import _WorkerReadCache
 
 
 class _TaskFunctionWrapper:
+    _io_executor: Optional[ThreadPoolExecutor] = None
+    _io_executor_pid: Optional[int] = None
+    _read_cache: Optional[_WorkerReadCache] = None
+    _loaded_config: Optional[str] = None
+
+    _NB_OF_PARTITIONS_KEY = "nb_of_partitions"
+    _CHANGED_PARTITIONS_KEY = "changed_partitions"
+
     @classmethod
     def _wrapped_function_with_config_load(cls, config_as_string, job_id: JobId, task: Task):
-        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-        Config.block_update()
-        return cls._wrapped_function(job_id, task)
+        cls._load_config(config_as_string)
+        return cls._wrapped_function(job_id, task, cls.__get_read_cache())
+
+    @classmethod
+    def _load_config(cls, config_as_string):
+        # A warm worker executing consecutive jobs of the same application does not need to reload the config.
+        if config_as_string != cls._loaded_config:
+            Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+            Config.block_update()
+            cls._loaded_config = config_as_string
+
+    @staticmethod
+    def _get_partitioning(task: Task) -> Optional[Tuple[str, int]]:
+        """Return how the first input of the task is partitioned, or None if the task is not partitioned."""
+        task_config = Config.tasks.get(task.config_id)
+        if task_config is None or not task_config.partition_by:
+            return None
+        return task_config.partition_by, int(task_config.partition_size or TaskConfig._DEFAULT_PARTITION_SIZE)
+
+    @staticmethod
+    def _is_streaming(task: Task) -> bool:
+        """Return True if the first input of the task is passed to its function as an iterator of batches."""
+        task_config = Config.tasks.get(task.config_id)
+        if task_config is None or not task_config.streaming or task_config.partition_by:
+            return False
+        return len(task.input) > 0
+
+    @classmethod
+    def _get_partitions_with_config_load(cls, config_as_string, task: Task) -> List[Any]:
+        cls._load_config(config_as_string)
+        return cls.__get_partitions(task)
+
+    @classmethod
+    def _compute_partition_with_config_load(
+        cls, config_as_string, task: Task, partition: Any, result_path: str
+    ) -> Tuple[List[Exception], Optional[str]]:
+        """Call the task function on a partition of its first input, and spill its result to a file.
+
+        Returns:
+            The list of exceptions raised during the computation and the path of the file holding the result.
+        """
+        cls._load_config(config_as_string)
+        try:
+            inputs: List[DataNode] = list(task.input.values())
+            data = cls.__read_inputs(inputs[1:], cls.__get_read_cache(), {}, _ExecutionMetrics())
+            partitioned_input = _DataManagerFactory._build_manager()._get(inputs[0].id)
+            result = task.function(partitioned_input._read_partition(partition), *data)
+            with open(result_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return [], result_path
+        except Exception as e:
+            return [e], None
+
+    @classmethod
+    def _reduce_partitions_with_config_load(
+        cls, config_as_string, job_id: JobId, task: Task, result_paths: List[str]
+    ) -> Tuple[List[Exception], Dict[str, Any]]:
+        """Reduce the results spilled by the partitions and write them in the outputs of the task."""
+        cls._load_config(config_as_string)
+        metadata: Dict[str, Any] = {cls._NB_OF_PARTITIONS_KEY: len(result_paths)}
+        metrics = _ExecutionMetrics()
+        try:
+            outputs: List[DataNode] = list(task.output.values())
+            with metrics._phase(_ExecutionMetrics._WRITE):
+                results = [cls.__load_partition_result(path) for path in result_paths]
+                return cls.__write_partition_results(task, outputs, results, job_id, metrics, metadata), metadata
+        except Exception as e:
+            return [e], metadata
+        finally:
+            metadata[Job._EXECUTION_METRICS_KEY] = metrics._to_dict()
+
+    @staticmethod
+    def __load_partition_result(path: str) -> Any:
+        with open(path, "rb") as f:
+            return pickle.load(f)
 
     @classmethod
-    def _wrapped_function(cls, job_id: JobId, task: Task):
+    def _wrapped_function(
+        cls, job_id: JobId, task: Task, read_cache: Optional[_WorkerReadCache] = None
+    ) -> Tuple[List[Exception], Dict[str, Any]]:
+        """Execute the task function.
+
+        Returns:
+            The list of exceptions raised during the execution and the metadata to report on the job.
+        """
+        metadata: Dict[str, Any] = {}
+        metrics = _ExecutionMetrics()
         try:
             inputs: List[DataNode] = list(task.input.values())
             outputs: List[DataNode] = list(task.output.values())
 
             fct = task.function
 
-            results = fct(*cls.__read_inputs(inputs))
-            return cls.__write_data(outputs, results, job_id)
+            if cls._get_partitioning(task):
+                with metrics._phase(_ExecutionMetrics._READ):
+                    data = cls.__read_inputs(inputs[1:], read_cache, metadata, metrics)
+                with metrics._phase(_ExecutionMetrics._COMPUTE):
+                    partitioned_input = _DataManagerFactory._build_manager()._get(inputs[0].id)
+                    partitions = cls.__get_partitions(task)
+                    partial_results = [fct(partitioned_input._read_partition(p), *data) for p in partitions]
+                    metadata[cls._NB_OF_PARTITIONS_KEY] = len(partitions)
+                with metrics._phase(_ExecutionMetrics._WRITE):
+                    exceptions = cls.__write_partition_results(
+                        task, outputs, partial_results, job_id, metrics, metadata
+                    )
+                    return exceptions, metadata
+            elif cls._is_streaming(task):
+                with metrics._phase(_ExecutionMetrics._READ):
+                    data = [cls.__stream(job_id, task, inputs[0])]
+                    data.extend(cls.__read_inputs(inputs[1:], read_cache, metadata, metrics))
+                with metrics._phase(_ExecutionMetrics._COMPUTE):
+                    results = fct(*data)
+            else:
+                with metrics._phase(_ExecutionMetrics._READ):
+                    data = cls.__read_inputs(inputs, read_cache, metadata, metrics)
+                with metrics._phase(_ExecutionMetrics._COMPUTE):
+                    results = fct(*data)
+            with metrics._phase(_ExecutionMetrics._WRITE):
+                if inspect.isgenerator(results):
+                    # The batches are computed while they are written, so the whole stream is measured as a write.
+                    return cls.__write_stream(outputs, results, job_id), metadata
+                return cls.__write_data(outputs, results, job_id, metrics), metadata
         except Exception as e:
-            return [e]
+            return [e], metadata
+        finally:
+            metadata[Job._EXECUTION_METRICS_KEY] = metrics._to_dict()
 
     @classmethod
-    def __read_inputs(cls, inputs: List[DataNode]) -> List[Any]:
+    def __read_inputs(
+        cls,
+        inputs: List[DataNode],
+        read_cache: Optional[_WorkerReadCache],
+        metadata: Dict[str, Any],
+        metrics: _ExecutionMetrics,
+    ) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        if read_cache is None:
+            read = metrics._measure_read(lambda data_node: data_node.read_or_raise())
+        else:
+            read = metrics._measure_read(read_cache._read)
+            hits, misses = read_cache.hits, read_cache.misses
+
+        if cls.__get_nb_of_io_threads(len(inputs)) <= 1:
+            data = [read(data_manager._get(dn.id)) for dn in inputs]
+        else:
+            data = cls.__concurrent_map(read, [data_manager._get(dn.id) for dn in inputs])
+
+        if read_cache is not None:
+            metadata["read_cache"] = {
+                **read_cache._stats(),
+                "hits": read_cache.hits - hits,
+                "misses": read_cache.misses - misses,
+                "pid": os.getpid(),
+            }
+        return data
+
+    @classmethod
+    def __stream(cls, job_id: JobId, task: Task, data_node: DataNode) -> Iterator[Any]:
+        """Return the iterator of the batches of the first input of a streaming task.
+
+        The batches are read from the channel of the generator job producing the input in the same submission, or
+        from the data node itself in chunks, if it was already written.
+        """
+        job_manager = _JobManagerFactory._build_manager()
+        job = job_manager._get(job_id)
+        if job and (producer_id := job.metadata.get(Job._STREAMED_FROM_KEY)):
+            producer = job_manager._get(producer_id)
+            if producer and not producer.is_skipped():
+                channel = _StreamChannel(job.submit_id, producer_id, data_node.id)
+                return channel._read(lambda: job_manager._get(producer_id)._is_finished())
+
+        data_node = _DataManagerFactory._build_manager()._get(data_node.id)
+        if not hasattr(data_node, "_get_partitions"):
+            return iter([data_node.read_or_raise()])
+        chunk_size = int(Config.tasks[task.config_id].partition_size or TaskConfig._DEFAULT_PARTITION_SIZE)
+        chunks = data_node._get_partitions(TaskConfig._PARTITION_BY_CHUNKS, chunk_size)
+        return (data_node._read_partition(chunk) for chunk in chunks)
 
     @classmethod
-    def __write_data(cls, outputs: List[DataNode], results, job_id: JobId):
+    def __write_stream(cls, outputs: List[DataNode], batches: Iterator[Any], job_id: JobId) -> List[Exception]:
+        """Write the batches yielded by a generator function in the outputs while they are produced.
+
+        Each batch is spilled to the channel of each output, read by the streaming tasks consuming it, and written
+        incrementally in the output data node. The entities are not reloaded from the repository in the meantime
+        since it is not thread-safe.
+        """
         data_manager = _DataManagerFactory._build_manager()
+        job = _JobManagerFactory._build_manager()._get(job_id)
+        data_nodes = [data_manager._get(dn.id) for dn in outputs]
+        channels = [_StreamChannel(job.submit_id, job_id, dn.id) for dn in data_nodes] if job else []
+        error = None
+        with _Reloader():
+            writers = [_BatchWriter(data_node) for data_node in data_nodes]
+            try:
+                for channel in channels:
+                    channel._open()
+                for batch in batches:
+                    parts = cls.__extract_results(outputs, batch) if outputs else []
+                    for channel, part in zip(channels, parts):
+                        channel._put(part)
+                    for writer, part in zip(writers, parts):
+                        writer.put(part)
+            except Exception as e:
+                error = e
+            finally:
+                for writer in writers:
+                    writer.close()
+                for channel in channels:
+                    channel._close(error)
+        if error:
+            return [error]
+
+        exceptions = []
+        for writer in writers:
+            data_node = writer.data_node
+            if writer.error:
+                exceptions.append(DataNodeWritingError(f"Error writing in datanode id {data_node.id}: {writer.error}"))
+                continue
+            try:
+                data_node._track_edit(job_id=job_id)
+                data_node.unlock_edit()
+                data_manager._set(data_node)
+            except Exception as e:
+                exceptions.append(DataNodeWritingError(f"Error writing in datanode id {data_node.id}: {e}"))
+        return exceptions
+
+    @classmethod
+    def __write_data(
+        cls,
+        outputs: List[DataNode],
+        results,
+        job_id: JobId,
+        metrics: _ExecutionMetrics,
+        edit: Optional[Dict[str, Any]] = None,
+    ):
         try:
             if outputs:
                 _results = cls.__extract_results(outputs, results)
-                exceptions = []
-                for res, dn in zip(_results, outputs):
-                    try:
-                        data_node = data_manager._get(dn.id)
-                        data_node.write(res, job_id=job_id)
-                        data_manager._set(data_node)
-                    except Exception as e:
-                        exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
-                return exceptions
+                if cls.__get_nb_of_io_threads(len(outputs)) <= 1:
+                    return cls.__write_data_sequentially(outputs, _results, job_id, metrics, edit or {})
+                return cls.__write_data_concurrently(outputs, _results, job_id, metrics, edit or {})
         except Exception as e:
             return [e]
 
+    @classmethod
+    def __write_data_sequentially(
+        cls,
+        outputs: List[DataNode],
+        results: List[Any],
+        job_id: JobId,
+        metrics: _ExecutionMetrics,
+        edit: Dict[str, Any],
+    ):
+        data_manager = _DataManagerFactory._build_manager()
+        write = metrics._measure_write(lambda data_node, res: data_node.write(res, job_id=job_id, **edit))
+        exceptions = []
+        for res, dn in zip(results, outputs):
+            try:
+                data_node = data_manager._get(dn.id)
+                write(data_node, res)
+                data_manager._set(data_node)
+            except Exception as e:
+                exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
+        return exceptions
+
+    @classmethod
+    def __write_data_concurrently(
+        cls,
+        outputs: List[DataNode],
+        results: List[Any],
+        job_id: JobId,
+        metrics: _ExecutionMetrics,
+        edit: Dict[str, Any],
+    ):
+        """Write the data concurrently, then save the data nodes sequentially."""
+        data_manager = _DataManagerFactory._build_manager()
+        data_nodes = [data_manager._get(dn.id) for dn in outputs]
+        write = metrics._measure_write(lambda data_node, res: data_node.write(res, job_id=job_id, **edit))
+
+        def _write(data_node_and_result):
+            data_node, res = data_node_and_result
+            try:
+                write(data_node, res)
+            except Exception as e:
+                return DataNodeWritingError(f"Error writing in datanode id {data_node.id}: {e}")
+            return None
+
+        errors = cls.__concurrent_map(_write, list(zip(data_nodes, results)))
+
+        exceptions = []
+        for data_node, error in zip(data_nodes, errors):
+            if error:
+                exceptions.append(error)
+                continue
+            try:
+                data_manager._set(data_node)
+            except Exception as e:
+                exceptions.append(DataNodeWritingError(f"Error writing in datanode id {data_node.id}: {e}"))
+        return exceptions
+
+    @classmethod
+    def __concurrent_map(cls, fct: Callable, items: List) -> List:
+        """Apply `fct` to every item on the I/O thread pool, preserving the order of the items.
+
+        The entities are not reloaded from the repository by the I/O threads since it is not thread-safe.
+        """
+
+        def _apply(item):
+            with _Reloader():
+                return fct(item)
+
+        return list(cls.__get_io_executor().map(_apply, items))
+
+    @staticmethod
+    def __get_nb_of_io_threads(nb_of_data_nodes: int) -> int:
+        return min(int(Config.job_config.max_nb_of_io_threads or 1), nb_of_data_nodes)
+
+    @classmethod
+    def __get_io_executor(cls) -> ThreadPoolExecutor:
+        max_nb_of_io_threads = int(Config.job_config.max_nb_of_io_threads or 1)
+        # The executor threads do not survive a fork, so each worker process builds its own executor.
+        if (
+            cls._io_executor is None
+            or cls._io_executor_pid != os.getpid()
+            or cls._io_executor._max_workers != max_nb_of_io_threads
+        ):
+            cls._io_executor = ThreadPoolExecutor(max_nb_of_io_threads, thread_name_prefix="Thread-Taipy-IO")
+            cls._io_executor_pid = os.getpid()
+        return cls._io_executor
+
+    @classmethod
+    def __get_read_cache(cls) -> Optional[_WorkerReadCache]:
+        budget = Config.job_config.read_cache_budget
+        if not budget or Config.job_config.is_development:
+            cls._read_cache = None
+        elif cls._read_cache is None or cls._read_cache._budget != int(budget):
+            cls._read_cache = _WorkerReadCache(int(budget))
+        return cls._read_cache
+
+    @classmethod
+    def __get_partitions(cls, task: Task) -> List[Any]:
+        partition_by, partition_size = cls._get_partitioning(task)  # type: ignore
+        inputs = list(task.input.values())
+        if not inputs or not hasattr(inputs[0], "_get_partitions"):
+            raise PartitioningNotSupported(
+                f"The first input of task {task.config_id} must be a CSV or a Parquet data node to be partitioned."
+            )
+        partitioned_input = _DataManagerFactory._build_manager()._get(inputs[0].id)
+        partitions = partitioned_input._get_partitions(partition_by, partition_size)
+        if (changed_partitions := cls.__get_changed_partitions(task)) is not None:
+            partitions = [partition for partition in partitions if str(partition["value"]) in changed_partitions]
+        return partitions
+
+    @staticmethod
+    def __get_changed_partitions(task: Task) -> Optional[Set[str]]:
+        """Return the keys of the partitions of the first input changed since the last execution of an incremental
+        task, or None if all the partitions must be computed."""
+        task_config = Config.tasks.get(task.config_id)
+        if (
+            not task_config
+            or not task_config.incremental
+            or task_config.partition_by == TaskConfig._PARTITION_BY_CHUNKS
+        ):
+            return None
+        data_manager = _DataManagerFactory._build_manager()
+        inputs = [data_manager._get(dn.id) for dn in task.input.values()]
+        outputs = [data_manager._get(dn.id) for dn in task.output.values()]
+        if not outputs or not all(dn.last_edit_date for dn in outputs):
+            return None
+        last_execution_date = min(dn.last_edit_date for dn in outputs)
+        if any(dn.last_edit_date and dn.last_edit_date > last_execution_date for dn in inputs[1:]):
+            return None
+        changed_partitions: Set[str] = set()
+        for edit in inputs[0].edits:
+            if edit.get("timestamp") and edit["timestamp"] > last_execution_date:
+                if (partitions := edit.get(DataNode._EDIT_PARTITIONS_KEY)) is None:
+                    return None
+                changed_partitions.update(str(partition) for partition in partitions)
+        # Without any recorded change, the task is executed again on purpose: everything is recomputed.
+        return changed_partitions or None
+
+    @classmethod
+    def __write_partition_results(
+        cls,
+        task: Task,
+        outputs: List[DataNode],
+        results: List[Any],
+        job_id: JobId,
+        metrics: _ExecutionMetrics,
+        metadata: Dict[str, Any],
+    ) -> List[Exception]:
+        """Reduce the results of the partitions and write them, replacing only the changed partitions of the
+        outputs of an incremental task.
+
+        The changed partitions of a Parquet dataset partitioned by the same column are replaced in place. The
+        other outputs are read, and written back with their changed partitions replaced.
+        """
+        changed_partitions = cls.__get_changed_partitions(task)
+        if changed_partitions is None:
+            return cls.__write_data(outputs, cls.__reduce(task, len(outputs), results), job_id, metrics)
+
+        column = Config.tasks[task.config_id].partition_by
+        reduced = cls.__reduce(task, len(outputs), results) if results else [None] * len(outputs)
+        data_manager = _DataManagerFactory._build_manager()
+        merged = []
+        for dn, new_data in zip(outputs, cls.__extract_results(outputs, reduced)):
+            data_node = data_manager._get(dn.id)
+            if isinstance(data_node, ParquetDataNode) and data_node._can_replace_partitions(column):
+                new_data = pd.DataFrame({column: []}) if new_data is None else new_data
+                cls.__check_partitioned_output(task, column, new_data)
+                # The partitions left without rows are not replaced by the write.
+                data_node._delete_partitions(column, changed_partitions - set(new_data[column].astype(str)))
+                merged.append(new_data)
+                continue
+            data = data_node.read_or_raise()
+            cls.__check_partitioned_output(task, column, data)
+            data = data[~data[column].astype(str).isin(changed_partitions)]
+            merged.append(data if new_data is None else DataNode._concatenate([data, new_data]))
+        metadata[cls._CHANGED_PARTITIONS_KEY] = sorted(changed_partitions)
+        edit = {DataNode._EDIT_PARTITIONS_KEY: sorted(changed_partitions)}
+        return cls.__write_data(outputs, merged[0] if len(outputs) == 1 else merged, job_id, metrics, edit)
+
+    @staticmethod
+    def __check_partitioned_output(task: Task, column: str, data: Any):
+        if not isinstance(data, (pd.DataFrame, modin_pd.DataFrame)) or column not in data.columns:
+            raise PartitioningNotSupported(
+                f"The outputs of the incremental task {task.config_id} must be dataframes with a {column} column."
+            )
+
+    @classmethod
+    def __reduce(cls, task: Task, nb_of_outputs: int, results: List[Any]) -> Any:
+        reducer = Config.tasks[task.config_id].reducer or DataNode._concatenate
+        if nb_of_outputs <= 1:
+            return reducer(results)
+        return [reducer([result[i] for result in results]) for i in range(nb_of_outputs)]
+
     @classmethod
     def __extract_results(cls, outputs: List[DataNode], results: Any) -> List[Any]:
         _results: List[Any] = [results] if len(outputs) == 1 else results
@@ -0,0 +1,122 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import itertools
+import os
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from ...data._abstract_file import _AbstractFileDataNode
+from ...data.data_node import DataNode
+
+
+class _WorkerReadCache:
+    """Least recently used cache of the data read by a worker process.
+
+    The data is keyed by the data node id and a fingerprint of its storage: the last edit date and, for file-based
+    data nodes, the modification time and the size of the file. A new edit of the data node changes the fingerprint,
+    so stale entries are never served and end up evicted.
+
+    Only file-based data nodes are cached since the content of the other storages (databases, generic functions)
+    can change without being tracked by Taipy. The cached objects are shared by the consecutive jobs of the worker,
+    so the task functions must not modify their inputs in place.
+    """
+
+    def __init__(self, budget: int):
+        self._budget = budget
+        self._size = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _read(self, data_node: DataNode) -> Any:
+        """Return the data of `data_node` from the cache, or read it and cache it if the budget allows."""
+        key = self.__key(data_node)
+        if key is None:
+            return data_node.read_or_raise()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        data = data_node.read_or_raise()
+        size = self.__estimate_size(data)
+        if size is not None and size <= self._budget:
+            self.__put(key, data, size)
+        return data
+
+    def _stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self._size,
+            "budget": self._budget,
+        }
+
+    def __put(self, key: Hashable, data: Any, size: int):
+        with self._lock:
+            data_node_id = key[0]  # type: ignore
+            for stale_key in [k for k in self._entries if k[0] == data_node_id]:  # type: ignore
+                self._size -= self._entries.pop(stale_key)[1]
+                self.evictions += 1
+            while self._entries and self._size + size > self._budget:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+            self._entries[key] = (data, size)
+            self._size += size
+
+    @staticmethod
+    def __key(data_node: DataNode) -> Optional[Hashable]:
+        if not isinstance(data_node, _AbstractFileDataNode) or not data_node.last_edit_date:
+            return None
+        try:
+            stat = os.stat(data_node.path)  # type: ignore
+        except OSError:
+            return None
+        return data_node.id, data_node.last_edit_date.isoformat(), stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def __estimate_size(cls, data: Any) -> Optional[int]:
+        """Estimate the memory used by `data`, or return None if it is unknown and the data must not be cached."""
+        if hasattr(data, "nbytes") and isinstance(data.nbytes, int):  # NumPy arrays, Arrow tables
+            return data.nbytes
+        if hasattr(data, "memory_usage"):  # Pandas and Modin dataframes and series
+            try:
+                usage = data.memory_usage(deep=True)
+                return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+            except Exception:
+                return None
+        if data is None or isinstance(data, (bool, int, float, complex, str, bytes, bytearray)):
+            return sys.getsizeof(data)
+        if isinstance(data, dict):
+            return cls.__estimate_container_size(data, itertools.chain.from_iterable(data.items()))
+        if isinstance(data, (list, tuple, set, frozenset)):
+            return cls.__estimate_container_size(data, data)
+        return None
+
+    @classmethod
+    def __estimate_container_size(cls, container: Any, items: Iterable[Any]) -> Optional[int]:
+        size = sys.getsizeof(container)
+        for item in items:
+            item_size = cls.__estimate_size(item)
+            if item_size is None:
+                return None
+            size += item_size
+        return size
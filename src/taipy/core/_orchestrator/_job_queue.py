@@ -0,0 +1,165 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import heapq
+import itertools
+from queue import Empty
+from threading import Condition
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..job.job import Job
+from ..job.job_id import JobId
+
+
+class _JobQueue:
+    """Priority queue of the jobs to run, sharing the workers fairly between submissions.
+
+    Jobs with a higher priority are always dequeued first. Among jobs of the same priority, each submission gets
+    its turn: the n-th job of a submission is ranked n rounds after the first one, and a new submission starts at
+    the current round. A large batch submission therefore cannot starve the submissions that come after it.
+
+    The queue exposes the subset of the `queue.Queue` interface used by the orchestrator and the dispatchers, plus
+    the removal of a job by id. Removed jobs are only marked as such and dropped when they reach the top of the heap,
+    so a removal costs O(1) and each pop O(log n).
+
+    When a predicate excludes the jobs that cannot run yet, the queue remembers that the jobs it holds are blocked.
+    The following calls with the same predicate only check the jobs put since then, until `_notify_change()` tells
+    the queue that the blocked jobs may be able to run, for instance when a running job completes.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, int, Job]] = []
+        self._entries: Dict[JobId, Tuple[int, int, int, Job]] = {}
+        self._next_rank_by_submission: Dict[str, int] = {}
+        self._nb_jobs_by_submission: Dict[str, int] = {}
+        self._current_rank = 0
+        self._counter = itertools.count()
+        self._not_empty = Condition()
+        self._blocked_by: Optional[Callable[[Job], bool]] = None
+        self._unchecked: List[Tuple[int, int, int, Job]] = []
+
+    def put(self, job: Job, block: bool = True, timeout: Optional[float] = None):
+        with self._not_empty:
+            if job.id in self._entries:
+                return
+            submit_id = job.submit_id
+            rank = max(self._next_rank_by_submission.get(submit_id, 0), self._current_rank)
+            self._next_rank_by_submission[submit_id] = rank + 1
+            self._nb_jobs_by_submission[submit_id] = self._nb_jobs_by_submission.get(submit_id, 0) + 1
+            entry = (-job._priority, rank, next(self._counter), job)
+            self._entries[job.id] = entry
+            heapq.heappush(self._heap, entry)
+            if self._blocked_by is not None:
+                self._unchecked.append(entry)
+            self._not_empty.notify()
+
+    def _notify_change(self):
+        """Notify the queue that the jobs excluded by the predicate of `get()` may be able to run now."""
+        with self._not_empty:
+            self._blocked_by = None
+            self._unchecked = []
+            self._not_empty.notify_all()
+
+    def get(
+        self, block: bool = True, timeout: Optional[float] = None, can_run: Optional[Callable[[Job], bool]] = None
+    ) -> Job:
+        """Remove and return the job to run next.
+
+        Parameters:
+            block (bool): Wait for a job to be available.
+            timeout (Optional[float]): The maximum number of seconds to wait for a job when *block* is True.
+            can_run (Optional[Callable[[Job], bool]]): An optional predicate excluding the jobs that cannot run yet.
+                Excluded jobs remain in the queue.
+        Raises:
+            queue.Empty: If no job is available.
+        """
+        with self._not_empty:
+            deadline = None if timeout is None else monotonic() + timeout
+            while True:
+                if job := self.__pop(can_run):
+                    return job
+                if not block:
+                    raise Empty
+                if deadline is None:
+                    self._not_empty.wait()
+                else:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+
+    def remove(self, job_id: JobId) -> bool:
+        """Remove the job with the given id from the queue.
+
+        Returns:
+            True if the job was in the queue.
+        """
+        with self._not_empty:
+            entry = self._entries.pop(job_id, None)
+            if entry is None:
+                return False
+            self.__release_submission(entry[3].submit_id)
+            while self._heap and self._entries.get(self._heap[0][3].id) is not self._heap[0]:
+                heapq.heappop(self._heap)
+            return True
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def __contains__(self, job: Job) -> bool:
+        return job.id in self._entries
+
+    def __pop(self, can_run: Optional[Callable[[Job], bool]]) -> Optional[Job]:
+        if can_run is not None and self._blocked_by is not None and self._blocked_by == can_run:
+            return self.__pop_unchecked(can_run)
+        skipped = []
+        job = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[3].id) is not entry:
+                continue  # The job was removed.
+            if can_run is None or can_run(entry[3]):
+                del self._entries[entry[3].id]
+                self.__release_submission(entry[3].submit_id)
+                self._current_rank = max(self._current_rank, entry[1])
+                job = entry[3]
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        if can_run is not None:
+            # All the jobs are blocked, or the ones after the dequeued job have not been checked.
+            self._blocked_by = can_run if job is None else None
+            self._unchecked = []
+        return job
+
+    def __pop_unchecked(self, can_run: Callable[[Job], bool]) -> Optional[Job]:
+        """Dequeue the first job that can run among the jobs put since all the other jobs were found blocked."""
+        unchecked = sorted(entry for entry in self._unchecked if self._entries.get(entry[3].id) is entry)
+        for i, entry in enumerate(unchecked):
+            if can_run(entry[3]):
+                self._unchecked = unchecked[i + 1 :]
+                del self._entries[entry[3].id]  # The entry is dropped from the heap when it reaches the top.
+                self.__release_submission(entry[3].submit_id)
+                self._current_rank = max(self._current_rank, entry[1])
+                return entry[3]
+        self._unchecked = []
+        return None
+
+    def __release_submission(self, submit_id: str):
+        self._nb_jobs_by_submission[submit_id] -= 1
+        if not self._nb_jobs_by_submission[submit_id]:
+            del self._nb_jobs_by_submission[submit_id]
+            del self._next_rank_by_submission[submit_id]
@@ -0,0 +1,176 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from taipy.logger._taipy_logger import _TaipyLogger
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+class _MetricsRegistry:
+    """In-process registry of the orchestration metrics: counters, gauges, and histograms.
+
+    Metrics are identified by their name and optional labels. They can be read as a dictionary or exported in the
+    Prometheus text exposition format through a local HTTP endpoint.
+    """
+
+    _PREFIX = "taipy_"
+    _JOBS_SUBMITTED = "jobs_submitted_total"
+    _JOBS_DISPATCHED = "jobs_dispatched_total"
+    _JOBS_FINISHED = "jobs_finished_total"
+    _JOBS_TO_RUN = "jobs_to_run"
+    _BLOCKED_JOBS = "blocked_jobs"
+    _AVAILABLE_WORKERS = "available_workers"
+    _JOB_PENDING_SECONDS = "job_pending_seconds"
+    _JOB_RUNNING_SECONDS = "job_running_seconds"
+    _DESCRIPTIONS = {
+        _JOBS_SUBMITTED: "Number of jobs submitted to the orchestrator.",
+        _JOBS_DISPATCHED: "Number of jobs dispatched to a worker.",
+        _JOBS_FINISHED: "Number of finished jobs by status.",
+        _JOBS_TO_RUN: "Number of jobs waiting for an available worker.",
+        _BLOCKED_JOBS: "Number of jobs waiting for their inputs to be ready.",
+        _AVAILABLE_WORKERS: "Number of available workers.",
+        _JOB_PENDING_SECONDS: "Time spent by the jobs waiting for a worker.",
+        _JOB_RUNNING_SECONDS: "Time spent by the jobs running on a worker.",
+    }
+    _LATENCY_BUCKETS: List[float] = [0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600]
+
+    _counters: Dict[Tuple[str, _Labels], float] = {}
+    _gauges: Dict[Tuple[str, _Labels], float] = {}
+    _histograms: Dict[Tuple[str, _Labels], List[float]] = {}
+    _server: Optional[ThreadingHTTPServer] = None
+    __lock = threading.Lock()
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _increment(cls, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None):
+        key = cls.__key(name, labels)
+        with cls.__lock:
+            cls._counters[key] = cls._counters.get(key, 0) + value
+
+    @classmethod
+    def _set_gauge(cls, name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        key = cls.__key(name, labels)
+        with cls.__lock:
+            cls._gauges[key] = value
+
+    @classmethod
+    def _observe(cls, name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        """Record a latency in seconds in a histogram."""
+        key = cls.__key(name, labels)
+        with cls.__lock:
+            # One count per bucket, followed by the count of values above the last bucket, the sum and the count.
+            histogram = cls._histograms.setdefault(key, [0] * (len(cls._LATENCY_BUCKETS) + 3))
+            histogram[bisect.bisect_left(cls._LATENCY_BUCKETS, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    @classmethod
+    def _get_metrics(cls) -> Dict[str, Any]:
+        with cls.__lock:
+            histograms = {}
+            for key, histogram in cls._histograms.items():
+                cumulative_counts = [sum(histogram[: i + 1]) for i in range(len(cls._LATENCY_BUCKETS))]
+                histograms[cls.__series_name(*key)] = {
+                    "buckets": dict(zip(cls._LATENCY_BUCKETS, cumulative_counts)),
+                    "sum": histogram[-2],
+                    "count": histogram[-1],
+                }
+            return {
+                "counters": {cls.__series_name(*key): value for key, value in cls._counters.items()},
+                "gauges": {cls.__series_name(*key): value for key, value in cls._gauges.items()},
+                "histograms": histograms,
+            }
+
+    @classmethod
+    def _to_prometheus(cls) -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with cls.__lock:
+            for metric_type, metrics in (("counter", cls._counters), ("gauge", cls._gauges)):
+                for name in sorted({name for name, _ in metrics}):
+                    cls.__add_header(lines, name, metric_type)
+                    for (metric_name, labels), value in metrics.items():
+                        if metric_name == name:
+                            lines.append(f"{cls.__series_name(cls._PREFIX + name, labels)} {value}")
+            for name in sorted({name for name, _ in cls._histograms}):
+                cls.__add_header(lines, name, "histogram")
+                for (metric_name, labels), histogram in cls._histograms.items():
+                    if metric_name != name:
+                        continue
+                    cumulative_count = 0
+                    for bucket, count in zip([*cls._LATENCY_BUCKETS, "+Inf"], histogram):
+                        cumulative_count += count
+                        bucket_labels = (*labels, ("le", str(bucket)))
+                        lines.append(
+                            f"{cls.__series_name(f'{cls._PREFIX}{name}_bucket', bucket_labels)} {cumulative_count}"
+                        )
+                    lines.append(f"{cls.__series_name(f'{cls._PREFIX}{name}_sum', labels)} {histogram[-2]}")
+                    lines.append(f"{cls.__series_name(f'{cls._PREFIX}{name}_count', labels)} {histogram[-1]}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def _start_http_server(cls, port: int, host: str = "127.0.0.1"):
+        """Serve the metrics in the Prometheus text exposition format on http://<host>:<port>/metrics."""
+        if cls._server is not None:
+            return
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = cls._to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        cls._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        threading.Thread(target=cls._server.serve_forever, name="Thread-Taipy-Metrics", daemon=True).start()
+        cls.__logger.info(f"Metrics are exposed on http://{host}:{cls._server.server_port}/metrics")
+
+    @classmethod
+    def _stop_http_server(cls):
+        if cls._server is not None:
+            cls._server.shutdown()
+            cls._server.server_close()
+            cls._server = None
+
+    @classmethod
+    def _clear(cls):
+        with cls.__lock:
+            cls._counters.clear()
+            cls._gauges.clear()
+            cls._histograms.clear()
+
+    @staticmethod
+    def __key(name: str, labels: Optional[Dict[str, str]]) -> Tuple[str, _Labels]:
+        return name, tuple(sorted((labels or {}).items()))
+
+    @classmethod
+    def __add_header(cls, lines: List[str], name: str, metric_type: str):
+        lines.append(f"# HELP {cls._PREFIX}{name} {cls._DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {cls._PREFIX}{name} {metric_type}")
+
+    @staticmethod
+    def __series_name(name: str, labels: _Labels) -> str:
+        if not labels:
+            return name
+        return name + "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
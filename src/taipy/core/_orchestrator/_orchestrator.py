@@ -9,24 +9,34 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import inspect
 import itertools
+import threading
 import uuid
 from datetime import datetime
 from multiprocessing import Lock
-from queue import Queue
 from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
 from taipy.config.config import Config
 from taipy.logger._taipy_logger import _TaipyLogger
 
 from .._entity._submittable import _Submittable
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data._shared_memory import _SharedMemoryRegistry
+from ..data.data_node import DataNode
+from ..data.pickle import PickleDataNode
+from ..job._job_callback_executor import _synchronous_callback
 from ..job._job_manager_factory import _JobManagerFactory
+from ..job._job_owner import _JobOwner
 from ..job.job import Job
 from ..job.job_id import JobId
+from ..job.status import Status
 from ..task.task import Task
 from ._abstract_orchestrator import _AbstractOrchestrator
+from ._job_queue import _JobQueue
+from ._metrics_registry import _MetricsRegistry
+from ._stream_channel import _StreamChannel
 
 
 class _Orchestrator(_AbstractOrchestrator):
@@ -34,9 +44,17 @@ class _Orchestrator(_AbstractOrchestrator):
     Handles the functional orchestrating.
     """
 
-    jobs_to_run: Queue = Queue()
+    jobs_to_run: _JobQueue = _JobQueue()
     blocked_jobs: List = []
     lock = Lock()
+    # The generator jobs of each submission by output data node id, and the unfinished jobs of the submissions
+    # streaming batches between their tasks.
+    _stream_producers: Dict[str, Dict[str, Job]] = {}
+    _stream_jobs: Dict[str, Set[JobId]] = {}
+    __streams_lock = threading.Lock()
+    # The unfinished jobs of each submission, which keeps the shared memory segments of its pickle data nodes.
+    _submission_jobs: Dict[str, Set[JobId]] = {}
+    __submissions_lock = threading.Lock()
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -51,6 +69,7 @@ class _Orchestrator(_AbstractOrchestrator):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> List[Job]:
         """Submit the given `Scenario^` or `Pipeline^` for an execution.
 
@@ -63,6 +82,8 @@ class _Orchestrator(_AbstractOrchestrator):
                 finished in asynchronous mode.
              timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
                 before returning.
+             priority (int): The priority of the created jobs. Jobs with a higher priority run first. The default
+                value is 0.
         Returns:
             The created Jobs.
         """
@@ -74,7 +95,12 @@ class _Orchestrator(_AbstractOrchestrator):
                 for task in ts:
                     res.append(
                         cls._submit_task(
-                            task, submit_id, submittable.id, callbacks=callbacks, force=force  # type: ignore
+                            task,
+                            submit_id,
+                            submittable.id,  # type: ignore
+                            callbacks=callbacks,
+                            force=force,
+                            priority=priority,
                         )
                     )
 
@@ -95,6 +121,7 @@ class _Orchestrator(_AbstractOrchestrator):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> Job:
         """Submit the given `Task^` for an execution.
 
@@ -107,11 +134,13 @@ class _Orchestrator(_AbstractOrchestrator):
                 mode.
              timeout (Union[float, int]): The optional maximum number of seconds to wait for the job to be finished
                 before returning.
+             priority (int): The priority of the created job. Jobs with a higher priority run first. The default
+                value is 0.
         Returns:
             The created `Job^`.
         """
         with cls.lock:
-            job = cls._submit_task(task, submit_id, submit_entity_id, callbacks, force)
+            job = cls._submit_task(task, submit_id, submit_entity_id, callbacks, force, priority)
 
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
@@ -128,6 +157,7 @@ class _Orchestrator(_AbstractOrchestrator):
         submit_entity_id: Optional[str] = None,
         callbacks: Optional[Iterable[Callable]] = None,
         force: bool = False,
+        priority: int = 0,
     ) -> Job:
         submit_id = submit_id if submit_id else cls.__generate_submit_id()
         submit_entity_id = submit_entity_id if submit_entity_id else task.id
@@ -135,16 +165,123 @@ class _Orchestrator(_AbstractOrchestrator):
         for dn in task.output.values():
             dn.lock_edit()
         job = _JobManagerFactory._build_manager()._create(
-            task, itertools.chain([cls._on_status_change], callbacks or []), submit_id, submit_entity_id, force=force
+            task,
+            itertools.chain([cls._on_status_change], callbacks or []),
+            submit_id,
+            submit_entity_id,
+            force=force,
+            priority=priority,
         )
+        cls.__register_stream(job)
+        cls.__register_submission_job(job)
         cls._orchestrate_job_to_run_or_block(job)
 
         return job
 
+    @classmethod
+    def __register_stream(cls, job: Job):
+        """Register the generator jobs, and link the streaming jobs to the generator job producing their input."""
+        from ._dispatcher._task_function_wrapper import _TaskFunctionWrapper
+
+        with cls.__streams_lock:
+            producers = cls._stream_producers.get(job.submit_id, {})
+            if _TaskFunctionWrapper._is_streaming(job.task):
+                first_input = next(iter(job.task.input.values()))
+                if producer := producers.get(first_input.id):
+                    job._metadata[Job._STREAMED_FROM_KEY] = producer.id
+                    _JobManagerFactory._build_manager()._set(job)
+            if inspect.isgeneratorfunction(job.task.function):
+                producers = cls._stream_producers.setdefault(job.submit_id, producers)
+                producers.update({dn.id: job for dn in job.task.output.values()})
+            if producers:
+                cls._stream_jobs.setdefault(job.submit_id, set()).add(job.id)
+
+    @classmethod
+    def __release_stream(cls, job: Job):
+        """Remove the channels of a submission once all its jobs are finished."""
+        with cls.__streams_lock:
+            jobs = cls._stream_jobs.get(job.submit_id)
+            if jobs is None:
+                return
+            jobs.discard(job.id)
+            if jobs:
+                return
+            del cls._stream_jobs[job.submit_id]
+            cls._stream_producers.pop(job.submit_id, None)
+        _StreamChannel._remove(job.submit_id)
+
+    @classmethod
+    def __register_submission_job(cls, job: Job):
+        """Keep the shared memory segments holding the inputs of the job until its submission is over."""
+        with cls.__submissions_lock:
+            cls._submission_jobs.setdefault(job.submit_id, set()).add(job.id)
+        cls.__acquire_shared_memory(job.submit_id, job.task.input.values())
+
+    @classmethod
+    def __release_submission_job(cls, job: Job):
+        """Keep the shared memory segments written by the job, and evict the segments of its submission once all
+        its jobs are finished."""
+        cls.__acquire_shared_memory(job.submit_id, job.task.output.values())
+        with cls.__submissions_lock:
+            jobs = cls._submission_jobs.get(job.submit_id, set())
+            jobs.discard(job.id)
+            if jobs:
+                return
+            cls._submission_jobs.pop(job.submit_id, None)
+        _SharedMemoryRegistry._release_owner(job.submit_id)
+
+    @staticmethod
+    def __acquire_shared_memory(submit_id: str, data_nodes: Iterable[DataNode]):
+        for data_node in data_nodes:
+            if isinstance(data_node, PickleDataNode):
+                data_node._acquire_shared_memory(submit_id)
+
     @staticmethod
     def __generate_submit_id():
         return f"SUBMISSION_{str(uuid.uuid4())}"
 
+    @classmethod
+    def _recover_jobs(cls) -> List[Job]:
+        """Orchestrate again the unfinished jobs of the current version, left by a previous run of the application.
+
+        The unfinished jobs are recovered when the application process orchestrating them is gone, or when it is the
+        current process but the jobs are neither orchestrated nor executed anymore. They are blocked or queued again
+        depending on the readiness of their inputs, and owned by the current process.
+
+        Returns:
+            The recovered jobs.
+        """
+        from ._dispatcher._job_dispatcher import _JobDispatcher
+
+        job_manager = _JobManagerFactory._build_manager()
+        jobs = job_manager._get_all_by_status([Status.BLOCKED, Status.PENDING, Status.RUNNING], version_number="latest")
+        with cls.lock:
+            orchestrated_job_ids = {job.id for job in cls.blocked_jobs}
+            recovered_jobs = [
+                job
+                for job in sorted(jobs, key=lambda j: j.creation_date)
+                if job.id not in orchestrated_job_ids
+                and job not in cls.jobs_to_run
+                and job.id not in _JobDispatcher._dispatched_processes
+                and cls.__is_orphaned(job)
+            ]
+            # The outputs of all the recovered jobs are locked first, so the jobs consuming them are blocked.
+            for job in recovered_jobs:
+                job._metadata[Job._OWNER_KEY] = _JobOwner._current()
+                job_manager._set(job)
+                for dn in job.task.output.values():
+                    dn.lock_edit()
+            for job in recovered_jobs:
+                cls._orchestrate_job_to_run_or_block(job)
+        if recovered_jobs:
+            cls.__logger.info(f"{len(recovered_jobs)} unfinished jobs have been recovered.")
+        return recovered_jobs
+
+    @staticmethod
+    def __is_orphaned(job: Job) -> bool:
+        owner = job._metadata.get(Job._OWNER_KEY)
+        return _JobOwner._is_current(owner) or _JobOwner._is_gone(owner)
+
     @classmethod
     def _orchestrate_job_to_run_or_block(cls, job: Job):
         if cls._is_blocked(job):
@@ -153,6 +290,13 @@ class _Orchestrator(_AbstractOrchestrator):
         else:
             job.pending()
             cls.jobs_to_run.put(job)
+        _MetricsRegistry._increment(_MetricsRegistry._JOBS_SUBMITTED)
+        cls._update_queue_metrics()
+
+    @classmethod
+    def _update_queue_metrics(cls):
+        _MetricsRegistry._set_gauge(_MetricsRegistry._JOBS_TO_RUN, cls.jobs_to_run.qsize())
+        _MetricsRegistry._set_gauge(_MetricsRegistry._BLOCKED_JOBS, len(cls.blocked_jobs))
 
     @classmethod
     def __wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None):
@@ -185,10 +329,19 @@ class _Orchestrator(_AbstractOrchestrator):
         Returns:
              True if one of its input data nodes is blocked.
         """
-        input_data_nodes = obj.task.input.values() if isinstance(obj, Job) else obj.input.values()
+        input_data_nodes = list(obj.task.input.values() if isinstance(obj, Job) else obj.input.values())
+        if isinstance(obj, Job) and cls.__is_stream_producer_running(obj):
+            input_data_nodes = input_data_nodes[1:]  # The batches of the first input are consumed as they come.
         data_manager = _DataManagerFactory._build_manager()
         return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
 
+    @classmethod
+    def __is_stream_producer_running(cls, job: Job) -> bool:
+        if not (producer_id := job._metadata.get(Job._STREAMED_FROM_KEY)):
+            return False
+        producers = cls._stream_producers.get(job.submit_id, {})
+        return any(producer.id == producer_id and producer.is_running() for producer in producers.values())
+
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]):
         jobs = [jobs] if isinstance(jobs, Job) else jobs
@@ -196,11 +349,18 @@ class _Orchestrator(_AbstractOrchestrator):
             job._unlock_edit_on_outputs()
 
     @classmethod
+    @_synchronous_callback
     def _on_status_change(cls, job: Job):
         if job.is_completed() or job.is_skipped():
             cls.__unblock_jobs()
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
+        elif job.is_running() and job.submit_id in cls._stream_producers:
+            cls.__unblock_jobs()  # The streaming jobs consuming the batches of a generator job can start.
+        if job.submit_id in cls._stream_jobs and job._is_finished():
+            cls.__release_stream(job)
+        if job._is_finished():
+            cls.__release_submission_job(job)
 
     @classmethod
     def __unblock_jobs(cls):
@@ -210,6 +370,7 @@ class _Orchestrator(_AbstractOrchestrator):
                     job.pending()
                     cls.__remove_blocked_job(job)
                     cls.jobs_to_run.put(job)
+                    cls._update_queue_metrics()
 
     @classmethod
     def __remove_blocked_job(cls, job):
@@ -232,6 +393,7 @@ class _Orchestrator(_AbstractOrchestrator):
                 to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
+                cls._update_queue_metrics()
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
                 cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
 
@@ -257,12 +419,8 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def __remove_jobs_to_run(cls, jobs):
-        new_jobs_to_run: Queue = Queue()
-        while not cls.jobs_to_run.empty():
-            current_job = cls.jobs_to_run.get()
-            if current_job not in jobs:
-                new_jobs_to_run.put(current_job)
-        cls.jobs_to_run = new_jobs_to_run
+        for job in jobs:
+            cls.jobs_to_run.remove(job.id)
 
     @classmethod
     def _fail_subsequent_jobs(cls, failed_job: Job):
@@ -276,6 +434,7 @@ class _Orchestrator(_AbstractOrchestrator):
             to_fail_or_abandon_jobs.update([failed_job])
             cls.__remove_blocked_jobs(to_fail_or_abandon_jobs)
             cls.__remove_jobs_to_run(to_fail_or_abandon_jobs)
+            cls._update_queue_metrics()
             cls._unlock_edit_on_jobs_outputs(to_fail_or_abandon_jobs)
 
     @classmethod
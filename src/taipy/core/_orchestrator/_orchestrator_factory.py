@@ -17,7 +17,7 @@ from taipy.config.config import Config
 from ..common._utils import _load_fct
 from ..exceptions.exceptions import ModeNotAvailable, OrchestratorNotBuilt
 from ._abstract_orchestrator import _AbstractOrchestrator
-from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _StandaloneJobDispatcher
+from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _RemoteJobDispatcher, _StandaloneJobDispatcher
 from ._orchestrator import _Orchestrator
 
 
@@ -52,6 +52,8 @@ class _OrchestratorFactory:
             cls.__build_standalone_job_dispatcher(force_restart=force_restart)
         elif Config.job_config.is_development:
             cls.__build_development_job_dispatcher()
+        elif Config.job_config.is_remote:
+            cls.__build_remote_job_dispatcher(force_restart=force_restart)
         elif util.find_spec(cls._TAIPY_ENTERPRISE_MODULE):
             cls.__build_enterprise_job_dispatcher(force_restart=force_restart)
         else:
@@ -83,10 +85,20 @@ class _OrchestratorFactory:
 
     @classmethod
     def __build_development_job_dispatcher(cls):
-        if isinstance(cls._dispatcher, _StandaloneJobDispatcher):
+        if isinstance(cls._dispatcher, (_StandaloneJobDispatcher, _RemoteJobDispatcher)):
             cls._dispatcher.stop()
         cls._dispatcher = _DevelopmentJobDispatcher(cls._orchestrator)  # type: ignore
 
+    @classmethod
+    def __build_remote_job_dispatcher(cls, force_restart=False):
+        if isinstance(cls._dispatcher, _RemoteJobDispatcher):
+            if not force_restart:
+                return
+        if cls._dispatcher is not None and not isinstance(cls._dispatcher, _DevelopmentJobDispatcher):
+            cls._dispatcher.stop()
+        cls._dispatcher = _RemoteJobDispatcher(cls._orchestrator)  # type: ignore
+        cls._dispatcher.start()  # type: ignore
+
     @classmethod
     def __build_enterprise_job_dispatcher(cls, force_restart=False):
         cls._dispatcher = _load_fct(
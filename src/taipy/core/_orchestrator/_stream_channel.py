@@ -0,0 +1,101 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pickle
+import shutil
+from time import sleep
+from typing import Any, Callable, Iterator, Optional
+
+from taipy.config.config import Config
+
+from ..exceptions.exceptions import StreamInterrupted
+
+
+class _StreamChannel:
+    """Channel of the batches yielded by a generator task into one of its outputs.
+
+    The producer spills each batch to a file of the storage folder, so the streaming tasks consuming the batches can
+    run in other processes, or on other machines sharing the storage. A consumer reads the batches in order while
+    they are produced and only keeps one batch in memory at a time. The files of the channels of a submission are
+    removed by the orchestrator once all the jobs of the submission are finished.
+    """
+
+    _FOLDER = "streams"
+    __END_FILE = "end"
+    __POLL_INTERVAL = 0.05
+
+    def __init__(self, submit_id: str, producer_job_id: str, data_node_id: str):
+        self.path = os.path.join(self._get_folder(submit_id), producer_job_id, data_node_id)
+        self._nb_of_batches = 0
+
+    @classmethod
+    def _get_folder(cls, submit_id: str) -> str:
+        return os.path.join(Config.core.storage_folder, cls._FOLDER, submit_id)
+
+    @classmethod
+    def _remove(cls, submit_id: str):
+        shutil.rmtree(cls._get_folder(submit_id), ignore_errors=True)
+
+    def _open(self):
+        shutil.rmtree(self.path, ignore_errors=True)  # The stream restarts if the producer job is executed again.
+        os.makedirs(self.path)
+        self._nb_of_batches = 0
+
+    def _put(self, batch: Any):
+        path = self.__get_batch_path(self._nb_of_batches)
+        self.__dump(batch, path)
+        self._nb_of_batches += 1
+
+    def _close(self, error: Optional[Exception] = None):
+        """Mark the end of the stream, or its interruption if the producer raised the given error."""
+        self.__dump(repr(error) if error else None, os.path.join(self.path, self.__END_FILE))
+
+    def _read(self, is_producer_finished: Callable[[], bool]) -> Iterator[Any]:
+        """Yield the batches in order, waiting for the producer to write them.
+
+        Parameters:
+            is_producer_finished (Callable[[], bool]): Return True once the job producing the batches is finished, to
+                stop waiting for a stream that will never be closed.
+        Raises:
+            StreamInterrupted^: If the producer failed before the end of the stream.
+        """
+        index = 0
+        end_path = os.path.join(self.path, self.__END_FILE)
+        while True:
+            batch_path = self.__get_batch_path(index)
+            # The end of the stream is checked before the next batch, since it is written after the last batch.
+            is_ended = os.path.exists(end_path)
+            if os.path.exists(batch_path):
+                with open(batch_path, "rb") as batch_file:
+                    batch = pickle.load(batch_file)
+                index += 1
+                yield batch
+                continue
+            if is_ended:
+                with open(end_path, "rb") as end_file:
+                    error = pickle.load(end_file)
+                if error:
+                    raise StreamInterrupted(f"The job producing the stream {self.path} failed: {error}")
+                return
+            if is_producer_finished() and not os.path.exists(end_path):
+                raise StreamInterrupted(f"The job producing the stream {self.path} stopped before its end.")
+            sleep(self.__POLL_INTERVAL)
+
+    def __get_batch_path(self, index: int) -> str:
+        return os.path.join(self.path, f"{index:08d}.p")
+
+    @staticmethod
+    def __dump(data: Any, path: str):
+        # The file is renamed once written so that a consumer never reads a partial batch.
+        with open(f"{path}.tmp", "wb") as tmp_file:
+            pickle.dump(data, tmp_file)
+        os.replace(f"{path}.tmp", path)
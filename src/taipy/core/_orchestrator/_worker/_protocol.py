@@ -0,0 +1,46 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Optional, Tuple, Union
+
+from ...exceptions.exceptions import MissingAuthenticationKey
+
+# Messages exchanged between the remote job dispatcher and the worker agents. Each message is a tuple starting with
+# its kind:
+#   (_REGISTER, worker_id, max_nb_of_workers)   worker -> dispatcher, when the worker connects.
+#   (_HEARTBEAT,)                               worker -> dispatcher, periodically.
+#   (_RUN, job_id, task, config_as_string)      dispatcher -> worker, to execute a job.
+#   (_DONE, job_id, exceptions, metadata)       worker -> dispatcher, when a job is executed.
+_REGISTER = "register"
+_HEARTBEAT = "heartbeat"
+_RUN = "run"
+_DONE = "done"
+
+_DEFAULT_ADDRESS = "127.0.0.1:5555"
+_DEFAULT_HEARTBEAT_INTERVAL = 5
+
+
+def _parse_address(address: str) -> Union[str, Tuple[str, int]]:
+    """Convert *"host:port"* to a TCP address. Any other string is the path of a Unix socket."""
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def _to_authkey(authkey: Optional[str]) -> bytes:
+    """Convert the authentication key of the connections between the dispatcher and the workers.
+
+    The messages exchanged are pickled, so unauthenticated connections are never accepted.
+    """
+    if not authkey:
+        raise MissingAuthenticationKey("An authentication key is required to execute the jobs in remote mode.")
+    return authkey.encode()
@@ -0,0 +1,106 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import pickle
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.connection import Client, Connection
+from typing import Optional
+
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from .._dispatcher._task_function_wrapper import _TaskFunctionWrapper
+from ._protocol import _DEFAULT_HEARTBEAT_INTERVAL, _DONE, _HEARTBEAT, _REGISTER, _RUN, _parse_address, _to_authkey
+
+
+class _Worker:
+    """Agent executing the jobs sent by a remote job dispatcher.
+
+    The worker connects to the dispatcher of a Core service running in *"remote"* job execution mode, advertises
+    the number of jobs it can execute in parallel, and executes the jobs it receives in its own pool of processes.
+    The data and the entities are read from and written to the storage configured in the application, which must be
+    shared by the dispatcher and all the workers. The modules of the task functions must be importable by the worker.
+    """
+
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(
+        self,
+        address: str,
+        authkey: str,
+        max_nb_of_workers: int = 1,
+        heartbeat_interval: float = _DEFAULT_HEARTBEAT_INTERVAL,
+        worker_id: Optional[str] = None,
+    ):
+        self.id = worker_id or f"WORKER_{uuid.uuid4()}"
+        self._address = address
+        self._authkey = _to_authkey(authkey)
+        self._max_nb_of_workers = max_nb_of_workers
+        self._heartbeat_interval = heartbeat_interval
+        self._connection: Optional[Connection] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._send_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        """Connect to the dispatcher and execute the jobs it sends until the connection is closed."""
+        self._connection = Client(_parse_address(self._address), authkey=self._authkey)
+        self._executor = ProcessPoolExecutor(self._max_nb_of_workers)
+        self.__send(_REGISTER, self.id, self._max_nb_of_workers)
+        self.__logger.info(f"Worker {self.id} is connected to the job dispatcher on {self._address}.")
+        threading.Thread(target=self.__send_heartbeats, name="Thread-Taipy-WorkerHeartbeat", daemon=True).start()
+        try:
+            while not self._stop_event.is_set():
+                message = self._connection.recv()
+                if message[0] == _RUN:
+                    self.__execute(*message[1:])
+        except (EOFError, OSError):
+            pass
+        finally:
+            self.stop()
+        self.__logger.info(f"Worker {self.id} is disconnected from the job dispatcher.")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._connection is not None:
+            self._connection.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __execute(self, job_id, task, config_as_string):
+        future = self._executor.submit(  # type: ignore
+            _TaskFunctionWrapper._wrapped_function_with_config_load, config_as_string, job_id, task
+        )
+        future.add_done_callback(partial(self.__send_result, job_id))
+
+    def __send_result(self, job_id, future):
+        try:
+            exceptions, metadata = future.result()
+        except Exception as e:
+            exceptions, metadata = [e], {}
+        try:
+            pickle.dumps(exceptions)
+        except Exception:
+            exceptions = [RuntimeError(repr(e)) for e in exceptions]
+        self.__send(_DONE, job_id, exceptions, metadata)
+
+    def __send_heartbeats(self):
+        while not self._stop_event.wait(self._heartbeat_interval):
+            self.__send(_HEARTBEAT)
+
+    def __send(self, *message):
+        with self._send_lock:
+            try:
+                self._connection.send(message)  # type: ignore
+            except (OSError, ValueError):  # The connection is closed.
+                self._stop_event.set()
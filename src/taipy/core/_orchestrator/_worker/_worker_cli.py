@@ -0,0 +1,58 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+
+from taipy._cli._base_cli import _CLI
+
+from ._protocol import _DEFAULT_ADDRESS, _DEFAULT_HEARTBEAT_INTERVAL
+from ._worker import _Worker
+
+
+class _WorkerCLI:
+    """Command-line interface of the worker agents executing the jobs of a Core service in remote mode.
+
+    A worker agent is started with `python -m taipy.core._orchestrator._worker --authkey KEY [ARGS]`.
+    """
+
+    @classmethod
+    def create_parser(cls):
+        worker_parser = _CLI._add_subparser("worker", help="Start a worker agent executing Taipy jobs.")
+
+        worker_parser.add_argument(
+            "--address",
+            default=_DEFAULT_ADDRESS,
+            help=f"The address of the job dispatcher: HOST:PORT or the path of a Unix socket. Default to "
+            f"{_DEFAULT_ADDRESS}.",
+        )
+        worker_parser.add_argument("--authkey", required=True, help="The authentication key of the job dispatcher.")
+        worker_parser.add_argument(
+            "--max-nb-of-workers",
+            type=int,
+            default=1,
+            help="The maximum number of jobs the worker executes in parallel. Default to 1.",
+        )
+        worker_parser.add_argument(
+            "--heartbeat-interval",
+            type=float,
+            default=_DEFAULT_HEARTBEAT_INTERVAL,
+            help=f"The number of seconds between two heartbeats. Default to {_DEFAULT_HEARTBEAT_INTERVAL}.",
+        )
+
+    @classmethod
+    def parse_arguments(cls):
+        args = _CLI._parse()
+
+        if getattr(args, "which", None) != "worker":
+            return
+
+        _Worker(args.address, args.authkey, args.max_nb_of_workers, args.heartbeat_interval).run()
+        sys.exit(0)
@@ -129,6 +129,19 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     ###########################################
     # ##   Specific or optimized methods   ## #
     ###########################################
+    @_retry(Config.core.read_entity_retry or 0, (Exception,))
+    def _load_all_containing_any(self, texts: Iterable[str], filters: Optional[List[Dict]] = None) -> List[Entity]:
+        """Load, in a single pass over the files, the entities whose file contains one of the texts."""
+        texts = list(texts)
+        entities = []
+        try:
+            for f in self.dir_path.iterdir():
+                if data := self.__filter_by(f, filters, texts):
+                    entities.append(self.__file_content_to_entity(data))
+        except FileNotFoundError:
+            pass
+        return entities
+
     def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: List[Dict] = None):
         # Design in order to optimize performance on Entity creation.
         # Maintainability and readability were impacted.
@@ -226,11 +239,15 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         entity = self.converter._model_to_entity(model)
         return entity
 
-    def __filter_by(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Json:
+    def __filter_by(
+        self, filepath: pathlib.Path, filters: Optional[List[Dict]], any_of: Optional[List[str]] = None
+    ) -> Json:
         if not filters:
             filters = []
         with open(filepath, "r") as f:
             contents = f.read()
+            if any_of is not None and not any(text in contents for text in any_of):
+                return None
             for _filter in filters:
                 if not all(f'"{key}": "{value}"' in contents for key, value in _filter.items()):
                     return None
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import multiprocessing
 from typing import Dict
 
 from taipy.config._config import _Config
@@ -27,10 +28,12 @@ class _JobConfigChecker(_ConfigChecker):
         if job_config := self._config._unique_sections.get(JobConfig.name):
             data_node_configs = self._config._sections[DataNodeConfig.name]
             self._check_multiprocess_mode(job_config, data_node_configs)
+            self._check_start_method(job_config)
+            self._check_remote_authkey(job_config)
         return self._collector
 
     def _check_multiprocess_mode(self, job_config: JobConfig, data_node_configs: Dict[str, DataNodeConfig]):
-        if job_config.is_standalone:
+        if job_config.is_standalone or job_config.is_remote:
             for cfg_id, data_node_config in data_node_configs.items():
                 if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
                     self._error(
@@ -39,3 +42,21 @@ class _JobConfigChecker(_ConfigChecker):
                         f"DataNode `{cfg_id}`: In-memory storage type can ONLY be used in "
                         f"{JobConfig._DEVELOPMENT_MODE} mode.",
                     )
+
+    def _check_start_method(self, job_config: JobConfig):
+        start_method = job_config.start_method
+        if start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+            self._error(
+                JobConfig._START_METHOD_KEY,
+                start_method,
+                f"The start method of the worker processes must be one of "
+                f"{multiprocessing.get_all_start_methods()} on this platform.",
+            )
+
+    def _check_remote_authkey(self, job_config: JobConfig):
+        if job_config.is_remote and not job_config.remote_authkey:
+            self._error(
+                JobConfig._REMOTE_AUTHKEY_KEY,
+                job_config.remote_authkey,
+                f"An authentication key is required in {JobConfig._REMOTE_MODE} mode.",
+            )
@@ -91,6 +91,7 @@ class DataNodeConfig(Section):
     _OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_CSV_PROPERTY = "default_path"
     _OPTIONAL_HAS_HEADER_CSV_PROPERTY = "has_header"
+    _OPTIONAL_ENGINE_CSV_PROPERTY = "engine"
     # Excel
     _OPTIONAL_EXPOSED_TYPE_EXCEL_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY = "default_path"
@@ -111,6 +112,12 @@ class DataNodeConfig(Section):
     _OPTIONAL_DRIVER_SQL_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY = "db_extra_args"
     _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY = "exposed_type"
+    _OPTIONAL_POOL_SIZE_SQL_PROPERTY = "db_pool_size"
+    _OPTIONAL_MAX_OVERFLOW_SQL_PROPERTY = "db_max_overflow"
+    _OPTIONAL_POOL_RECYCLE_SQL_PROPERTY = "db_pool_recycle"
+    _OPTIONAL_WRITE_MODE_SQL_TABLE_PROPERTY = "write_mode"
+    _OPTIONAL_PRIMARY_KEYS_SQL_TABLE_PROPERTY = "primary_keys"
+    _OPTIONAL_WRITE_CHUNKSIZE_SQL_TABLE_PROPERTY = "write_chunksize"
     # SQL_TABLE
     _REQUIRED_TABLE_NAME_SQL_TABLE_PROPERTY = "table_name"
     # SQL
@@ -125,13 +132,17 @@ class DataNodeConfig(Section):
     _OPTIONAL_HOST_MONGO_PROPERTY = "db_host"
     _OPTIONAL_PORT_MONGO_PROPERTY = "db_port"
     _OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY = "db_extra_args"
+    _OPTIONAL_BATCH_SIZE_MONGO_PROPERTY = "batch_size"
     # Pickle
     _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY = "default_path"
     _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY = "default_data"
+    _OPTIONAL_TRANSPORT_PICKLE_PROPERTY = "transport"
+    _OPTIONAL_SHARED_MEMORY_BUDGET_PICKLE_PROPERTY = "shared_memory_budget"
     # JSON
     _OPTIONAL_ENCODER_JSON_PROPERTY = "encoder"
     _OPTIONAL_DECODER_JSON_PROPERTY = "decoder"
     _OPTIONAL_DEFAULT_PATH_JSON_PROPERTY = "default_path"
+    _OPTIONAL_LINES_JSON_PROPERTY = "lines"
     # Parquet
     _OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_PARQUET_PROPERTY = "default_path"
@@ -139,6 +150,7 @@ class DataNodeConfig(Section):
     _OPTIONAL_COMPRESSION_PARQUET_PROPERTY = "compression"
     _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY = "read_kwargs"
     _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY = "write_kwargs"
+    _OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY = "partition_cols"
 
     _REQUIRED_PROPERTIES: Dict[str, List] = {
         _STORAGE_TYPE_VALUE_PICKLE: [],
@@ -176,6 +188,7 @@ class DataNodeConfig(Section):
             _OPTIONAL_DEFAULT_PATH_CSV_PROPERTY: None,
             _OPTIONAL_HAS_HEADER_CSV_PROPERTY: True,
             _OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+            _OPTIONAL_ENGINE_CSV_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_EXCEL: {
             _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY: None,
@@ -194,6 +207,12 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+            _OPTIONAL_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_MAX_OVERFLOW_SQL_PROPERTY: None,
+            _OPTIONAL_POOL_RECYCLE_SQL_PROPERTY: None,
+            _OPTIONAL_WRITE_MODE_SQL_TABLE_PROPERTY: "replace",
+            _OPTIONAL_PRIMARY_KEYS_SQL_TABLE_PROPERTY: None,
+            _OPTIONAL_WRITE_CHUNKSIZE_SQL_TABLE_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_SQL: {
             _OPTIONAL_DB_USERNAME_SQL_PROPERTY: None,
@@ -205,6 +224,9 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: ".db",
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+            _OPTIONAL_POOL_SIZE_SQL_PROPERTY: None,
+            _OPTIONAL_MAX_OVERFLOW_SQL_PROPERTY: None,
+            _OPTIONAL_POOL_RECYCLE_SQL_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_MONGO_COLLECTION: {
             _OPTIONAL_CUSTOM_DOCUMENT_MONGO_PROPERTY: MongoDefaultDocument,
@@ -213,15 +235,19 @@ class DataNodeConfig(Section):
             _OPTIONAL_HOST_MONGO_PROPERTY: "localhost",
             _OPTIONAL_PORT_MONGO_PROPERTY: 27017,
             _OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY: None,
+            _OPTIONAL_BATCH_SIZE_MONGO_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_PICKLE: {
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY: None,
+            _OPTIONAL_TRANSPORT_PICKLE_PROPERTY: None,
+            _OPTIONAL_SHARED_MEMORY_BUDGET_PICKLE_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_JSON: {
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_ENCODER_JSON_PROPERTY: None,
             _OPTIONAL_DECODER_JSON_PROPERTY: None,
+            _OPTIONAL_LINES_JSON_PROPERTY: None,
         },
         _STORAGE_TYPE_VALUE_PARQUET: {
             _OPTIONAL_DEFAULT_PATH_PARQUET_PROPERTY: None,
@@ -229,6 +255,7 @@ class DataNodeConfig(Section):
             _OPTIONAL_COMPRESSION_PARQUET_PROPERTY: "snappy",
             _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY: None,
             _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY: None,
+            _OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY: None,
             _OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY: _DEFAULT_EXPOSED_TYPE,
         },
     }
@@ -447,6 +474,7 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        engine: Optional[str] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new CSV data node configuration.
@@ -464,6 +492,9 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            engine (Optional[str]): The parser used to read the CSV file. Possible values are *"c"*,
+                *"python"*, or *"pyarrow"*. The *"pyarrow"* engine parses the file with several threads.<br/>
+                The default value is *"c"*.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -475,6 +506,8 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_HAS_HEADER_CSV_PROPERTY] = has_header
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY] = exposed_type
+        if engine is not None:
+            properties[cls._OPTIONAL_ENGINE_CSV_PROPERTY] = engine
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_CSV, scope, validity_period, **properties)
 
@@ -487,6 +520,7 @@ class DataNodeConfig(Section):
         decoder: Optional[json.JSONDecoder] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        lines: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new JSON data node configuration.
@@ -503,6 +537,9 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            lines (Optional[bool]): If True, the file is stored in the JSON Lines format: the data is a list
+                and each element is written on its own line, so that data can be appended to the file.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
         Returns:
             The new JSON data node configuration.
@@ -513,6 +550,8 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_ENCODER_JSON_PROPERTY] = encoder
         if decoder is not None:
             properties[cls._OPTIONAL_DECODER_JSON_PROPERTY] = decoder
+        if lines is not None:
+            properties[cls._OPTIONAL_LINES_JSON_PROPERTY] = lines
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_JSON, scope, validity_period, **properties)
 
@@ -528,6 +567,7 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        partition_cols: Optional[List[str]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Parquet data node configuration.
@@ -555,6 +595,10 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            partition_cols (Optional[List[str]]): The columns by which the data is partitioned. If set, the
+                data node is a dataset stored as a folder with a sub-folder per partition (hive layout). Writing
+                data only replaces the partitions it contains, and `ParquetDataNode.read_partitions()` reads a
+                subset of the partitions.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -570,6 +614,8 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_READ_KWARGS_PARQUET_PROPERTY] = read_kwargs
         if write_kwargs is not None:
             properties[cls._OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY] = write_kwargs
+        if partition_cols is not None:
+            properties[cls._OPTIONAL_PARTITION_COLS_PARQUET_PROPERTY] = partition_cols
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_PARQUET_PROPERTY] = exposed_type
 
@@ -705,6 +751,8 @@ class DataNodeConfig(Section):
         default_data: Optional[Any] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        transport: Optional[str] = None,
+        shared_memory_budget: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new pickle data node configuration.
@@ -721,6 +769,14 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            transport (Optional[str]): How the data is handed over between processes. Possible
+                values are *"file"* or *"shared_memory"*. With *"shared_memory"*, the data written
+                by a job is kept in shared memory until the submissions using it are over.<br/>
+                The default value is *"file"*.
+            shared_memory_budget (Optional[int]): Used only with the *"shared_memory"* transport.
+                The maximum size in bytes of the data kept in shared memory. Larger data is
+                written to the pickle file.<br/>
+                The default value is 1 GiB.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -730,6 +786,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY] = default_path
         if default_data is not None:
             properties[cls._OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY] = default_data
+        if transport is not None:
+            properties[cls._OPTIONAL_TRANSPORT_PICKLE_PROPERTY] = transport
+        if shared_memory_budget is not None:
+            properties[cls._OPTIONAL_SHARED_MEMORY_BUDGET_PICKLE_PROPERTY] = shared_memory_budget
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PICKLE, scope, validity_period, **properties)
 
@@ -751,6 +811,12 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
+        write_mode: Optional[str] = None,
+        primary_keys: Optional[List[str]] = None,
+        write_chunksize: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL table data node configuration.
@@ -785,6 +851,21 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the database engine.
+                The engine and its pool are shared by all the data nodes using the same database and pool options.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*.
+            db_pool_recycle (Optional[int]): The number of seconds after which a connection of the pool is
+                recycled.<br/>
+                If *db_pool_size*, *db_max_overflow* or *db_pool_recycle* is None, the default value of
+                SQLAlchemy applies.
+            write_mode (Optional[str]): How the written data replaces the rows of the table. Possible values are
+                *"replace"* to delete all the rows, *"append"* to keep them, or *"upsert"* to replace the rows
+                having the primary keys of the written rows.<br/>
+                The default value is "replace".
+            primary_keys (Optional[List[str]]): The columns identifying a row. Required by the *"upsert"*
+                write mode.
+            write_chunksize (Optional[int]): The number of rows inserted at once.<br/>
+                The default value is 10000.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -816,6 +897,18 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_max_overflow is not None:
+            properties[cls._OPTIONAL_MAX_OVERFLOW_SQL_PROPERTY] = db_max_overflow
+        if db_pool_recycle is not None:
+            properties[cls._OPTIONAL_POOL_RECYCLE_SQL_PROPERTY] = db_pool_recycle
+        if write_mode is not None:
+            properties[cls._OPTIONAL_WRITE_MODE_SQL_TABLE_PROPERTY] = write_mode
+        if primary_keys is not None:
+            properties[cls._OPTIONAL_PRIMARY_KEYS_SQL_TABLE_PROPERTY] = primary_keys
+        if write_chunksize is not None:
+            properties[cls._OPTIONAL_WRITE_CHUNKSIZE_SQL_TABLE_PROPERTY] = write_chunksize
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL_TABLE, scope, validity_period, **properties)
 
@@ -838,6 +931,9 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL data node configuration.
@@ -874,6 +970,13 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the database engine.
+                The engine and its pool are shared by all the data nodes using the same database and pool options.
+            db_max_overflow (Optional[int]): The number of connections that can be opened beyond *db_pool_size*.
+            db_pool_recycle (Optional[int]): The number of seconds after which a connection of the pool is
+                recycled.<br/>
+                If *db_pool_size*, *db_max_overflow* or *db_pool_recycle* is None, the default value of
+                SQLAlchemy applies.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
         Returns:
             The new SQL data node configuration.
@@ -905,6 +1008,12 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_max_overflow is not None:
+            properties[cls._OPTIONAL_MAX_OVERFLOW_SQL_PROPERTY] = db_max_overflow
+        if db_pool_recycle is not None:
+            properties[cls._OPTIONAL_POOL_RECYCLE_SQL_PROPERTY] = db_pool_recycle
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL, scope, validity_period, **properties)
 
@@ -922,6 +1031,7 @@ class DataNodeConfig(Section):
         db_extra_args: Optional[Dict[str, Any]] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        batch_size: Optional[int] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new Mongo collection data node configuration.
@@ -950,6 +1060,9 @@ class DataNodeConfig(Section):
                 relevant tasks will run even if they are skippable (see the
                 [Task configs page](../core/config/task-config.md) for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            batch_size (Optional[int]): The number of documents fetched by each round trip to the database when
+                reading the collection.<br/>
+                If *batch_size* is None, the default batch size of the server applies.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -974,6 +1087,8 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_PORT_MONGO_PROPERTY] = db_port
         if db_extra_args is not None:
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_MONGO_PROPERTY] = db_extra_args
+        if batch_size is not None:
+            properties[cls._OPTIONAL_BATCH_SIZE_MONGO_PROPERTY] = batch_size
 
         return cls.__configure(
             id, DataNodeConfig._STORAGE_TYPE_VALUE_MONGO_COLLECTION, scope, validity_period, **properties
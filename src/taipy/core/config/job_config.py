@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 from copy import copy
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from taipy.config import Config
 from taipy.config._config import _Config
@@ -35,8 +35,21 @@ class JobConfig(UniqueSection):
     _MODE_KEY = "mode"
     _STANDALONE_MODE = "standalone"
     _DEVELOPMENT_MODE = "development"
+    _REMOTE_MODE = "remote"
     _DEFAULT_MODE = _DEVELOPMENT_MODE
-    _MODES = [_STANDALONE_MODE, _DEVELOPMENT_MODE]
+    _MODES = [_STANDALONE_MODE, _DEVELOPMENT_MODE, _REMOTE_MODE]
+
+    _MAX_NB_OF_IO_THREADS_KEY = "max_nb_of_io_threads"
+    _READ_CACHE_BUDGET_KEY = "read_cache_budget"
+    _PRELOAD_MODULES_KEY = "preload_modules"
+    _METRICS_PORT_KEY = "metrics_port"
+    _MAX_NB_OF_CALLBACK_THREADS_KEY = "max_nb_of_callback_threads"
+    _REMOTE_ADDRESS_KEY = "remote_address"
+    _REMOTE_AUTHKEY_KEY = "remote_authkey"
+    _HEARTBEAT_INTERVAL_KEY = "heartbeat_interval"
+    _MIN_NB_OF_WORKERS_KEY = "min_nb_of_workers"
+    _WORKER_IDLE_TIMEOUT_KEY = "worker_idle_timeout"
+    _START_METHOD_KEY = "start_method"
 
     def __init__(self, mode: Optional[str] = None, **properties):
         self.mode = mode or self._DEFAULT_MODE
@@ -83,13 +96,27 @@ class JobConfig(UniqueSection):
         mode: Optional[str] = None,
         nb_of_workers: Optional[Union[int, str]] = None,
         max_nb_of_workers: Optional[Union[int, str]] = None,
+        max_nb_of_io_threads: Optional[Union[int, str]] = None,
+        read_cache_budget: Optional[Union[int, str]] = None,
+        preload_modules: Optional[List[str]] = None,
+        metrics_port: Optional[Union[int, str]] = None,
+        max_nb_of_callback_threads: Optional[Union[int, str]] = None,
+        remote_address: Optional[str] = None,
+        remote_authkey: Optional[str] = None,
+        heartbeat_interval: Optional[Union[float, str]] = None,
+        min_nb_of_workers: Optional[Union[int, str]] = None,
+        worker_idle_timeout: Optional[Union[float, str]] = None,
+        start_method: Optional[str] = None,
         **properties
     ) -> "JobConfig":
         """Configure job execution.
 
         Parameters:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* (the default value) or *"development"*.
+                Possible values are: *"standalone"* (the default value), *"development"*, or *"remote"*.<br/>
+                In *"remote"* mode, the jobs are executed by worker agents started with
+                `python -m taipy.core._orchestrator._worker`, possibly on other machines sharing the storage
+                of the application.
             max_nb_of_workers (Optional[int, str]): Parameter used only in default *"standalone"* mode.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 1.<br/>
@@ -97,6 +124,53 @@ class JobConfig(UniqueSection):
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
             nb_of_workers (Optional[int, str]): Deprecated. Use *max_nb_of_workers* instead.
+            min_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                The minimum number of worker processes kept alive. When it is lower than
+                *max_nb_of_workers*, the number of processes grows when jobs wait for a worker and
+                shrinks back after *worker_idle_timeout* seconds without activity. It can be 0.<br/>
+                The default value is *max_nb_of_workers*: the number of processes is fixed.
+            worker_idle_timeout (Optional[float, str]): Parameter used only in *"standalone"* mode.
+                The number of seconds without any job starting or finishing before the idle worker
+                processes above *min_nb_of_workers* are reclaimed.<br/>
+                The default value is 60.
+            start_method (Optional[str]): Parameter used only in *"standalone"* mode.
+                The method used to start the worker processes: *"fork"*, *"forkserver"*, or *"spawn"*.
+                With *"forkserver"*, the Taipy modules and the *preload_modules* are imported once by
+                the server process, and each worker is forked from it, sharing their memory copy-on-write.<br/>
+                The default value is None: the default start method of the platform is used.
+            max_nb_of_io_threads (Optional[int, str]): The maximum number of threads each job uses
+                to read its input data nodes and to write its output data nodes concurrently.<br/>
+                The default value is 1: data nodes are read and written sequentially.
+            read_cache_budget (Optional[int, str]): Parameter used only in *"standalone"* and *"remote"*
+                modes. The size in bytes of the cache each worker keeps of the file-based data nodes it
+                reads, so consecutive jobs consuming the same data node do not read it again.<br/>
+                The cached data is not copied: consecutive jobs of a worker receive the same object.
+                Task functions must not modify their inputs in place (e.g. `df["x"] = ...`), or the
+                following jobs would read the modified data.<br/>
+                The default value is None: the data nodes are read from their storage by every job.
+            preload_modules (Optional[List[str]]): Parameter used only in *"standalone"* mode.
+                The names of the modules imported by each worker when it starts, such as the
+                modules of the task functions and their heavy dependencies.
+            metrics_port (Optional[int, str]): The local port on which the orchestration metrics are
+                exposed in the Prometheus text format, at the */metrics* path, while the Core service
+                is running.<br/>
+                The default value is None: the metrics are only available through `taipy.get_metrics()^`.
+            max_nb_of_callback_threads (Optional[int, str]): The maximum number of threads running the
+                callbacks notified on job status changes, such as the scenario subscribers, so a slow
+                callback does not delay the execution of the next jobs. The callbacks of a job are still
+                called in the order of its status changes.<br/>
+                The default value is None: the callbacks run on the thread changing the job status.
+            remote_address (Optional[str]): Parameter used only in *"remote"* mode.
+                The address on which the job dispatcher accepts the connections of the workers:
+                *"HOST:PORT"* or the path of a Unix socket.<br/>
+                The default value is *"127.0.0.1:5555"*.
+            remote_authkey (Optional[str]): Parameter required in *"remote"* mode.
+                The key the workers must provide to connect to the job dispatcher. The dispatcher does not
+                start without it, since the jobs are sent to the workers as pickles.
+            heartbeat_interval (Optional[float, str]): Parameter used only in *"remote"* mode.
+                The number of seconds between two heartbeats of the workers. A worker that misses three
+                heartbeats is considered as lost, and its running jobs are dispatched to the other workers.<br/>
+                The default value is 5.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -107,6 +181,29 @@ class JobConfig(UniqueSection):
             if not max_nb_of_workers:
                 max_nb_of_workers = nb_of_workers
 
+        if max_nb_of_io_threads is not None:
+            properties[JobConfig._MAX_NB_OF_IO_THREADS_KEY] = max_nb_of_io_threads
+        if read_cache_budget is not None:
+            properties[JobConfig._READ_CACHE_BUDGET_KEY] = read_cache_budget
+        if preload_modules is not None:
+            properties[JobConfig._PRELOAD_MODULES_KEY] = preload_modules
+        if metrics_port is not None:
+            properties[JobConfig._METRICS_PORT_KEY] = metrics_port
+        if max_nb_of_callback_threads is not None:
+            properties[JobConfig._MAX_NB_OF_CALLBACK_THREADS_KEY] = max_nb_of_callback_threads
+        if remote_address is not None:
+            properties[JobConfig._REMOTE_ADDRESS_KEY] = remote_address
+        if remote_authkey is not None:
+            properties[JobConfig._REMOTE_AUTHKEY_KEY] = remote_authkey
+        if heartbeat_interval is not None:
+            properties[JobConfig._HEARTBEAT_INTERVAL_KEY] = heartbeat_interval
+        if min_nb_of_workers is not None:
+            properties[JobConfig._MIN_NB_OF_WORKERS_KEY] = min_nb_of_workers
+        if worker_idle_timeout is not None:
+            properties[JobConfig._WORKER_IDLE_TIMEOUT_KEY] = worker_idle_timeout
+        if start_method is not None:
+            properties[JobConfig._START_METHOD_KEY] = start_method
+
         section = JobConfig(mode, max_nb_of_workers=max_nb_of_workers, **properties)
         Config._register(section)
         return Config.unique_sections[JobConfig.name]
@@ -128,6 +225,11 @@ class JobConfig(UniqueSection):
         """True if the config is set to development mode"""
         return self.mode == self._DEVELOPMENT_MODE
 
+    @property
+    def is_remote(self) -> bool:
+        """True if the config is set to remote mode"""
+        return self.mode == self._REMOTE_MODE
+
     @classmethod
     def get_default_config(cls, mode: str) -> Dict[str, Any]:
         if cls.is_standalone:  # type: ignore
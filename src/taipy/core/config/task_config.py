@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from copy import copy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from taipy.config._config import _Config
 from taipy.config.common._template_handler import _TemplateHandler as _tpl
@@ -40,6 +40,25 @@ class TaskConfig(Section):
             exposed types (*exposed_type* field) of the input data nodes and returning results
             compatible with the exposed types (*exposed_type* field) of the outputs list.<br/>
             The default value is None.
+        max_concurrent_jobs (Optional[int]): The maximum number of jobs of this task configuration that can run at
+            the same time. The default value is None: the number of jobs is only bounded by the number of workers.
+        timeout (Optional[float]): The maximum number of seconds a job of this task configuration can run in
+            *"standalone"* job execution mode. A job exceeding it is failed and its worker process is killed. The
+            default value is None: the jobs are not limited in time.
+        partition_by (Optional[str]): If set, the first input data node, a CSV or a Parquet data node, is split
+            into partitions and the function is called on each partition: *"chunks"* splits it into chunks of
+            *partition_size* rows, and the name of a column splits it by the distinct values of this column. The
+            default value is None: the function is called once on the whole data.
+        partition_size (Optional[int]): The number of rows of the chunks when *partition_by* is *"chunks"*.
+            The default value is 100000.
+        reducer (Optional[Callable]): The function combining the list of the results computed on the partitions
+            into the data written in each output. The default value is None: the results are concatenated.
+        incremental (Optional[bool]): If True, a task partitioned by a column only recomputes the partitions of its
+            first input changed since its last execution, as recorded in the edits of the input, and replaces the
+            rows of these partitions in its outputs. The default value is False.
+        streaming (Optional[bool]): If True, the first input is passed to the function as an iterator of batches.
+            When this input is written by a generator function of the same submission, the batches are consumed
+            while they are produced. The default value is False.
         **properties (dict[str, any]): A dictionary of additional properties.
     """
 
@@ -49,6 +68,15 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _MAX_CONCURRENT_JOBS_KEY = "max_concurrent_jobs"
+    _TIMEOUT_KEY = "timeout"
+    _PARTITION_BY_KEY = "partition_by"
+    _PARTITION_SIZE_KEY = "partition_size"
+    _REDUCER_KEY = "reducer"
+    _INCREMENTAL_KEY = "incremental"
+    _STREAMING_KEY = "streaming"
+    _PARTITION_BY_CHUNKS = "chunks"
+    _DEFAULT_PARTITION_SIZE = 100_000
 
     def __init__(
         self,
@@ -159,6 +187,13 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: Optional[bool] = False,
+        max_concurrent_jobs: Optional[Union[int, str]] = None,
+        timeout: Optional[Union[float, str]] = None,
+        partition_by: Optional[str] = None,
+        partition_size: Optional[Union[int, str]] = None,
+        reducer: Optional[Callable] = None,
+        incremental: Optional[bool] = None,
+        streaming: Optional[bool] = None,
         **properties,
     ) -> "TaskConfig":
         """Configure a new task configuration.
@@ -175,11 +210,58 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            max_concurrent_jobs (Optional[int, str]): The maximum number of jobs of this task
+                configuration that can run at the same time.<br/>
+                The default value is None: the number of jobs is only bounded by the number of workers.
+            timeout (Optional[float, str]): The maximum number of seconds a job of this task configuration
+                can run in *"standalone"* job execution mode. A job exceeding it is failed and its worker
+                process is killed.<br/>
+                The default value is None: the jobs are not limited in time.
+            partition_by (Optional[str]): If set, the first input data node, a CSV or a Parquet data
+                node, is split into partitions, and the function is called on each partition. In
+                *"standalone"* mode, the partitions are computed in parallel by the workers.<br/>
+                *"chunks"* splits the data into chunks of *partition_size* rows. The name of a column
+                splits the data by the distinct values of this column.<br/>
+                The default value is None: the function is called once on the whole data.
+            partition_size (Optional[int, str]): The number of rows of the chunks when *partition_by*
+                is *"chunks"*.<br/>
+                The default value is 100000.
+            reducer (Optional[Callable]): The function combining the list of the results computed on
+                the partitions into the data written in an output. It is called once per output.<br/>
+                The default value is None: the dataframes, arrays or lists are concatenated.
+            incremental (Optional[bool]): If True and *partition_by* is the name of a column, only the
+                partitions of the first input changed since the last execution of the task are
+                recomputed, as recorded by the *partitions* entry of the edits of the input. Their rows
+                are replaced in the outputs, which must be dataframes containing the column, and the
+                edits of the outputs record the changed partitions so that the subsequent incremental
+                tasks recompute them only. When an edit does not record its partitions, or another input
+                changed, all the partitions are recomputed.<br/>
+                The default value is False.
+            streaming (Optional[bool]): If True, the first input is passed to the function as an
+                iterator of batches instead of the whole data. If this input is the output of a
+                generator function submitted in the same scenario or pipeline, the task starts as soon
+                as the generator runs and consumes the batches as they are yielded. Otherwise, CSV and
+                Parquet data nodes are iterated in chunks of *partition_size* rows.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
             The new task configuration.
         """
+        if max_concurrent_jobs is not None:
+            properties[TaskConfig._MAX_CONCURRENT_JOBS_KEY] = max_concurrent_jobs
+        if timeout is not None:
+            properties[TaskConfig._TIMEOUT_KEY] = timeout
+        if partition_by is not None:
+            properties[TaskConfig._PARTITION_BY_KEY] = partition_by
+        if partition_size is not None:
+            properties[TaskConfig._PARTITION_SIZE_KEY] = partition_size
+        if reducer is not None:
+            properties[TaskConfig._REDUCER_KEY] = reducer
+        if incremental is not None:
+            properties[TaskConfig._INCREMENTAL_KEY] = incremental
+        if streaming is not None:
+            properties[TaskConfig._STREAMING_KEY] = streaming
         section = TaskConfig(id, function, input, output, skippable, **properties)
         Config._register(section)
         return Config.sections[TaskConfig.name][id]
@@ -190,6 +272,13 @@ class TaskConfig(Section):
         input: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         output: Optional[Union[DataNodeConfig, List[DataNodeConfig]]] = None,
         skippable: Optional[bool] = False,
+        max_concurrent_jobs: Optional[Union[int, str]] = None,
+        timeout: Optional[Union[float, str]] = None,
+        partition_by: Optional[str] = None,
+        partition_size: Optional[Union[int, str]] = None,
+        reducer: Optional[Callable] = None,
+        incremental: Optional[bool] = None,
+        streaming: Optional[bool] = None,
         **properties,
     ) -> "TaskConfig":
         """Set the default values for task configurations.
@@ -209,11 +298,58 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
+            max_concurrent_jobs (Optional[int, str]): The maximum number of jobs of a task
+                configuration that can run at the same time.<br/>
+                The default value is None: the number of jobs is only bounded by the number of workers.
+            timeout (Optional[float, str]): The maximum number of seconds a job of a task configuration
+                can run in *"standalone"* job execution mode. A job exceeding it is failed and its worker
+                process is killed.<br/>
+                The default value is None: the jobs are not limited in time.
+            partition_by (Optional[str]): If set, the first input data node, a CSV or a Parquet data
+                node, is split into partitions, and the function is called on each partition. In
+                *"standalone"* mode, the partitions are computed in parallel by the workers.<br/>
+                *"chunks"* splits the data into chunks of *partition_size* rows. The name of a column
+                splits the data by the distinct values of this column.<br/>
+                The default value is None: the function is called once on the whole data.
+            partition_size (Optional[int, str]): The number of rows of the chunks when *partition_by*
+                is *"chunks"*.<br/>
+                The default value is 100000.
+            reducer (Optional[Callable]): The function combining the list of the results computed on
+                the partitions into the data written in an output. It is called once per output.<br/>
+                The default value is None: the dataframes, arrays or lists are concatenated.
+            incremental (Optional[bool]): If True and *partition_by* is the name of a column, only the
+                partitions of the first input changed since the last execution of the task are
+                recomputed, as recorded by the *partitions* entry of the edits of the input. Their rows
+                are replaced in the outputs, which must be dataframes containing the column, and the
+                edits of the outputs record the changed partitions so that the subsequent incremental
+                tasks recompute them only. When an edit does not record its partitions, or another input
+                changed, all the partitions are recomputed.<br/>
+                The default value is False.
+            streaming (Optional[bool]): If True, the first input is passed to the function as an
+                iterator of batches instead of the whole data. If this input is the output of a
+                generator function submitted in the same scenario or pipeline, the task starts as soon
+                as the generator runs and consumes the batches as they are yielded. Otherwise, CSV and
+                Parquet data nodes are iterated in chunks of *partition_size* rows.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional
                 arguments.
         Returns:
             The default task configuration.
         """
+        if max_concurrent_jobs is not None:
+            properties[TaskConfig._MAX_CONCURRENT_JOBS_KEY] = max_concurrent_jobs
+        if timeout is not None:
+            properties[TaskConfig._TIMEOUT_KEY] = timeout
+        if partition_by is not None:
+            properties[TaskConfig._PARTITION_BY_KEY] = partition_by
+        if partition_size is not None:
+            properties[TaskConfig._PARTITION_SIZE_KEY] = partition_size
+        if reducer is not None:
+            properties[TaskConfig._REDUCER_KEY] = reducer
+        if incremental is not None:
+            properties[TaskConfig._INCREMENTAL_KEY] = incremental
+        if streaming is not None:
+            properties[TaskConfig._STREAMING_KEY] = streaming
         section = TaskConfig(_Config.DEFAULT_KEY, function, input, output, skippable, **properties)
         Config._register(section)
         return Config.sections[TaskConfig.name][_Config.DEFAULT_KEY]
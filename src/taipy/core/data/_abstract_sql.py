@@ -14,19 +14,22 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import modin.pandas as modin_pd
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, column, literal_column, or_, select, text
+from sqlalchemy.sql import Selectable
 
 from taipy.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import MissingRequiredProperty, UnknownDatabaseEngine
 from ._abstract_tabular import _AbstractTabularDataNode
+from ._sql_engine_registry import _SQLEngineRegistry
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
 
 
 class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
@@ -50,6 +53,9 @@ class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
     __SQLITE_FOLDER_PATH = "sqlite_folder_path"
     __SQLITE_FILE_EXTENSION = "sqlite_file_extension"
+    __DB_POOL_SIZE_KEY = "db_pool_size"
+    __DB_MAX_OVERFLOW_KEY = "db_max_overflow"
+    __DB_POOL_RECYCLE_KEY = "db_pool_recycle"
 
     __ENGINE_PROPERTIES: List[str] = [
         __DB_NAME_KEY,
@@ -61,8 +67,17 @@ class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
         __DB_EXTRA_ARGS_KEY,
         __SQLITE_FOLDER_PATH,
         __SQLITE_FILE_EXTENSION,
+        __DB_POOL_SIZE_KEY,
+        __DB_MAX_OVERFLOW_KEY,
+        __DB_POOL_RECYCLE_KEY,
     ]
 
+    __POOL_OPTIONS = {
+        __DB_POOL_SIZE_KEY: "pool_size",
+        __DB_MAX_OVERFLOW_KEY: "max_overflow",
+        __DB_POOL_RECYCLE_KEY: "pool_recycle",
+    }
+
     __DB_HOST_DEFAULT = "localhost"
     __DB_PORT_DEFAULT = 1433
     __DB_DRIVER_DEFAULT = ""
@@ -74,6 +89,16 @@ class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
     __ENGINE_MYSQL = "mysql"
     __ENGINE_POSTGRESQL = "postgresql"
 
+    __FILTER_OPERATORS = {
+        Operator.EQUAL: lambda c, v: c == v,
+        # As in pandas, the rows with a missing value are different from any value.
+        Operator.NOT_EQUAL: lambda c, v: or_(c != v, c.is_(None)),
+        Operator.LESS_THAN: lambda c, v: c < v,
+        Operator.LESS_OR_EQUAL: lambda c, v: c <= v,
+        Operator.GREATER_THAN: lambda c, v: c > v,
+        Operator.GREATER_OR_EQUAL: lambda c, v: c >= v,
+    }
+
     _ENGINE_REQUIRED_PROPERTIES: Dict[str, List[str]] = {
         __ENGINE_MSSQL: [__DB_USERNAME_KEY, __DB_PASSWORD_KEY, __DB_NAME_KEY],
         __ENGINE_MYSQL: [__DB_USERNAME_KEY, __DB_PASSWORD_KEY, __DB_NAME_KEY],
@@ -137,7 +162,12 @@ class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
 
     def _get_engine(self):
         if self._engine is None:
-            self._engine = create_engine(self._conn_string())
+            pool_options = {
+                option: int(self.properties[key])
+                for key, option in self.__POOL_OPTIONS.items()
+                if self.properties.get(key) is not None
+            }
+            self._engine = _SQLEngineRegistry._get_engine(self._conn_string(), **pool_options)
         return self._engine
 
     def _conn_string(self) -> str:
@@ -208,6 +238,95 @@ class _AbstractSQLDataNode(DataNode, _AbstractTabularDataNode):
             return modin_pd.read_sql_query(self._get_read_query(), con=self._get_engine())[columns]
         return modin_pd.read_sql_query(self._get_read_query(), con=self._get_engine())
 
+    def filter(
+        self,
+        operators: Union[List, Tuple],
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ):
+        """Read and filter the data referenced by this data node.
+
+        The data is filtered by the provided list of 3-tuples (key, value, `Operator^`), joined based on the
+        join operator (_AND_ or _OR_). The filters are compiled into the `WHERE` clause of the query sent to the
+        database, with bound parameters, so that only the matching rows are transferred.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): The 3-tuples (key, value, `Operator^`) the rows must match.
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[str]]): The columns to read. All the columns are read by default.
+            limit (Optional[int]): The maximum number of rows to read.
+            order_by (Optional[Union[str, List[str]]]): The columns by which the rows are sorted. The order of a
+                column prefixed with *"-"* is descending.
+        Returns:
+            The filtered data, in the exposed type of the data node.
+        """
+        if join_operator not in [JoinOperator.AND, JoinOperator.OR]:
+            return NotImplementedError
+        return self._read_query(self._build_filter_query(operators, join_operator, columns, limit, order_by))
+
+    def _build_filter_query(
+        self,
+        operators: Union[List, Tuple],
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ):
+        if len(operators) > 0 and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        selected_columns = [column(name) for name in columns] if columns else [literal_column("*")]
+        query = select(*selected_columns).select_from(self._get_read_selectable())
+        if clauses := [self.__FILTER_OPERATORS[operator](column(key), value) for key, value, operator in operators]:
+            query = query.where(or_(*clauses) if join_operator == JoinOperator.OR else and_(*clauses))
+        for name in [order_by] if isinstance(order_by, str) else order_by or []:
+            query = query.order_by(column(name[1:]).desc() if name.startswith("-") else column(name))
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def _get_read_selectable(self) -> Selectable:
+        """The rows read by the data node, to select from in the queries built by the data node."""
+        query = self._get_read_query().rstrip().rstrip(";").rstrip()  # A subquery cannot end the statement.
+        return text(query).columns().subquery("taipy_read_query")
+
+    def _read_query(self, query) -> Any:
+        """Execute a query built by the data node and return its rows in the exposed type of the data node."""
+        with self._get_engine().connect() as connection:
+            result = connection.execute(query)
+            df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+        return self.__to_exposed_type(df)
+
+    def read_chunks(self, chunksize: int, dtype_backend: Optional[str] = None) -> Iterator:
+        """Read the data by chunks of rows, without loading all the rows in memory.
+
+        The rows are fetched with a server-side cursor where the database driver supports it.
+
+        Parameters:
+            chunksize (int): The number of rows of each chunk.
+            dtype_backend (Optional[str]): The types of the columns of the dataframes: *"numpy_nullable"*, or
+                *"pyarrow"* to store the chunks as Arrow arrays. The default numpy types are used by default.
+        Returns:
+            A generator of the chunks, in the exposed type of the data node.
+        """
+        kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
+        with self._get_engine().connect() as connection:
+            connection = connection.execution_options(stream_results=True, max_row_buffer=chunksize)
+            for df in pd.read_sql_query(text(self._get_read_query()), connection, chunksize=chunksize, **kwargs):
+                yield self.__to_exposed_type(df)
+
+    def __to_exposed_type(self, df: pd.DataFrame) -> Any:
+        exposed_type = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self.__EXPOSED_TYPE_PANDAS:
+            return df
+        if exposed_type == self.__EXPOSED_TYPE_MODIN:
+            return modin_pd.DataFrame(df)
+        if exposed_type == self.__EXPOSED_TYPE_NUMPY:
+            return df.to_numpy()
+        return [exposed_type(**row) for row in df.to_dict(orient="records")]
+
     @abstractmethod
     def _get_read_query(self):
         raise NotImplementedError
@@ -116,6 +116,7 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
     def _clean_pickle_file(cls, data_node: DataNode):
         if not isinstance(data_node, PickleDataNode):
             return
+        data_node._release_shared_memory()
         if data_node.is_generated and os.path.exists(data_node.path):
             os.remove(data_node.path)
 
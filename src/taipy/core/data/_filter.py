@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from collections.abc import Hashable
-from typing import Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import modin.pandas as modin_pd
 import pandas as pd
@@ -22,9 +22,27 @@ class _FilterDataNode:
     __MULTI_SHEET_EXCEL_DATA_TYPE = "multi_sheet_excel"
     __CUSTOM_DATA_TYPE = "custom"
 
-    def __init__(self, data_node_id, data: Union[pd.DataFrame, modin_pd.DataFrame, List]) -> None:
+    def __init__(
+        self,
+        data_node_id,
+        data: Union[pd.DataFrame, modin_pd.DataFrame, List],
+        column: Optional[str] = None,
+        filters: Optional[List[List[Tuple[str, str, Any]]]] = None,
+    ) -> None:
+        """
+        Parameters:
+            data_node_id: The identifier of the filtered data node.
+            data: The filtered data.
+            column (Optional[str]): The name of the column of the data node when the data is this single column.
+                The comparisons of the column are then also expressed as *filters*.
+            filters (Optional[List[List[Tuple]]]): The condition selecting the rows of the data node when the data
+                is a boolean mask, in disjunctive normal form: a list of conjunctions of (column, operator, value)
+                predicates. The data nodes supporting it read only the matching rows instead of applying the mask.
+        """
         self.data_node_id = data_node_id
         self.data = data
+        self.column = column
+        self.filters = filters
         self.data_type = None
         if self._is_pandas_object():
             self.data_type = self.__DATAFRAME_DATA_TYPE
@@ -110,42 +128,42 @@ class _FilterDataNode:
             filtered_data = self.data == value
         else:
             filtered_data = [e == value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate("==", value))
 
     def __lt__(self, value):
         if self.data_is_dataframe():
             filtered_data = self.data < value
         else:
             filtered_data = [e < value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate("<", value))
 
     def __le__(self, value):
         if self.data_is_dataframe():
             filtered_data = self.data <= value
         else:
             filtered_data = [e <= value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate("<=", value))
 
     def __gt__(self, value):
         if self.data_is_dataframe():
             filtered_data = self.data > value
         else:
             filtered_data = [e > value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate(">", value))
 
     def __ge__(self, value):
         if self.data_is_dataframe():
             filtered_data = self.data >= value
         else:
             filtered_data = [e >= value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate(">=", value))
 
     def __ne__(self, value):
         if self.data_is_dataframe():
             filtered_data = self.data != value
         else:
             filtered_data = [e != value for e in self.data]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=self.__predicate("!=", value))
 
     def __and__(self, other):
         if self.data_is_dataframe():
@@ -158,7 +176,12 @@ class _FilterDataNode:
                 raise NotImplementedError
             else:
                 filtered_data = [s and o for s, o in zip(self.data, other.data)]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        filters = None
+        if self.__can_combine_filters(other):
+            filters = [
+                conjunction + other_conjunction for conjunction in self.filters for other_conjunction in other.filters
+            ]
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=filters)
 
     def __or__(self, other):
         if self.data_is_dataframe():
@@ -171,7 +194,18 @@ class _FilterDataNode:
                 raise NotImplementedError
             else:
                 filtered_data = [s or o for s, o in zip(self.data, other.data)]
-        return _FilterDataNode(self.data_node_id, filtered_data)
+        filters = None
+        if self.__can_combine_filters(other):
+            filters = self.filters + other.filters
+        return _FilterDataNode(self.data_node_id, filtered_data, filters=filters)
+
+    def __can_combine_filters(self, other) -> bool:
+        return self.filters is not None and other.filters is not None and self.data_node_id == other.data_node_id
+
+    def __predicate(self, operator: str, value) -> Optional[List[List[Tuple[str, str, Any]]]]:
+        if self.column is None:
+            return None
+        return [[(self.column, operator, value)]]
 
     def __str__(self) -> str:
         if self.data_is_dataframe():
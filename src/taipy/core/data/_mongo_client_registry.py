@@ -0,0 +1,48 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from threading import Lock
+from typing import Dict
+
+import pymongo
+
+
+class _MongoClientRegistry:
+    """Keeps the Mongo clients of the current process, shared by the Mongo collection data nodes.
+
+    A client owns a pool of connections and monitoring threads. The data nodes using the same connection string,
+    extra arguments included, use the same client whatever the number of instances of the data nodes loaded from
+    the repository. The clients inherited from a parent process are discarded, since they are not fork-safe.
+    """
+
+    _clients: Dict[str, pymongo.MongoClient] = {}
+    _pid = os.getpid()
+    __lock = Lock()
+
+    @classmethod
+    def _get_client(cls, connection_string: str) -> pymongo.MongoClient:
+        """Return the client of the connection string, created on the first call."""
+        with cls.__lock:
+            if cls._pid != os.getpid():
+                cls._clients = {}
+                cls._pid = os.getpid()
+            if connection_string not in cls._clients:
+                cls._clients[connection_string] = pymongo.MongoClient(connection_string)
+            return cls._clients[connection_string]
+
+    @classmethod
+    def _close_all(cls):
+        """Close all the clients and forget them."""
+        with cls.__lock:
+            for client in cls._clients.values():
+                client.close()
+            cls._clients = {}
@@ -0,0 +1,219 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import atexit
+import os
+import pickle
+import uuid
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class _SharedMemoryReference:
+    """Pointer to a pickled object stored in a shared memory segment.
+
+    The segment holds the pickle payload followed by the out-of-band buffers (NumPy arrays, Arrow buffers, ...)
+    produced by the pickle protocol 5, so they can be mapped back without being copied.
+    """
+
+    name: str
+    payload_size: int
+    buffer_sizes: List[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _DataInFile:
+    """Marker written before the data of a pickle file that is not kept in shared memory."""
+
+
+@dataclass
+class _OwnedSegment:
+    reference: _SharedMemoryReference
+    evict: Callable[[_SharedMemoryReference], None]
+    owners: Set[str] = field(default_factory=set)
+
+
+class _SharedMemoryRegistry:
+    """Creates, maps and evicts the shared memory segments holding the data of pickle data nodes.
+
+    Segments are not tracked by the `multiprocessing` resource tracker, so they outlive the job processes writing
+    them. They are owned by the orchestrator process, which evicts a segment once the last submission using it is
+    over. Each read maps the segment with its own handle, closed as soon as no object uses its buffers anymore.
+    """
+
+    __SEGMENT_PREFIX = "taipy_"
+
+    _owned_segments: Dict[str, _OwnedSegment] = {}
+    _open_mappings: List[shared_memory.SharedMemory] = []
+    __lock = RLock()
+    __is_exit_handler_registered = False
+
+    @classmethod
+    def _dumps(cls, data: Any, budget: Optional[int] = None) -> Optional[_SharedMemoryReference]:
+        """Pickle `data` into a new shared memory segment.
+
+        Returns:
+            The reference to the segment, or None if the pickled data exceeds the memory budget or if the platform
+            frees a segment with its last handle (Windows), so it could not outlive the process writing it.
+        """
+        if os.name != "posix":
+            return None
+        buffers: List[pickle.PickleBuffer] = []
+        payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        size = len(payload) + sum(raw.nbytes for raw in raw_buffers)
+        if budget is not None and size > budget:
+            return None
+
+        cls.__close_unused_mappings()
+        segment = shared_memory.SharedMemory(
+            name=f"{cls.__SEGMENT_PREFIX}{uuid.uuid4().hex[:20]}", create=True, size=max(size, 1)
+        )
+        try:
+            offset = len(payload)
+            segment.buf[:offset] = payload
+            for raw in raw_buffers:
+                segment.buf[offset : offset + raw.nbytes] = raw
+                offset += raw.nbytes
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+        cls.__untrack(segment)
+        segment.close()
+        return _SharedMemoryReference(segment.name, len(payload), [raw.nbytes for raw in raw_buffers])
+
+    @classmethod
+    def _loads(cls, reference: _SharedMemoryReference) -> Any:
+        """Rebuild the object referenced by `reference` on top of the shared memory buffers.
+
+        Raises:
+            FileNotFoundError: If the segment does not exist anymore.
+        """
+        cls.__close_unused_mappings()
+        segment = shared_memory.SharedMemory(name=reference.name)
+        cls.__untrack(segment)
+        view = segment.buf.toreadonly()
+        offset = reference.payload_size
+        buffers = []
+        for buffer_size in reference.buffer_sizes:
+            buffers.append(view[offset : offset + buffer_size])
+            offset += buffer_size
+        try:
+            data = pickle.loads(view[: reference.payload_size], buffers=buffers)
+        finally:
+            del buffers
+            view.release()
+        if not cls.__close(segment):
+            # The object is built on top of the segment buffers: the mapping is closed once they are released.
+            with cls.__lock:
+                cls._open_mappings.append(segment)
+        return data
+
+    @classmethod
+    def _release(cls, reference: _SharedMemoryReference):
+        """Unlink the segment so its memory is freed once every process has unmapped it."""
+        with cls.__lock:
+            cls._owned_segments.pop(reference.name, None)
+        cls.__unlink(reference.name)
+        cls.__close_unused_mappings()
+
+    @classmethod
+    def _acquire(
+        cls, reference: _SharedMemoryReference, owner: str, evict: Callable[[_SharedMemoryReference], None]
+    ) -> bool:
+        """Keep the segment referenced by `reference` until `owner` is released.
+
+        Parameters:
+            reference (_SharedMemoryReference): The reference to the segment.
+            owner (str): The identifier of the owner, typically a submission id.
+            evict (Callable): Called with the reference before the segment is unlinked, once it has no owner anymore.
+
+        Returns:
+            False if the segment does not exist anymore, True otherwise.
+        """
+        with cls.__lock:
+            if reference.name not in cls._owned_segments:
+                try:
+                    segment = shared_memory.SharedMemory(name=reference.name)
+                except FileNotFoundError:
+                    return False
+                cls.__untrack(segment)
+                segment.close()
+                cls._owned_segments[reference.name] = _OwnedSegment(reference, evict)
+                cls.__register_exit_handler()
+            cls._owned_segments[reference.name].owners.add(owner)
+        return True
+
+    @classmethod
+    def _release_owner(cls, owner: str):
+        """Evict the segments that `owner` was the last one to keep."""
+        with cls.__lock:
+            evicted = []
+            for name, segment in list(cls._owned_segments.items()):
+                segment.owners.discard(owner)
+                if not segment.owners:
+                    evicted.append(cls._owned_segments.pop(name))
+        for segment in evicted:
+            cls.__evict(segment)
+
+    @classmethod
+    def _evict_all(cls):
+        """Evict all the segments owned by the current process."""
+        with cls.__lock:
+            evicted = list(cls._owned_segments.values())
+            cls._owned_segments.clear()
+        for segment in evicted:
+            cls.__evict(segment)
+
+    @classmethod
+    def __evict(cls, segment: _OwnedSegment):
+        try:
+            segment.evict(segment.reference)
+        finally:
+            cls.__unlink(segment.reference.name)
+
+    @classmethod
+    def __register_exit_handler(cls):
+        if not cls.__is_exit_handler_registered:
+            atexit.register(cls._evict_all)
+            cls.__is_exit_handler_registered = True
+
+    @classmethod
+    def __close_unused_mappings(cls):
+        with cls.__lock:
+            cls._open_mappings = [mapping for mapping in cls._open_mappings if not cls.__close(mapping)]
+
+    @staticmethod
+    def __close(segment: shared_memory.SharedMemory) -> bool:
+        try:
+            segment.close()
+            return True
+        except BufferError:  # Some objects still use the segment buffers.
+            return False
+
+    @staticmethod
+    def __unlink(name: str):
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+        segment.unlink()
+        segment.close()
+
+    @staticmethod
+    def __untrack(segment: shared_memory.SharedMemory):
+        """Prevent the resource tracker from unlinking the segment when the current process exits."""
+        if os.name == "posix":
+            resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore
@@ -0,0 +1,107 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import io
+import math
+import sqlite3
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import Table
+
+_BulkWriter = Callable[[Any, Table, Sequence[str], List[Tuple]], None]
+
+
+class _SQLBulkWriters:
+    """Functions inserting a chunk of rows in a SQL table, by database dialect.
+
+    A writer is called with the SQLAlchemy connection, the table, the names of the columns and the rows as tuples of
+    values. The dialects without a registered writer use the `executemany` of their database driver.
+    """
+
+    _writers: Dict[str, _BulkWriter] = {}
+
+    @classmethod
+    def _register(cls, dialect: str, writer: _BulkWriter):
+        cls._writers[dialect] = writer
+
+    @classmethod
+    def _get(cls, dialect: str) -> _BulkWriter:
+        return cls._writers.get(dialect, _executemany_writer)
+
+
+def _insert_statement(connection, table: Table, columns: Sequence[str], nb_of_rows: int = 1) -> str:
+    preparer = connection.dialect.identifier_preparer
+    if connection.dialect.paramstyle == "qmark":
+        markers = ", ".join("?" * len(columns))
+    elif connection.dialect.paramstyle == "numeric":
+        markers = ", ".join(f":{i}" for i in range(1, len(columns) + 1))
+    else:
+        markers = ", ".join(["%s"] * len(columns))
+    values = ", ".join([f"({markers})"] * nb_of_rows)
+    return (
+        f"INSERT INTO {preparer.format_table(table)} ({', '.join(preparer.quote(c) for c in columns)}) VALUES {values}"
+    )
+
+
+def _executemany_writer(connection, table: Table, columns: Sequence[str], rows: List[Tuple]):
+    """Insert the rows with one `executemany` call of the database driver."""
+    if connection.dialect.paramstyle not in ("qmark", "numeric", "format", "pyformat"):
+        connection.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+        return
+    connection.exec_driver_sql(_insert_statement(connection, table, columns), rows)
+
+
+# SQLite limits the number of parameters of a statement to 999 before version 3.32.0, and 32766 since then.
+_SQLITE_MAX_VARIABLE_NUMBER = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+def _sqlite_writer(connection, table: Table, columns: Sequence[str], rows: List[Tuple]):
+    """Insert the rows with multi-row `INSERT` statements, as many rows per statement as SQLite accepts."""
+    nb_of_rows_per_statement = max(1, _SQLITE_MAX_VARIABLE_NUMBER // max(len(columns), 1))
+    for start in range(0, len(rows), nb_of_rows_per_statement):
+        statement_rows = rows[start : start + nb_of_rows_per_statement]
+        connection.exec_driver_sql(
+            _insert_statement(connection, table, columns, len(statement_rows)),
+            tuple(value for row in statement_rows for value in row),
+        )
+
+
+def _postgresql_copy_writer(connection, table: Table, columns: Sequence[str], rows: List[Tuple]):
+    """Stream the rows as CSV to a `COPY ... FROM STDIN` statement when the driver is psycopg2."""
+    cursor = connection.connection.driver_connection.cursor()
+    if not hasattr(cursor, "copy_expert"):
+        cursor.close()
+        _executemany_writer(connection, table, columns, rows)
+        return
+    buffer = io.StringIO()
+    buffer.writelines(",".join(_to_csv_field(value) for value in row) + "\n" for row in rows)
+    buffer.seek(0)
+    preparer = connection.dialect.identifier_preparer
+    try:
+        cursor.copy_expert(
+            f"COPY {preparer.format_table(table)} ({', '.join(preparer.quote(c) for c in columns)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _to_csv_field(value) -> str:
+    # The missing values are unquoted empty fields, read as NULL by COPY, unlike the quoted empty strings.
+    if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+_SQLBulkWriters._register("sqlite", _sqlite_writer)
+_SQLBulkWriters._register("postgresql", _postgresql_copy_writer)
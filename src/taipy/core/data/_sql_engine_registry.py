@@ -0,0 +1,52 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+
+class _SQLEngineRegistry:
+    """Keeps the SQLAlchemy engines of the current process, shared by the SQL data nodes.
+
+    The data nodes pointing at the same database with the same pool options use the same engine, hence the same
+    pool of connections, whatever the number of instances of the data nodes loaded from the repository. The
+    engines inherited from a parent process are discarded without closing the connections of the parent.
+    """
+
+    _engines: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Engine] = {}
+    _pid = os.getpid()
+    __lock = Lock()
+
+    @classmethod
+    def _get_engine(cls, conn_string: str, **pool_options) -> Engine:
+        """Return the engine of the connection string and pool options, created on the first call."""
+        key = (conn_string, tuple(sorted(pool_options.items())))
+        with cls.__lock:
+            if cls._pid != os.getpid():
+                for engine in cls._engines.values():
+                    engine.dispose(close=False)
+                cls._engines = {}
+                cls._pid = os.getpid()
+            if key not in cls._engines:
+                cls._engines[key] = create_engine(conn_string, **pool_options)
+            return cls._engines[key]
+
+    @classmethod
+    def _dispose_all(cls):
+        """Close the connections of all the engines and forget them."""
+        with cls.__lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines = {}
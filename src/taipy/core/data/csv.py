@@ -10,19 +10,24 @@
 # specific language governing permissions and limitations under the License.
 
 import csv
+import io
 import os
 from datetime import datetime, timedelta
 from os.path import isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import modin.pandas as modin_pd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 from taipy.config.common.scope import Scope
 
 from .._backup._backup import _replace_in_backup_file
 from .._entity._reload import _self_reload
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import DataNodeWritingError, UnknownCSVEngine
 from ..job.job_id import JobId
 from ._abstract_file import _AbstractFileDataNode
 from ._abstract_tabular import _AbstractTabularDataNode
@@ -59,6 +64,8 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             - _"default_path"_ `(str)`: The default path of the CSV file.\n
             - _"has_header"_ `(bool)`: If True, indicates that the CSV file has a header.\n
             - _"exposed_type"_: The exposed type of the data read from CSV file. The default value is `pandas`.\n
+            - _"engine"_ `(str)`: The parser used to read the CSV file: _"c"_ (the default value), _"python"_, or
+                _"pyarrow"_.\n
     """
 
     __STORAGE_TYPE = "csv"
@@ -71,6 +78,10 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
     __DEFAULT_PATH_KEY = "default_path"
     __DEFAULT_DATA_KEY = "default_data"
     __HAS_HEADER_PROPERTY = "has_header"
+    __ENGINE_PROPERTY = "engine"
+    __VALID_CSV_ENGINES = ["c", "python", "pyarrow"]
+    __PARTITION_BY_CHUNKS = "chunks"
+    __SCAN_CHUNK_SIZE = 100_000
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -100,6 +111,12 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
             properties[self.__EXPOSED_TYPE_PROPERTY] = self.__EXPOSED_TYPE_PANDAS
         self._check_exposed_type(properties[self.__EXPOSED_TYPE_PROPERTY], self.__VALID_STRING_EXPOSED_TYPES)
 
+        if properties.get(self.__ENGINE_PROPERTY) not in [None, *self.__VALID_CSV_ENGINES]:
+            raise UnknownCSVEngine(
+                f"Invalid CSV engine: {properties[self.__ENGINE_PROPERTY]}. "
+                f"Supported engines are {', '.join(self.__VALID_CSV_ENGINES)}"
+            )
+
         super().__init__(
             config_id,
             scope,
@@ -174,12 +191,12 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
         try:
             if self.properties[self.__HAS_HEADER_PROPERTY]:
                 if column_names:
-                    return pd.read_csv(self._path)[column_names]
-                return pd.read_csv(self._path)
+                    return pd.read_csv(self._path, usecols=column_names, **self.__read_kwargs())[column_names]
+                return pd.read_csv(self._path, **self.__read_kwargs())
             else:
                 if usecols:
-                    return pd.read_csv(self._path, header=None, usecols=usecols)
-                return pd.read_csv(self._path, header=None)
+                    return pd.read_csv(self._path, usecols=usecols, **self.__read_kwargs())
+                return pd.read_csv(self._path, **self.__read_kwargs())
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
@@ -189,21 +206,277 @@ class CSVDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
         try:
             if self.properties[self.__HAS_HEADER_PROPERTY]:
                 if column_names:
-                    return modin_pd.read_csv(self._path)[column_names]
-                return modin_pd.read_csv(self._path)
+                    return modin_pd.read_csv(self._path, usecols=column_names, **self.__read_kwargs())[column_names]
+                return modin_pd.read_csv(self._path, **self.__read_kwargs())
             else:
                 if usecols:
-                    return modin_pd.read_csv(self._path, header=None, usecols=usecols)
-                return modin_pd.read_csv(self._path, header=None)
+                    return modin_pd.read_csv(self._path, usecols=usecols, **self.__read_kwargs())
+                return modin_pd.read_csv(self._path, **self.__read_kwargs())
         except pd.errors.EmptyDataError:
             return modin_pd.DataFrame()
 
+    def read_chunks(self, chunksize: int, columns: Optional[List] = None, dtype: Optional[Dict] = None) -> Iterator:
+        """Read the CSV file by chunks of rows, without loading the whole file in memory.
+
+        Parameters:
+            chunksize (int): The number of rows of each chunk.
+            columns (Optional[List]): The names of the columns to read, or their indexes if the file has no header.
+                The other columns are skipped by the parser. All the columns are read by default.
+            dtype (Optional[dict]): The types of the columns, passed to the parser.
+        Returns:
+            A generator of the chunks, in the exposed type of the data node.
+        """
+        if self.properties.get(self.__ENGINE_PROPERTY) == "pyarrow":
+            chunks = self.__read_chunks_with_pyarrow(chunksize, columns, dtype)
+        else:
+            chunks = self.__read_chunks_with_pandas(chunksize, columns, dtype)
+        for chunk in chunks:
+            yield self.__to_exposed_type(chunk[columns] if columns else chunk)
+
+    def __read_chunks_with_pandas(self, chunksize: int, columns: Optional[List], dtype: Optional[Dict]) -> Iterator:
+        try:
+            with pd.read_csv(
+                self._path, usecols=columns, dtype=dtype, chunksize=chunksize, **self.__read_kwargs()
+            ) as reader:
+                yield from reader
+        except pd.errors.EmptyDataError:
+            return
+
+    def __read_chunks_with_pyarrow(self, chunksize: int, columns: Optional[List], dtype: Optional[Dict]) -> Iterator:
+        """The pyarrow parser of pandas does not read by chunks: the file is streamed by blocks with pyarrow."""
+        has_header = self.properties[self.__HAS_HEADER_PROPERTY]
+        read_options = pa_csv.ReadOptions(autogenerate_column_names=not has_header)
+        if columns and not has_header:
+            columns = [f"f{column}" for column in columns]
+        column_types, dtype = self.__to_arrow_types(dtype, has_header)
+        convert_options = pa_csv.ConvertOptions(include_columns=columns, column_types=column_types)
+        try:
+            reader = pa_csv.open_csv(self._path, read_options=read_options, convert_options=convert_options)
+        except pa.ArrowInvalid:  # The file is empty.
+            return
+        batches: List[pa.RecordBatch] = []
+        nb_rows = 0
+        for batch in reader:
+            batches.append(batch)
+            nb_rows += batch.num_rows
+            while nb_rows >= chunksize:
+                table = pa.Table.from_batches(batches)
+                yield self.__from_arrow(table.slice(0, chunksize), has_header, dtype)
+                table = table.slice(chunksize)
+                batches, nb_rows = table.to_batches(), table.num_rows
+        if nb_rows:
+            yield self.__from_arrow(pa.Table.from_batches(batches), has_header, dtype)
+
+    @staticmethod
+    def __to_arrow_types(dtype: Optional[Dict], has_header: bool) -> Tuple[Dict[str, pa.DataType], Dict]:
+        """Split the types of the columns between the arrow types set by the parser and the pandas extension types,
+        which have no arrow equivalent and are cast after parsing."""
+        column_types: Dict[str, pa.DataType] = {}
+        extension_types = {}
+        for column, column_dtype in (dtype or {}).items():
+            column_dtype = pd.api.types.pandas_dtype(column_dtype)
+            name = column if has_header else f"f{column}"
+            if isinstance(column_dtype, pd.CategoricalDtype):
+                column_types[name] = pa.dictionary(pa.int32(), pa.string())
+            elif isinstance(column_dtype, np.dtype):
+                is_text = column_dtype.kind in "OSU"
+                column_types[name] = pa.string() if is_text else pa.from_numpy_dtype(column_dtype)
+            else:
+                extension_types[column] = column_dtype
+        return column_types, extension_types
+
+    @staticmethod
+    def __from_arrow(table: pa.Table, has_header: bool, dtype: Optional[Dict]) -> pd.DataFrame:
+        df = table.to_pandas()
+        if not has_header:
+            df.columns = [int(column[1:]) for column in df.columns]
+        return df.astype(dtype) if dtype else df
+
+    def __read_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"header": 0 if self.properties[self.__HAS_HEADER_PROPERTY] else None}
+        if engine := self.properties.get(self.__ENGINE_PROPERTY):
+            kwargs[self.__ENGINE_PROPERTY] = engine
+        return kwargs
+
+    def _get_partitions(self, partition_by: str, partition_size: int) -> List[Dict[str, Any]]:
+        """Split the rows of the CSV file into partitions that can be read independently.
+
+        The file is scanned once to find the byte ranges of the rows of each partition, so reading a partition
+        only parses its own rows. All the partitions are read with the column types inferred from the first rows.
+
+        Parameters:
+            partition_by (str): *"chunks"* to split the file into consecutive chunks of *partition_size* rows, or
+                the name of a column to make a partition per distinct value of this column.
+            partition_size (int): The number of rows of each chunk.
+        Returns:
+            The descriptions of the partitions, to pass to `_read_partition()`.
+        """
+        if os.path.getsize(self._path) == 0:
+            return []
+        has_header = self.properties[self.__HAS_HEADER_PROPERTY]
+        is_chunked = partition_by == self.__PARTITION_BY_CHUNKS
+        first_rows = pd.read_csv(
+            self._path, header=0 if has_header else None, nrows=partition_size if is_chunked else self.__SCAN_CHUNK_SIZE
+        )
+        dtype = {column: str(column_dtype) for column, column_dtype in first_rows.dtypes.items()}
+        with open(self._path, "rb") as csv_file:
+            records = self.__scan_records(csv_file)
+            columns = None
+            if has_header:
+                _, header = next(records, (0, b""))
+                columns = next(csv.reader(io.StringIO(header.decode(), newline="")), [])
+            if is_chunked:
+                chunks = self.__get_chunk_ranges(records, partition_size)
+                return [{"ranges": ranges, "columns": columns, "dtype": dtype} for ranges in chunks]
+            column = partition_by if has_header else int(partition_by)
+            index = columns.index(column) if columns is not None else column
+            ranges_by_value = self.__get_value_ranges(records, index, dtype.get(column))
+        return [
+            {"column": column, "value": value, "ranges": ranges, "columns": columns, "dtype": dtype}
+            for value, ranges in ranges_by_value.items()
+        ]
+
+    def _read_partition(self, partition: Dict[str, Any]):
+        """Read the rows of a partition returned by `_get_partitions()`, in the exposed type of the data node."""
+        rows = bytearray()
+        with open(self._path, "rb") as csv_file:
+            for offset, length in partition["ranges"]:
+                csv_file.seek(offset)
+                rows += csv_file.read(length)
+        try:
+            df = pd.read_csv(io.BytesIO(rows), header=None, names=partition["columns"], dtype=partition["dtype"])
+        except (ValueError, TypeError):  # The rows do not fit the column types inferred from the first rows.
+            df = pd.read_csv(io.BytesIO(rows), header=None, names=partition["columns"])
+        return self.__to_exposed_type(df)
+
+    @staticmethod
+    def __scan_records(csv_file) -> Iterator[Tuple[int, bytes]]:
+        """Yield the byte offset and the bytes of each record of the file, from the current position.
+
+        A record spans several lines when a quoted field contains line breaks: its lines are gathered until the
+        record holds an even number of quote characters, since the quotes escaped in a quoted field are doubled.
+        """
+        offset = position = csv_file.tell()
+        record = b""
+        for line in csv_file:
+            record += line
+            position += len(line)
+            if record.count(b'"') % 2 == 0:
+                if record.strip():
+                    yield offset, record
+                offset, record = position, b""
+        if record.strip():
+            yield offset, record
+
+    @staticmethod
+    def __get_chunk_ranges(records: Iterator[Tuple[int, bytes]], partition_size: int) -> List[List[List[int]]]:
+        chunks = []
+        start = end = nb_rows = 0
+        for offset, record in records:
+            if nb_rows == 0:
+                start = offset
+            end = offset + len(record)
+            nb_rows += 1
+            if nb_rows == partition_size:
+                chunks.append([[start, end - start]])
+                nb_rows = 0
+        if nb_rows:
+            chunks.append([[start, end - start]])
+        return chunks
+
+    @classmethod
+    def __get_value_ranges(
+        cls, records: Iterator[Tuple[int, bytes]], index: int, dtype: Optional[str]
+    ) -> Dict[Any, List[List[int]]]:
+        """Return the byte ranges of the rows of each value of a column, the missing values being keyed by None."""
+        record_range = [0, 0]
+
+        def _decode():
+            for offset, record in records:
+                record_range[:] = [offset, len(record)]
+                yield record.decode()
+
+        ranges_by_field: Dict[str, List[List[int]]] = {}
+        for fields in csv.reader(_decode()):  # Each decoded record is parsed before the next one is scanned.
+            offset, length = record_range
+            ranges = ranges_by_field.setdefault(fields[index] if index < len(fields) else "", [])
+            if ranges and sum(ranges[-1]) == offset:
+                ranges[-1][1] += length
+            else:
+                ranges.append([offset, length])
+
+        ranges_by_value: Dict[Any, List[List[int]]] = {}
+        for value, ranges in zip(cls.__to_values(list(ranges_by_field), dtype), ranges_by_field.values()):
+            key = None if pd.isna(value) else value
+            if key in ranges_by_value:  # Different spellings of the same value, like 1 and 1.0.
+                ranges_by_value[key] = sorted(ranges_by_value[key] + ranges)
+            else:
+                ranges_by_value[key] = ranges
+        return ranges_by_value
+
+    @staticmethod
+    def __to_values(fields: List[str], dtype: Optional[str]) -> List[Any]:
+        """Convert the fields of a column to the values pandas reads, in the column type if they fit it."""
+        if not fields:
+            return []
+        text = io.StringIO()
+        csv.writer(text, quoting=csv.QUOTE_ALL, lineterminator="\n").writerows([field] for field in fields)
+        kwargs: Dict[str, Any] = {"header": None, "skip_blank_lines": False}
+        try:
+            values = pd.read_csv(io.StringIO(text.getvalue()), dtype={0: dtype} if dtype else None, **kwargs)
+        except (ValueError, TypeError):
+            values = pd.read_csv(io.StringIO(text.getvalue()), **kwargs)
+        return values[0].tolist()
+
+    def __to_exposed_type(self, df: pd.DataFrame):
+        exposed_type = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self.__EXPOSED_TYPE_PANDAS:
+            return df
+        if exposed_type == self.__EXPOSED_TYPE_MODIN:
+            return modin_pd.DataFrame(df)
+        if exposed_type == self.__EXPOSED_TYPE_NUMPY:
+            return df.to_numpy()
+        if self.properties[self.__HAS_HEADER_PROPERTY]:
+            return [exposed_type(**row) for row in df.to_dict(orient="records")]
+        return [exposed_type(*row) for row in df.itertuples(index=False)]
+
     def _write(self, data: Any):
         if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
             data.to_csv(self._path, index=False)
         else:
             pd.DataFrame(data).to_csv(self._path, index=False)
 
+    def _append(self, data: Any):
+        df = data if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)) else pd.DataFrame(data)
+        has_header = self.properties[self.__HAS_HEADER_PROPERTY]
+        if not isfile(self._path) or os.path.getsize(self._path) == 0:
+            df.to_csv(self._path, index=False, header=has_header)
+            return
+        with open(self._path, newline="") as csv_file:
+            header = next(csv.reader(csv_file), [])
+        columns = [str(column) for column in df.columns]
+        if has_header:
+            is_compatible = sorted(columns) == sorted(header)
+        else:
+            is_compatible = len(columns) == len(header)
+        if not is_compatible:
+            raise DataNodeWritingError(
+                f"Data node {self.id} cannot append data with the columns {columns} to a CSV file with the columns "
+                f"{header}."
+            )
+        if has_header and columns != header:  # Align the columns with the file.
+            df = df[[df.columns[columns.index(column)] for column in header]]
+        df.to_csv(self._path, index=False, mode="a", header=False)
+
+    def _write_batches(self, batches: Iterable):
+        mode = "w"
+        for batch in batches:
+            df = batch if isinstance(batch, (pd.DataFrame, modin_pd.DataFrame)) else pd.DataFrame(batch)
+            df.to_csv(self._path, index=False, mode=mode, header=mode == "w")
+            mode = "a"
+        if mode == "w":  # No batch was yielded.
+            open(self._path, "w").close()
+
     def write_with_column_names(self, data: Any, columns: List[str] = None, job_id: Optional[JobId] = None):
         """Write a selection of columns.
 
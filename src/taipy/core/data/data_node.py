@@ -9,12 +9,14 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import itertools
 import os
+import threading
 import uuid
 from abc import abstractmethod
 from datetime import datetime, timedelta
 from functools import reduce
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import modin.pandas as modin_pd
 import numpy as np
@@ -30,7 +32,7 @@ from .._entity._properties import _Properties
 from .._entity._reload import _Reloader, _self_reload, _self_setter
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._warnings import _warn_deprecated
-from ..exceptions.exceptions import NoData
+from ..exceptions.exceptions import AppendNotSupported, NoData
 from ..job.job_id import JobId
 from ._filter import _FilterDataNode
 from .data_node_id import DataNodeId, Edit
@@ -77,8 +79,11 @@ class DataNode(_Entity, _Labeled):
     _ID_PREFIX = "DATANODE"
     __ID_SEPARATOR = "_"
     __logger = _TaipyLogger._get_logger()
+    # The edits are saved one at a time since the repository is not thread-safe.
+    __edits_lock = threading.Lock()
     _REQUIRED_PROPERTIES: List[str] = []
     _MANAGER_NAME = "data"
+    _EDIT_PARTITIONS_KEY = "partitions"
     __PATH_KEY = "path"
 
     def __init__(
@@ -155,7 +160,7 @@ class DataNode(_Entity, _Labeled):
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
     def last_edit_date(self):
-        last_modified_datetime = self.__get_last_modified_datetime()
+        last_modified_datetime = self._get_last_modified_datetime()
         if last_modified_datetime and last_modified_datetime > self._last_edit_date:
             return last_modified_datetime
         else:
@@ -288,7 +293,7 @@ class DataNode(_Entity, _Labeled):
             return self._properties[protected_attribute_name]
         raise AttributeError(f"{attribute_name} is not an attribute of data node {self.id}")
 
-    def __get_last_modified_datetime(self) -> Optional[datetime]:
+    def _get_last_modified_datetime(self) -> Optional[datetime]:
         path = self._properties.get(self.__PATH_KEY, None)
         if path and os.path.isfile(path):
             return datetime.fromtimestamp(os.path.getmtime(path))
@@ -344,14 +349,38 @@ class DataNode(_Entity, _Labeled):
             data (Any): The data to write to this data node.
             job_id (JobId^): An optional identifier of the writer.
             **kwargs (dict[str, any]): Extra information to attach to the edit document
-                corresponding to this write.
+                corresponding to this write. The *partitions* entry lists the keys of the
+                partitions changed by this write, so that the incremental tasks reading this
+                data node only recompute these partitions.
         """
         from ._data_manager_factory import _DataManagerFactory
 
         self._write(data)
-        self._track_edit(job_id=job_id, **kwargs)
-        self.unlock_edit()
-        _DataManagerFactory._build_manager()._set(self)
+        with self.__edits_lock:
+            self._track_edit(job_id=job_id, **kwargs)
+            self.unlock_edit()
+            _DataManagerFactory._build_manager()._set(self)
+
+    def append(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Append some data to the data of this data node.
+
+        Unlike `(DataNode.)write()^`, the data already stored is not rewritten.
+
+        Parameters:
+            data (Any): The data to append to this data node.
+            job_id (JobId^): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+        Raises:
+            AppendNotSupported^: If the storage type of the data node does not support appending data.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        self._append(data)
+        with self.__edits_lock:
+            self._track_edit(job_id=job_id, **kwargs)
+            self.unlock_edit()
+            _DataManagerFactory._build_manager()._set(self)
 
     def _track_edit(self, **options):
         """Add Edit tracking information to this data node."""
@@ -505,6 +534,29 @@ class DataNode(_Entity, _Labeled):
     def _write(self, data):
         raise NotImplementedError
 
+    def _append(self, data):
+        raise AppendNotSupported(f"Data node {self.id} of storage type {self.storage_type()} cannot append data.")
+
+    def _write_batches(self, batches: Iterable):
+        """Write the data yielded batch by batch by a generator task.
+
+        Data nodes that cannot append to their data write the concatenation of all the batches at the end.
+        """
+        self._write(self._concatenate(list(batches)))
+
+    @staticmethod
+    def _concatenate(batches: List[Any]) -> Any:
+        """Concatenate dataframes, series, arrays or lists. Other types of batches are returned as a list."""
+        if batches and all(isinstance(batch, (pd.DataFrame, pd.Series)) for batch in batches):
+            return pd.concat(batches)
+        if batches and all(isinstance(batch, (modin_pd.DataFrame, modin_pd.Series)) for batch in batches):
+            return modin_pd.concat(batches)
+        if batches and all(isinstance(batch, np.ndarray) for batch in batches):
+            return np.concatenate(batches)
+        if all(isinstance(batch, list) for batch in batches):
+            return list(itertools.chain.from_iterable(batches))
+        return batches
+
     def __getitem__(self, items):
         return _FilterDataNode(self.id, self._read())[items]
 
@@ -23,6 +23,7 @@ from taipy.config.common.scope import Scope
 from .._backup._backup import _replace_in_backup_file
 from .._entity._reload import _self_reload
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import AppendNotSupported
 from ._abstract_file import _AbstractFileDataNode
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -54,7 +55,9 @@ class JSONDataNode(DataNode, _AbstractFileDataNode):
         encoder (json.JSONEncoder): The JSON encoder that is used to write into the JSON file.
         decoder (json.JSONDecoder): The JSON decoder that is used to read from the JSON file.
         properties (dict[str, Any]): A dictionary of additional properties. The _properties_
-            must have a _"default_path"_ or _"path"_ entry with the path of the JSON file.
+            must have a _"default_path"_ or _"path"_ entry with the path of the JSON file. If the _"lines"_
+            entry is True, the file is stored in the JSON Lines format: the data is a list and each
+            element is written on its own line, so that data can be appended to the file.
     """
 
     __STORAGE_TYPE = "json"
@@ -63,6 +66,7 @@ class JSONDataNode(DataNode, _AbstractFileDataNode):
     __PATH_KEY = "path"
     _ENCODER_KEY = "encoder"
     _DECODER_KEY = "decoder"
+    __LINES_KEY = "lines"
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -149,11 +153,29 @@ class JSONDataNode(DataNode, _AbstractFileDataNode):
 
     def _read(self):
         with open(self._path, "r") as f:
+            if self.properties.get(self.__LINES_KEY):
+                return [json.loads(line, cls=self._decoder) for line in f if line.strip()]
             return json.load(f, cls=self._decoder)
 
     def _write(self, data: Any):
         with open(self._path, "w") as f:  # type: ignore
-            json.dump(data, f, indent=4, cls=self._encoder)
+            if self.properties.get(self.__LINES_KEY):
+                self.__write_lines(f, data)
+            else:
+                json.dump(data, f, indent=4, cls=self._encoder)
+
+    def _append(self, data: Any):
+        if not self.properties.get(self.__LINES_KEY):
+            raise AppendNotSupported(
+                f"Data node {self.id} cannot append data to a JSON document. Set its *lines* property to True to "
+                "store the data in the JSON Lines format."
+            )
+        with open(self._path, "a") as f:  # type: ignore
+            self.__write_lines(f, data)
+
+    def __write_lines(self, f, data: Any):
+        for element in data if isinstance(data, list) else [data]:
+            f.write(json.dumps(element, cls=self._encoder) + "\n")
 
 
 class _DefaultJSONEncoder(json.JSONEncoder):
@@ -9,10 +9,11 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import itertools
 from datetime import datetime, timedelta
 from inspect import isclass
 from pydoc import locate
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import pymongo
 
@@ -20,8 +21,10 @@ from taipy.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import InvalidCustomDocument, MissingRequiredProperty
+from ._mongo_client_registry import _MongoClientRegistry
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
 
 
 class MongoCollectionDataNode(DataNode):
@@ -60,11 +63,22 @@ class MongoCollectionDataNode(DataNode):
             - _"db_port"_ `(int)`: The database port. The default value is 27017.\n
             - _"db_extra_args"_ `(Dict[str, Any])`: A dictionary of additional arguments to be passed into database
                 connection string.\n
+            - _"batch_size"_ `(int)`: The number of documents fetched by each round trip to the database when
+                reading the collection.\n
     """
 
     __STORAGE_TYPE = "mongo_collection"
     _CUSTOM_DOCUMENT_PROPERTY = "custom_document"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
+    __BATCH_SIZE_KEY = "batch_size"
+    __FILTER_OPERATORS = {
+        Operator.EQUAL: "$eq",
+        Operator.NOT_EQUAL: "$ne",
+        Operator.LESS_THAN: "$lt",
+        Operator.LESS_OR_EQUAL: "$lte",
+        Operator.GREATER_THAN: "$gt",
+        Operator.GREATER_OR_EQUAL: "$gte",
+    }
     _REQUIRED_PROPERTIES: List[str] = [
         "db_name",
         "collection_name",
@@ -110,14 +124,7 @@ class MongoCollectionDataNode(DataNode):
             **properties,
         )
 
-        mongo_client = _connect_mongodb(
-            db_host=properties.get("db_host", "localhost"),
-            db_port=properties.get("db_port", 27017),
-            db_username=properties.get("db_username", ""),
-            db_password=properties.get("db_password", ""),
-            db_extra_args=properties.get(self.__DB_EXTRA_ARGS_KEY, {}),
-        )
-        self.collection = mongo_client[properties.get("db_name", "")][properties.get("collection_name", "")]
+        self._collection = None
 
         self.custom_document = properties[self._CUSTOM_DOCUMENT_PROPERTY]
 
@@ -134,6 +141,27 @@ class MongoCollectionDataNode(DataNode):
         if not self._last_edit_date:
             self._last_edit_date = datetime.now()
 
+    @property
+    def collection(self):
+        """The Mongo collection, connected on the first read or write with a client shared across the data nodes."""
+        if self._collection is None:
+            mongo_client = _connect_mongodb(
+                db_host=self._properties.get("db_host", "localhost"),
+                db_port=self._properties.get("db_port", 27017),
+                db_username=self._properties.get("db_username", ""),
+                db_password=self._properties.get("db_password", ""),
+                db_extra_args=self._properties.get(self.__DB_EXTRA_ARGS_KEY, {}),
+            )
+            self._collection = mongo_client[self._properties.get("db_name", "")][
+                self._properties.get("collection_name", "")
+            ]
+        return self._collection
+
+    def __getstate__(self):
+        state = dict(super().__getstate__())
+        state["_collection"] = None
+        return state
+
     def _check_custom_document(self, custom_document):
         if not isclass(custom_document):
             raise InvalidCustomDocument(
@@ -149,10 +177,95 @@ class MongoCollectionDataNode(DataNode):
 
         return list(map(lambda row: self._decoder(row), cursor))
 
-    def _read_by_query(self):
-        """Query from a Mongo collection, exclude the _id field"""
+    def filter(
+        self,
+        operators: Union[List, Tuple],
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ):
+        """Read and filter the documents of the collection.
+
+        The documents are filtered by the provided list of 3-tuples (key, value, `Operator^`), joined based on the
+        join operator (_AND_ or _OR_). The filters are compiled into the query sent to the database, so that only the
+        matching documents are transferred.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): The 3-tuples (key, value, `Operator^`) the documents must match.
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[str]]): The fields to read. All the fields are read by default. The *"_id"* field
+                is only read if it is one of the *columns*.
+            limit (Optional[int]): The maximum number of documents to read.
+            order_by (Optional[Union[str, List[str]]]): The fields by which the documents are sorted. The order of a
+                field prefixed with *"-"* is descending.
+        Returns:
+            The list of the filtered documents, decoded as custom documents.
+        """
+        if join_operator not in [JoinOperator.AND, JoinOperator.OR]:
+            return NotImplementedError
+        cursor = self._read_by_query(
+            self._build_filter_query(operators, join_operator),
+            projection=self.__projection(columns),
+            sort=self.__sort(order_by),
+            limit=limit or 0,
+        )
+        return list(map(lambda row: self._decoder(row), cursor))
+
+    def read_chunks(self, chunksize: int, after_id: Optional[Any] = None) -> Iterator[List[Any]]:
+        """Read the documents by chunks, without loading all the documents in memory.
+
+        The documents are read in the order of their *"_id"*, each chunk being fetched in one round trip to the
+        database. The *"_id"* of the last document read can be used to resume the reading later on, and only read the
+        documents inserted in the meantime, the default *ObjectId* identifiers increasing with time.
 
-        return self.collection.find()
+        Parameters:
+            chunksize (int): The number of documents of each chunk.
+            after_id (Optional[Any]): If not None, only the documents with a greater *"_id"* are read.
+        Returns:
+            A generator of the lists of the documents, decoded as custom documents.
+        """
+        query = {} if after_id is None else {"_id": {"$gt": after_id}}
+        cursor = self.collection.find(query, sort=[("_id", pymongo.ASCENDING)], batch_size=chunksize)
+        while chunk := list(itertools.islice(cursor, chunksize)):
+            yield list(map(lambda row: self._decoder(row), chunk))
+
+    def _build_filter_query(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Dict:
+        if len(operators) > 0 and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        clauses = [{key: {self.__FILTER_OPERATORS[operator]: value}} for key, value, operator in operators]
+        if not clauses:
+            return {}
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"$or" if join_operator == JoinOperator.OR else "$and": clauses}
+
+    @staticmethod
+    def __projection(columns: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        if not columns:
+            return None
+        return {"_id": 0, **{column: 1 for column in columns}}
+
+    @staticmethod
+    def __sort(order_by: Optional[Union[str, List[str]]]) -> Optional[List[Tuple[str, int]]]:
+        fields = [order_by] if isinstance(order_by, str) else order_by or []
+        return [
+            (field[1:], pymongo.DESCENDING) if field.startswith("-") else (field, pymongo.ASCENDING) for field in fields
+        ] or None
+
+    def _read_by_query(
+        self,
+        query: Optional[Dict] = None,
+        projection: Optional[Dict[str, int]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: int = 0,
+    ):
+        """Query from a Mongo collection, fetching the documents by batches of the configured size."""
+        kwargs: Dict[str, Any] = {"sort": sort, "limit": limit}
+        if batch_size := self._properties.get(self.__BATCH_SIZE_KEY):
+            kwargs["batch_size"] = int(batch_size)
+        return self.collection.find(query or {}, projection, **kwargs)
 
     def _write(self, data) -> None:
         """Check data against a collection of types to handle insertion on the database."""
@@ -204,7 +317,7 @@ class MongoCollectionDataNode(DataNode):
 def _connect_mongodb(
     db_host: str, db_port: int, db_username: str, db_password: str, db_extra_args: Dict[str, str]
 ) -> pymongo.MongoClient:
-    """Create a connection to a Mongo database.
+    """Get the client connected to a Mongo database, shared by all the data nodes of the process.
 
     Args:
         db_host (str): the database host.
@@ -227,4 +340,4 @@ def _connect_mongodb(
 
     connection_string = f"mongodb://{auth_str}{db_host}:{db_port}{extra_args_str}"
 
-    return pymongo.MongoClient(connection_string)
+    return _MongoClientRegistry._get_client(connection_string)
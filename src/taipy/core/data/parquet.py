@@ -9,25 +9,36 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import functools
+import json
+import operator
 import os
+import shutil
+import uuid
 from datetime import datetime, timedelta
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import quote
 
 import modin.pandas as modin_pd
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from taipy.config.common.scope import Scope
 
 from .._backup._backup import _replace_in_backup_file
 from .._entity._reload import _self_reload
 from .._version._version_manager_factory import _VersionManagerFactory
-from ..exceptions.exceptions import UnknownCompressionAlgorithm, UnknownParquetEngine
+from ..exceptions.exceptions import AppendNotSupported, UnknownCompressionAlgorithm, UnknownParquetEngine
 from ..job.job_id import JobId
 from ._abstract_file import _AbstractFileDataNode
 from ._abstract_tabular import _AbstractTabularDataNode
+from ._filter import _FilterDataNode
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
 
 
 class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode):
@@ -72,6 +83,9 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
                 The parameters in *"read_kwargs"* and *"write_kwargs"* have a
                 **higher precedence** than the top-level parameters which are also passed to
                 Pandas.
+            - *"partition_cols"* (`Optional[List[str]]`): The columns by which the data is partitioned. If
+                set, the data is stored as a folder with a sub-folder per partition (hive layout). Writing
+                data only replaces the partitions it contains.
     """
 
     __STORAGE_TYPE = "parquet"
@@ -89,6 +103,25 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
     __VALID_COMPRESSION_ALGORITHMS = ["snappy", "gzip", "brotli", "none"]
     __READ_KWARGS_PROPERTY = "read_kwargs"
     __WRITE_KWARGS_PROPERTY = "write_kwargs"
+    __PARTITION_COLS_PROPERTY = "partition_cols"
+    __MANIFEST_FILE_NAME = "_taipy_manifest.json"
+    __PARTITION_BY_CHUNKS = "chunks"
+    __FILTER_OPERATORS = {
+        Operator.EQUAL: "==",
+        Operator.NOT_EQUAL: "!=",
+        Operator.LESS_THAN: "<",
+        Operator.LESS_OR_EQUAL: "<=",
+        Operator.GREATER_THAN: ">",
+        Operator.GREATER_OR_EQUAL: ">=",
+    }
+    __COMPARISONS = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -200,8 +233,153 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
     def _read_as_modin_dataframe(self, read_kwargs: Dict) -> modin_pd.DataFrame:
         return modin_pd.read_parquet(self._path, **read_kwargs)
 
+    def _get_partitions(self, partition_by: str, partition_size: int) -> List[Dict[str, Any]]:
+        """Split the rows of the Parquet file into partitions that can be read independently.
+
+        Parameters:
+            partition_by (str): *"chunks"* to split the file into chunks of row groups of about *partition_size*
+                rows, or the name of a column to make a partition per distinct value of this column.
+            partition_size (int): The number of rows of each chunk. A chunk contains at least one row group.
+        Returns:
+            The descriptions of the partitions, to pass to `_read_partition()`.
+        """
+        if partition_by != self.__PARTITION_BY_CHUNKS:
+            kwargs = {"columns": [partition_by], self.__ENGINE_PROPERTY: self.properties[self.__ENGINE_PROPERTY]}
+            values = self._read_as_pandas_dataframe(kwargs)[partition_by].unique()
+            return [{"column": partition_by, "value": value} for value in values.tolist()]
+        if isdir(self._path):  # A partitioned dataset: each file is a chunk.
+            return [
+                {"file": os.path.join(root, file)}
+                for root, _, files in sorted(os.walk(self._path))
+                for file in sorted(files)
+                if not file.startswith((".", "_"))
+            ]
+
+        partitions: List[Dict[str, Any]] = []
+        row_groups: List[int] = []
+        nb_rows = 0
+        metadata = pq.ParquetFile(self._path).metadata
+        for i in range(metadata.num_row_groups):
+            row_groups.append(i)
+            nb_rows += metadata.row_group(i).num_rows
+            if nb_rows >= partition_size:
+                partitions.append({"row_groups": row_groups})
+                row_groups, nb_rows = [], 0
+        if row_groups:
+            partitions.append({"row_groups": row_groups})
+        return partitions
+
+    def _read_partition(self, partition: Dict[str, Any]):
+        """Read the rows of a partition returned by `_get_partitions()`, in the exposed type of the data node."""
+        if "row_groups" in partition:
+            df = pq.ParquetFile(self._path).read_row_groups(partition["row_groups"]).to_pandas()
+        elif "file" in partition:
+            df = pd.read_parquet(partition["file"], engine=self.properties[self.__ENGINE_PROPERTY])
+        else:
+            column, value = partition["column"], partition["value"]
+            kwargs = {**self.properties[self.__READ_KWARGS_PROPERTY], "filters": [(column, "==", value)]}
+            kwargs[self.__ENGINE_PROPERTY] = self.properties[self.__ENGINE_PROPERTY]
+            df = self._read_as_pandas_dataframe(kwargs)
+            df = df[df[column] == value]
+        exposed_type = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self.__EXPOSED_TYPE_PANDAS:
+            return df
+        if exposed_type == self.__EXPOSED_TYPE_MODIN:
+            return modin_pd.DataFrame(df)
+        if exposed_type == self.__EXPOSED_TYPE_NUMPY:
+            return df.to_numpy()
+        return [exposed_type(**row) for row in df.to_dict(orient="records")]
+
     def _write(self, data: Any):
-        self.write_with_kwargs(data)
+        self.__write(data, {})
+
+    def write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Write some data to this data node.
+
+        When the data is written in a dataset partitioned by a single column (the *partition_cols* entry of the
+        *write_kwargs* property), the partitions written are recorded in the edit.
+
+        Parameters:
+            data (Any): The data to write to this data node.
+            job_id (JobId^): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+        """
+        partitions = self.__get_written_partitions(data, self.__get_write_kwargs({}))
+        if partitions is not None:
+            kwargs.setdefault(self._EDIT_PARTITIONS_KEY, partitions)
+        super().write(data, job_id, **kwargs)
+
+    def append(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Append some data to the data of this data node.
+
+        The data is added in new files of a dataset stored as a folder. A Parquet file can only be extended with
+        the *fastparquet* engine, which adds a row group to it.
+        When the dataset is partitioned by a single column, the partitions written are recorded in the edit.
+
+        Parameters:
+            data (Any): The data to append to this data node.
+            job_id (JobId^): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+        Raises:
+            AppendNotSupported^: If the data node is a Parquet file written with the *pyarrow* engine.
+        """
+        partitions = self.__get_written_partitions(data, self.__get_write_kwargs({}))
+        if partitions is not None:
+            kwargs.setdefault(self._EDIT_PARTITIONS_KEY, partitions)
+        super().append(data, job_id, **kwargs)
+
+    def _append(self, data: Any):
+        if not os.path.exists(self._path):
+            self.__write(data, {})
+            return
+        if isinstance(data, modin_pd.DataFrame):
+            data = data._to_pandas()
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        kwargs = self.__get_write_kwargs({})
+        if isdir(self._path):
+            if partition_cols := kwargs.get(self.__PARTITION_COLS_PROPERTY):
+                # The files are added to the folders of their partitions.
+                df.to_parquet(self._path, **kwargs)
+                self.__update_manifest(df, partition_cols)
+            else:
+                df.to_parquet(os.path.join(self._path, f"part-{uuid.uuid4().hex}.parquet"), **kwargs)
+        elif kwargs[self.__ENGINE_PROPERTY] == "fastparquet":
+            df.to_parquet(self._path, append=True, **kwargs)
+        else:
+            # The pyarrow engine would have to rewrite all the row groups of the file.
+            raise AppendNotSupported(
+                f"Data node {self.id} cannot append data to a Parquet file with the pyarrow engine. Store the data "
+                "in a folder to append it in new files."
+            )
+
+    def _write_batches(self, batches: Iterable):
+        if (
+            self.properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or self.properties[self.__WRITE_KWARGS_PROPERTY]
+            or self.properties.get(self.__PARTITION_COLS_PROPERTY)
+        ):
+            return super()._write_batches(batches)
+        writer = None
+        try:
+            for batch in batches:
+                if isinstance(batch, modin_pd.DataFrame):
+                    batch = batch._to_pandas()
+                df = batch if isinstance(batch, pd.DataFrame) else pd.DataFrame(batch)
+                if writer is None:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    writer = pq.ParquetWriter(
+                        self._path, table.schema, compression=self.properties[self.__COMPRESSION_PROPERTY] or "none"
+                    )
+                else:
+                    table = pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:  # No batch was yielded.
+            pd.DataFrame().to_parquet(self._path)
 
     def write_with_kwargs(self, data: Any, job_id: Optional[JobId] = None, **write_kwargs):
         """Write the data referenced by this data node.
@@ -214,17 +392,197 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
             **write_kwargs (dict[str, any]): The keyword arguments passed to the function
                 `pandas.DataFrame.to_parquet()`.
         """
+        kwargs = self.__write(data, write_kwargs)
+        self._track_edit(
+            timestamp=datetime.now(),
+            job_id=job_id,
+            **{self._EDIT_PARTITIONS_KEY: self.__get_written_partitions(data, kwargs)},
+        )
+
+    def __write(self, data: Any, write_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs = self.__get_write_kwargs(write_kwargs)
+        partition_cols = kwargs.get(self.__PARTITION_COLS_PROPERTY)
+        if partition_cols and kwargs[self.__ENGINE_PROPERTY] == "pyarrow":
+            kwargs.setdefault("existing_data_behavior", "delete_matching")  # Only replace the written partitions.
+        if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
+            data.to_parquet(self._path, **kwargs)
+        else:
+            data = pd.DataFrame(data)
+            data.to_parquet(self._path, **kwargs)
+        if partition_cols:
+            self.__update_manifest(data, partition_cols)
+        return kwargs
+
+    def __get_write_kwargs(self, write_kwargs: Dict[str, Any]) -> Dict[str, Any]:
         kwargs = {
             self.__ENGINE_PROPERTY: self.properties[self.__ENGINE_PROPERTY],
             self.__COMPRESSION_PROPERTY: self.properties[self.__COMPRESSION_PROPERTY],
         }
+        if partition_cols := self.properties.get(self.__PARTITION_COLS_PROPERTY):
+            kwargs[self.__PARTITION_COLS_PROPERTY] = partition_cols
         kwargs.update(self.properties[self.__WRITE_KWARGS_PROPERTY])
         kwargs.update(write_kwargs)
-        if isinstance(data, (pd.DataFrame, modin_pd.DataFrame)):
-            data.to_parquet(self._path, **kwargs)
-        else:
-            pd.DataFrame(data).to_parquet(self._path, **kwargs)
-        self._track_edit(timestamp=datetime.now(), job_id=job_id)
+        return kwargs
+
+    def __update_manifest(self, data: Any, partition_cols: List[str]):
+        """Record the date of the last write of the partitions in the manifest of the dataset.
+
+        The manifest is the only file checked to get the last modification date of the dataset, instead of all
+        the files of the partitions.
+        """
+        if isinstance(data, modin_pd.DataFrame):
+            data = data._to_pandas()
+        manifest_path = os.path.join(self._path, self.__MANIFEST_FILE_NAME)
+        manifest: Dict[str, Any] = {"partitions": {}}
+        if isfile(manifest_path):
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        manifest[self.__PARTITION_COLS_PROPERTY] = list(partition_cols)
+        now = datetime.now().isoformat()
+        for values in data[partition_cols].drop_duplicates().itertuples(index=False):
+            manifest["partitions"]["/".join(f"{c}={v}" for c, v in zip(partition_cols, values))] = now
+        temp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+        os.replace(temp_path, manifest_path)
+
+    def _can_replace_partitions(self, column: str) -> bool:
+        """Check if writing some partitions of the given column replaces them without rewriting the other ones.
+
+        It is the case of a dataset partitioned by this single column and written with the *pyarrow* engine.
+        """
+        kwargs = self.__get_write_kwargs({})
+        partition_cols = kwargs.get(self.__PARTITION_COLS_PROPERTY)
+        return bool(partition_cols) and list(partition_cols) == [column] and kwargs[self.__ENGINE_PROPERTY] == "pyarrow"
+
+    def _delete_partitions(self, column: str, values: Iterable[str]):
+        """Delete the folders of some partitions of a dataset partitioned by a single column."""
+        manifest_path = os.path.join(self._path, self.__MANIFEST_FILE_NAME)
+        manifest: Dict[str, Any] = {"partitions": {}}
+        if isfile(manifest_path):
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        for value in values:
+            shutil.rmtree(os.path.join(self._path, f"{column}={quote(str(value), safe='')}"), ignore_errors=True)
+            manifest["partitions"].pop(f"{column}={value}", None)
+        if isfile(manifest_path):
+            temp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=4)
+            os.replace(temp_path, manifest_path)
+
+    def _get_last_modified_datetime(self) -> Optional[datetime]:
+        manifest_path = os.path.join(self._properties.get(self.__PATH_KEY, ""), self.__MANIFEST_FILE_NAME)
+        if isfile(manifest_path):
+            return datetime.fromtimestamp(os.path.getmtime(manifest_path))
+        return super()._get_last_modified_datetime()
+
+    def read_partitions(self, **partitions):
+        """Read a subset of the partitions of a partitioned dataset.
+
+        Only the folders of the selected partitions are read.
+
+        Parameters:
+            **partitions (dict[str, any]): The values of the partition columns of the partitions to read, by
+                column name. A list of values selects several partitions.
+        Returns:
+            The data of the selected partitions, in the exposed type of the data node.
+        """
+        filters = [
+            (column, "in", list(values)) if isinstance(values, (list, tuple, set)) else (column, "==", values)
+            for column, values in partitions.items()
+        ]
+        if not filters:
+            return self.read_with_kwargs()
+        return self.read_with_kwargs(filters=filters)
+
+    @staticmethod
+    def __get_written_partitions(data: Any, write_kwargs: Dict[str, Any]) -> Optional[List[str]]:
+        """Return the keys of the partitions of a dataset partitioned by a single column written by the data."""
+        partition_cols = write_kwargs.get(ParquetDataNode.__PARTITION_COLS_PROPERTY)
+        if not partition_cols or len(partition_cols) != 1:
+            return None
+        if not isinstance(data, (pd.DataFrame, modin_pd.DataFrame)) or partition_cols[0] not in data.columns:
+            return None
+        return sorted({str(value) for value in data[partition_cols[0]].unique().tolist()})
+
+    def filter(
+        self, operators: Union[List, Tuple], join_operator=JoinOperator.AND, columns: Optional[List[str]] = None
+    ):
+        """Read and filter the data referenced by this data node.
+
+        The data is filtered by the provided list of 3-tuples (key, value, `Operator^`), joined based on the
+        join operator (_AND_ or _OR_). With the *"pyarrow"* engine, the filters are passed to the Parquet reader:
+        the row groups and the partitions whose statistics do not match are not read.
+
+        Parameters:
+            operators (Union[List[Tuple], Tuple]): The 3-tuples (key, value, `Operator^`) the rows must match.
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[str]]): The columns to read. All the columns are read by default.
+        """
+        if self.properties[self.__ENGINE_PROPERTY] != "pyarrow" or join_operator not in [
+            JoinOperator.AND,
+            JoinOperator.OR,
+        ]:
+            data = super().filter(operators, join_operator)
+            return data[columns] if columns and isinstance(data, (pd.DataFrame, modin_pd.DataFrame)) else data
+        read_kwargs: Dict[str, Any] = {"columns": columns} if columns else {}
+        if filters := self.__to_filters(operators, join_operator):
+            read_kwargs["filters"] = self.__to_expression(filters)
+        return self.read_with_kwargs(**read_kwargs)
+
+    @classmethod
+    def __to_filters(cls, operators: Union[List, Tuple], join_operator: JoinOperator) -> List[List[Tuple]]:
+        """Translate the filter 3-tuples into filters in disjunctive normal form."""
+        if len(operators) == 0:
+            return []
+        if not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        predicates = [(key, cls.__FILTER_OPERATORS[op], value) for key, value, op in operators]
+        if join_operator == JoinOperator.OR:
+            return [[predicate] for predicate in predicates]
+        return [predicates]
+
+    @classmethod
+    def __to_expression(cls, filters: List[List[Tuple]]) -> pc.Expression:
+        """Translate filters in disjunctive normal form into a pyarrow expression.
+
+        The tuples of pyarrow filters cannot test missing values: as in pandas, a row with a missing value must
+        match a `!=` comparison, which requires an expression.
+        """
+        conjunctions = []
+        for conjunction in filters:
+            comparisons = []
+            for column, comparison, value in conjunction:
+                field = pc.field(column)
+                if comparison == "!=":
+                    comparisons.append((field != value) | field.is_null())
+                else:
+                    comparisons.append(cls.__COMPARISONS[comparison](field, value))
+            conjunctions.append(functools.reduce(operator.and_, comparisons))
+        return functools.reduce(operator.or_, conjunctions)
+
+    def __getitem__(self, items):
+        """Select columns or rows of the data.
+
+        With the *"pyarrow"* engine and a dataframe exposed type, only the selected columns are read, and the rows
+        selected by comparisons of columns of this data node, like `dn[(dn["a"] > 1) & (dn["b"] == 2)]`, are
+        filtered by the Parquet reader.
+        """
+        exposed_type = self.properties[self.__EXPOSED_TYPE_PROPERTY]
+        if self.properties[self.__ENGINE_PROPERTY] != "pyarrow" or exposed_type not in [
+            self.__EXPOSED_TYPE_PANDAS,
+            self.__EXPOSED_TYPE_MODIN,
+        ]:
+            return super().__getitem__(items)
+        if isinstance(items, _FilterDataNode) and items.filters is not None and items.data_node_id == self.id:
+            return _FilterDataNode(self.id, self.read_with_kwargs(filters=self.__to_expression(items.filters)))
+        if isinstance(items, str):
+            return _FilterDataNode(self.id, self.read_with_kwargs(columns=[items])[items], column=items)
+        if isinstance(items, list) and items and all(isinstance(item, str) for item in items):
+            return _FilterDataNode(self.id, self.read_with_kwargs(columns=items))
+        return super().__getitem__(items)
 
     def read_with_kwargs(self, **read_kwargs):
         """Read data from this data node.
@@ -242,7 +600,7 @@ class ParquetDataNode(DataNode, _AbstractFileDataNode, _AbstractTabularDataNode)
             )
             return None
 
-        kwargs = self.properties[self.__READ_KWARGS_PROPERTY]
+        kwargs = dict(self.properties[self.__READ_KWARGS_PROPERTY])
         kwargs.update(
             {
                 self.__ENGINE_PROPERTY: self.properties[self.__ENGINE_PROPERTY],
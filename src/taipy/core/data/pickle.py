@@ -12,7 +12,7 @@
 import os
 import pickle
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 import modin.pandas as pd
 
@@ -21,7 +21,10 @@ from taipy.config.common.scope import Scope
 from .._backup._backup import _replace_in_backup_file
 from .._entity._reload import _self_reload
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import InvalidTransport, NoData
+from ..job.job_id import JobId
 from ._abstract_file import _AbstractFileDataNode
+from ._shared_memory import _DataInFile, _SharedMemoryReference, _SharedMemoryRegistry
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
 
@@ -55,6 +58,12 @@ class PickleDataNode(DataNode, _AbstractFileDataNode):
             _"default_data"_ value.
             If the _properties_ dictionary contains a _"default_path"_ or _"path"_ entry, the data will be stored
             using the corresponding value as the name of the pickle file.
+            If the _properties_ dictionary contains a _"transport"_ entry set to _"shared_memory"_, the data is kept
+            in a shared memory segment that other processes map without copying NumPy or Arrow buffers, and the
+            pickle file only holds a reference to the segment. The orchestrator keeps the segment until the
+            submissions using it are over, then writes the data to the pickle file. Data written outside of a job,
+            or larger than the _"shared_memory_budget"_ entry (in bytes, 1 GiB by default), is written to the pickle
+            file.
     """
 
     __STORAGE_TYPE = "pickle"
@@ -62,7 +71,14 @@ class PickleDataNode(DataNode, _AbstractFileDataNode):
     __DEFAULT_PATH_KEY = "default_path"
     __DEFAULT_DATA_KEY = "default_data"
     __IS_GENERATED_KEY = "is_generated"
+    __TRANSPORT_KEY = "transport"
+    _TRANSPORT_FILE = "file"
+    _TRANSPORT_SHARED_MEMORY = "shared_memory"
+    __VALID_TRANSPORTS = [_TRANSPORT_FILE, _TRANSPORT_SHARED_MEMORY]
+    __SHARED_MEMORY_BUDGET_KEY = "shared_memory_budget"
+    __DEFAULT_SHARED_MEMORY_BUDGET = 1 << 30
     _REQUIRED_PROPERTIES: List[str] = []
+    _is_written_by_job = False
 
     def __init__(
         self,
@@ -87,6 +103,11 @@ class PickleDataNode(DataNode, _AbstractFileDataNode):
             properties[self.__PATH_KEY] = self._path
         self._is_generated = properties.get(self.__IS_GENERATED_KEY, self._path is None)
         properties[self.__IS_GENERATED_KEY] = self._is_generated
+        if properties.get(self.__TRANSPORT_KEY, self._TRANSPORT_FILE) not in self.__VALID_TRANSPORTS:
+            raise InvalidTransport(
+                f"Invalid transport {properties[self.__TRANSPORT_KEY]}. Supported values are "
+                f"{', '.join(self.__VALID_TRANSPORTS)}"
+            )
         super().__init__(
             config_id,
             scope,
@@ -130,13 +151,102 @@ class PickleDataNode(DataNode, _AbstractFileDataNode):
     def is_generated(self) -> bool:
         return self._is_generated
 
+    def write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Write some data to this data node.
+
+        With the *"shared_memory"* transport, the data written by a job is kept in shared memory.
+
+        Parameters:
+            data (Any): The data to write to this data node.
+            job_id (JobId^): An optional identifier of the writer.
+            **kwargs (dict[str, any]): Extra information to attach to the edit document
+                corresponding to this write.
+        """
+        self._is_written_by_job = job_id is not None
+        try:
+            super().write(data, job_id, **kwargs)
+        finally:
+            self._is_written_by_job = False
+
     def _read(self):
         os.environ["MODIN_PERSISTENT_PICKLE"] = "True"
+        for _ in range(2):
+            data = self.__load()
+            if not isinstance(data, _SharedMemoryReference):
+                return data
+            try:
+                return _SharedMemoryRegistry._loads(data)
+            except FileNotFoundError:
+                # The segment has been evicted meanwhile, its data is written to the file.
+                continue
+        raise NoData(f"Shared memory segment of data node {self.id} from config {self.config_id} is gone.")
+
+    def __load(self):
         with open(self._path, "rb") as pf:
-            return pickle.load(pf)
+            data = pickle.load(pf)
+            return pickle.load(pf) if isinstance(data, _DataInFile) else data
 
     def _write(self, data):
         if isinstance(data, (pd.DataFrame, pd.Series)):
             os.environ["MODIN_PERSISTENT_PICKLE"] = "True"
+        if not self.__uses_shared_memory():
+            with open(self._path, "wb") as pf:
+                pickle.dump(data, pf)
+            return
+        previous_reference = self._get_shared_memory_reference()
+        reference = None
+        if self._is_written_by_job:
+            # Only the data written by jobs is handed over to other jobs, and kept in shared memory.
+            budget = int(self.properties.get(self.__SHARED_MEMORY_BUDGET_KEY) or self.__DEFAULT_SHARED_MEMORY_BUDGET)
+            reference = _SharedMemoryRegistry._dumps(data, budget=budget)
         with open(self._path, "wb") as pf:
+            if reference:
+                pickle.dump(reference, pf)
+            else:
+                pickle.dump(_DataInFile(), pf)
+                pickle.dump(data, pf)
+        if previous_reference:
+            _SharedMemoryRegistry._release(previous_reference)
+
+    def __uses_shared_memory(self) -> bool:
+        return self.properties.get(self.__TRANSPORT_KEY) == self._TRANSPORT_SHARED_MEMORY
+
+    def _get_shared_memory_reference(self) -> Optional[_SharedMemoryReference]:
+        """Return the reference to the shared memory segment holding the data, if any."""
+        if not self.__uses_shared_memory() or not os.path.exists(self._path):
+            return None
+        try:
+            with open(self._path, "rb") as pf:
+                data = pickle.load(pf)
+        except Exception:
+            return None
+        return data if isinstance(data, _SharedMemoryReference) else None
+
+    def _acquire_shared_memory(self, owner: str):
+        """Keep the shared memory segment holding the data, if any, until `owner` is released.
+
+        Once the segment has no owner anymore, its data is written to the pickle file.
+        """
+        if reference := self._get_shared_memory_reference():
+            _SharedMemoryRegistry._acquire(reference, owner, self.__evict)
+
+    def __evict(self, reference: _SharedMemoryReference):
+        if self._get_shared_memory_reference() != reference:
+            return  # The data has been overwritten since.
+        try:
+            data = _SharedMemoryRegistry._loads(reference)
+        except FileNotFoundError:
+            return
+        stat = os.stat(self._path)
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as pf:
+            pickle.dump(_DataInFile(), pf)
             pickle.dump(data, pf)
+        del data
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, self._path)
+
+    def _release_shared_memory(self):
+        """Free the shared memory segment holding the data, if any."""
+        if reference := self._get_shared_memory_reference():
+            _SharedMemoryRegistry._release(reference)
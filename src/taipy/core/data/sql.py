@@ -64,6 +64,9 @@ class SQLDataNode(_AbstractSQLDataNode):
             - _"db_extra_args"_ `(Dict[str, Any])`: A dictionary of additional arguments to be passed into database
                 connection string.
             - _"exposed_type"_: The exposed type of the data read from SQL query. The default value is `pandas`.
+            - _"db_pool_size"_ `(int)`: The number of connections kept open in the pool of the database engine.
+            - _"db_max_overflow"_ `(int)`: The number of connections that can be opened beyond _"db_pool_size"_.
+            - _"db_pool_recycle"_ `(int)`: The number of seconds after which a connection of the pool is recycled.
     """
 
     __STORAGE_TYPE = "sql"
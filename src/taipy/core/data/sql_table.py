@@ -9,19 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import itertools
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import modin.pandas as modin_pd
 import numpy as np
 import pandas as pd
-from sqlalchemy import MetaData, Table
+from sqlalchemy import MetaData, Table, table, tuple_
+from sqlalchemy.sql import Selectable
 
 from taipy.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
-from ..exceptions.exceptions import MissingRequiredProperty
+from ..exceptions.exceptions import MissingRequiredProperty, UnknownSQLWriteMode
 from ._abstract_sql import _AbstractSQLDataNode
+from ._sql_bulk_writers import _SQLBulkWriters
 from .data_node_id import DataNodeId, Edit
 
 
@@ -66,10 +69,28 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             - _"db_extra_args"_ `(Dict[str, Any])`: A dictionary of additional arguments to be passed into database
                 connection string.
             - _"exposed_type"_: The exposed type of the data read from SQL query. The default value is `pandas`.
+            - _"db_pool_size"_ `(int)`: The number of connections kept open in the pool of the database engine.
+            - _"db_max_overflow"_ `(int)`: The number of connections that can be opened beyond _"db_pool_size"_.
+            - _"db_pool_recycle"_ `(int)`: The number of seconds after which a connection of the pool is recycled.
+            - _"write_mode"_ `(str)`: How the written data replaces the rows of the table: _"replace"_ deletes all the
+                rows, _"append"_ keeps them, and _"upsert"_ replaces the rows having the primary keys of the written
+                rows. The default value is _"replace"_.
+            - _"primary_keys"_ `(List[str])`: The columns identifying a row, required by the _"upsert"_ write mode.
+            - _"write_chunksize"_ `(int)`: The number of rows inserted at once. The default value is 10000.
     """
 
     __STORAGE_TYPE = "sql_table"
     __TABLE_KEY = "table_name"
+    __WRITE_MODE_KEY = "write_mode"
+    __WRITE_MODE_REPLACE = "replace"
+    __WRITE_MODE_APPEND = "append"
+    __WRITE_MODE_UPSERT = "upsert"
+    __VALID_WRITE_MODES = [__WRITE_MODE_REPLACE, __WRITE_MODE_APPEND, __WRITE_MODE_UPSERT]
+    __PRIMARY_KEYS_KEY = "primary_keys"
+    __WRITE_CHUNKSIZE_KEY = "write_chunksize"
+    __DEFAULT_WRITE_CHUNKSIZE = 10000
+    # Below the limit of the number of parameters of a statement of SQLite before version 3.32.0.
+    __MAX_DELETED_KEY_VALUES = 900
 
     def __init__(
         self,
@@ -90,6 +111,19 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             properties = {}
         if properties.get(self.__TABLE_KEY) is None:
             raise MissingRequiredProperty(f"Property {self.__TABLE_KEY} is not informed and is required")
+        if properties.get(self.__WRITE_MODE_KEY) is None:
+            properties[self.__WRITE_MODE_KEY] = self.__WRITE_MODE_REPLACE
+        if properties[self.__WRITE_MODE_KEY] not in self.__VALID_WRITE_MODES:
+            raise UnknownSQLWriteMode(
+                f"Invalid write mode: {properties[self.__WRITE_MODE_KEY]}. "
+                f"Supported write modes are {', '.join(self.__VALID_WRITE_MODES)}"
+            )
+        if properties[self.__WRITE_MODE_KEY] == self.__WRITE_MODE_UPSERT and not properties.get(
+            self.__PRIMARY_KEYS_KEY
+        ):
+            raise MissingRequiredProperty(
+                f"Property {self.__PRIMARY_KEYS_KEY} is not informed and is required by the upsert write mode"
+            )
         super().__init__(
             config_id,
             scope,
@@ -112,65 +146,116 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     def _get_read_query(self):
         return f"SELECT * FROM {self.properties[self.__TABLE_KEY]}"
 
+    def _get_read_selectable(self) -> Selectable:
+        schema, _, name = self.properties[self.__TABLE_KEY].rpartition(".")
+        return table(name, schema=schema or None)
+
     def _do_write(self, data, engine, connection) -> None:
-        table = self._create_table(engine)
+        self.__write(data, self._create_table(engine), connection, self.properties[self.__WRITE_MODE_KEY])
+
+    def _append(self, data):
+        write_mode = self.properties[self.__WRITE_MODE_KEY]
+        if write_mode == self.__WRITE_MODE_REPLACE:
+            write_mode = self.__WRITE_MODE_APPEND
+        engine = self._get_engine()
+        with engine.connect() as connection, connection.begin():
+            self.__write(data, self._create_table(engine), connection, write_mode)
+
+    def __write(self, data, table: Table, connection, write_mode: str) -> None:
         if isinstance(data, (modin_pd.DataFrame, pd.DataFrame)):
-            self._insert_dataframe(data, table, connection)
+            self._insert_dataframe(data, table, connection, write_mode)
         else:
             if isinstance(data, np.ndarray):
                 data = data.tolist()
             if not isinstance(data, list):
                 data = [data]
             if len(data) == 0:
-                self._delete_all_rows(table, connection)
+                if write_mode == self.__WRITE_MODE_REPLACE:
+                    self._delete_all_rows(table, connection)
             else:
                 if isinstance(data[0], (tuple, list)):
-                    self._insert_tuples(data, table, connection)
+                    self._insert_tuples(data, table, connection, write_mode)
                 elif isinstance(data[0], dict):
-                    self._insert_dicts(data, table, connection)
+                    self._insert_dicts(data, table, connection, write_mode)
                 # If data is a primitive type, it will be inserted as a tuple of one element.
                 else:
-                    self._insert_tuples([(x,) for x in data], table, connection)
+                    self._insert_tuples([(x,) for x in data], table, connection, write_mode)
 
     def _create_table(self, engine) -> Table:
+        schema, _, name = self.properties[self.__TABLE_KEY].rpartition(".")
         return Table(
-            self.table,
+            name,
             MetaData(),
-            autoload=True,
+            schema=schema or None,
             autoload_with=engine,
         )
 
-    @staticmethod
-    def _insert_dicts(data: List[Dict], table: Any, connection: Any) -> None:
+    def _insert_dicts(self, data: List[Dict], table: Any, connection: Any, write_mode: str) -> None:
         """
-        This method will insert the data contained in a list of dictionaries into a table. The query itself is handled
-        by SQLAlchemy, so it's only needed to pass the correct data type.
+        This method will insert the data contained in a list of dictionaries into a table. The columns are the keys
+        of all the dictionaries, in the order they first appear, and the keys missing in a dictionary are NULL.
         """
-        connection.execute(table.delete())
-        connection.execute(table.insert(), data)
+        columns = list(dict.fromkeys(key for row in data for key in row))
+        self.__insert_rows(columns, (tuple(row.get(c) for c in columns) for row in data), table, connection, write_mode)
 
-    @staticmethod
-    def _insert_dataframe(df: Union[modin_pd.DataFrame, pd.DataFrame], table: Any, connection: Any) -> None:
+    def _insert_dataframe(
+        self, df: Union[modin_pd.DataFrame, pd.DataFrame], table: Any, connection: Any, write_mode: str
+    ) -> None:
         """
         :param data: a pandas dataframe
         :param table: a SQLAlchemy object that represents a table
         :param connection: a SQLAlchemy connection to write the data
+        :param write_mode: one of "replace", "append" or "upsert"
         """
-        SQLTableDataNode._insert_dicts(df.to_dict(orient="records"), table, connection)
+        columns = [str(c) for c in df.columns]
+        self.__insert_rows(columns, df.itertuples(index=False, name=None), table, connection, write_mode)
 
     @staticmethod
     def _delete_all_rows(table, connection):
         connection.execute(table.delete())
 
-    @staticmethod
-    def _insert_tuples(data: List[Union[Tuple, List]], table: Any, connection: Any) -> None:
+    def _insert_tuples(self, data: List[Union[Tuple, List]], table: Any, connection: Any, write_mode: str) -> None:
         """
-        This method will look up the length of the first object of the list and build the insert through
-        creation of a string of '?' equivalent to the length of the element. The '?' character is used as
-        placeholder for a tuple of same size.
+        This method will look up the length of the first object of the list and insert the values of each tuple
+        in the same number of first columns of the table.
         """
-        connection.execute(table.delete())
-        markers = ",".join("?" * len(data[0]))
-        ins = "INSERT INTO {tablename} VALUES ({markers})"
-        ins = ins.format(tablename=table.name, markers=markers)
-        connection.execute(ins, data)
+        columns = list(table.columns.keys())[: len(data[0])]
+        self.__insert_rows(columns, (tuple(row) for row in data), table, connection, write_mode)
+
+    def __insert_rows(
+        self, columns: List[str], rows: Iterable[Tuple], table: Any, connection: Any, write_mode: str
+    ) -> None:
+        """Insert the rows by chunks, with the bulk writer of the database dialect."""
+        if write_mode == self.__WRITE_MODE_REPLACE:
+            self._delete_all_rows(table, connection)
+        writer = _SQLBulkWriters._get(connection.dialect.name)
+        chunksize = int(self.properties.get(self.__WRITE_CHUNKSIZE_KEY) or self.__DEFAULT_WRITE_CHUNKSIZE)
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, chunksize)):
+            if write_mode == self.__WRITE_MODE_UPSERT:
+                chunk = self.__delete_existing_rows(columns, chunk, table, connection)
+            writer(connection, table, columns, chunk)
+
+    def __delete_existing_rows(
+        self, columns: List[str], chunk: List[Tuple], table: Any, connection: Any
+    ) -> List[Tuple]:
+        """Delete the rows having the primary keys of the chunk, and return the last row of the chunk of each key."""
+        primary_keys = self.properties[self.__PRIMARY_KEYS_KEY]
+        if isinstance(primary_keys, str):
+            primary_keys = [primary_keys]
+        missing_keys = [key for key in primary_keys if key not in columns]
+        if missing_keys:
+            raise MissingRequiredProperty(f"The primary keys {missing_keys} are missing in the data to upsert")
+        indices = [columns.index(key) for key in primary_keys]
+        rows_by_key = {tuple(row[i] for i in indices): row for row in chunk}
+        keys = list(rows_by_key.keys())
+        key_columns = [table.c[key] for key in primary_keys]
+        nb_of_keys_per_statement = max(1, self.__MAX_DELETED_KEY_VALUES // len(primary_keys))
+        for start in range(0, len(keys), nb_of_keys_per_statement):
+            statement_keys = keys[start : start + nb_of_keys_per_statement]
+            if len(key_columns) == 1:
+                condition = key_columns[0].in_([key[0] for key in statement_keys])
+            else:
+                condition = tuple_(*key_columns).in_(statement_keys)
+            connection.execute(table.delete().where(condition))
+        return list(rows_by_key.values())
@@ -46,6 +46,14 @@ class UnknownDatabaseEngine(Exception):
     """Raised if the database engine is not known when creating a connection with a SQLDataNode."""
 
 
+class UnknownCSVEngine(Exception):
+    """Raised if the CSV parsing engine is not known or not supported when creating a CSVDataNode."""
+
+
+class UnknownSQLWriteMode(Exception):
+    """Raised if the write mode is not known or not supported when creating a SQLTableDataNode."""
+
+
 class UnknownParquetEngine(Exception):
     """Raised if the parquet engine is not known or not supported when create a ParquetDataNode."""
 
@@ -54,6 +62,10 @@ class UnknownCompressionAlgorithm(Exception):
     """Raised if the compression algorithm is not supported by ParquetDataNode."""
 
 
+class InvalidTransport(Exception):
+    """Raised if the transport of a PickleDataNode is not supported."""
+
+
 class NonExistingDataNode(Exception):
     """Raised if a requested DataNode is not known by the DataNode Manager."""
 
@@ -236,6 +248,26 @@ class ModeNotAvailable(Exception):
     """Raised if the mode in JobConfig is not supported."""
 
 
+class JobExecutionTimeout(Exception):
+    """Raised if a job runs longer than the timeout of its task configuration."""
+
+
+class PartitioningNotSupported(Exception):
+    """Raised if the first input of a partitioned task cannot be split into partitions."""
+
+
+class AppendNotSupported(Exception):
+    """Raised if data is appended to a data node that does not support appending data."""
+
+
+class MissingAuthenticationKey(Exception):
+    """Raised if the remote job dispatcher or a worker agent is started without an authentication key."""
+
+
+class StreamInterrupted(Exception):
+    """Raised if the job producing the batches consumed by a streaming task stopped before the end of the stream."""
+
+
 class InvalidExportPath(Exception):
     """Raised if the export path is not valid."""
 
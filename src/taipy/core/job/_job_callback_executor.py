@@ -0,0 +1,103 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from taipy.config.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
+
+if TYPE_CHECKING:
+    from .job import Job
+
+
+def _synchronous_callback(fct: Callable) -> Callable:
+    """Mark a job status callback to always run synchronously, on the thread changing the status of the job."""
+    fct._is_synchronous_callback = True  # type: ignore
+    return fct
+
+
+class _JobCallbackExecutor:
+    """Runs the callbacks notified on a job status change.
+
+    The callbacks marked with `_synchronous_callback`, such as the transitions of the orchestrator, run immediately.
+    When `max_nb_of_callback_threads` is set in the job configuration, the other callbacks (the scenario and pipeline
+    subscribers, and the user callbacks) run on a bounded pool of threads so that a slow subscriber does not delay the
+    dispatch of the next jobs. The notifications of a given job are still processed one at a time and in order, and
+    each one receives a snapshot of the job taken when its status changed.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _pending_notifications: Dict[str, Deque[Tuple["Job", List[Callable]]]] = {}
+    __lock = Lock()
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _run(cls, job: "Job", callbacks: Iterable[Callable]):
+        asynchronous_callbacks = []
+        for callback in callbacks:
+            if getattr(callback, "_is_synchronous_callback", False) is True:
+                callback(job)
+            else:
+                asynchronous_callbacks.append(callback)
+        if not asynchronous_callbacks:
+            return
+
+        executor = cls.__get_executor()
+        if executor is None:
+            for callback in asynchronous_callbacks:
+                callback(job)
+            return
+
+        notification = (job._snapshot(), asynchronous_callbacks)
+        with cls.__lock:
+            if notifications := cls._pending_notifications.get(job.id):
+                notifications.append(notification)
+                return
+            cls._pending_notifications[job.id] = deque([notification])
+        executor.submit(cls.__run_notifications, job.id)
+
+    @classmethod
+    def _shutdown(cls, wait: bool = True):
+        """Shut down the pool of threads, after the pending notifications are processed if *wait* is True."""
+        with cls.__lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @classmethod
+    def __run_notifications(cls, job_id: str):
+        while True:
+            with cls.__lock:
+                notifications = cls._pending_notifications[job_id]
+                if not notifications:
+                    del cls._pending_notifications[job_id]
+                    return
+                job, callbacks = notifications[0]
+            for callback in callbacks:
+                try:
+                    callback(job)
+                except Exception as e:
+                    cls.__logger.error(f"A callback of job {job.id} raised an exception: {e}")
+            with cls.__lock:
+                notifications.popleft()
+
+    @classmethod
+    def __get_executor(cls) -> Optional[ThreadPoolExecutor]:
+        max_nb_of_threads = int(Config.job_config.max_nb_of_callback_threads or 0)
+        if max_nb_of_threads <= 0:
+            return None
+        with cls.__lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_nb_of_threads, thread_name_prefix="Thread-Taipy-JobCallback")
+            return cls._executor
@@ -17,6 +17,7 @@ from ..common._utils import _fcts_to_dict, _load_fct
 from ..exceptions import InvalidSubscriber
 from ..job._job_model import _JobModel
 from ..job.job import Job
+from ..job.status import Status
 from ..task._task_manager_factory import _TaskManagerFactory
 from ._utils import _migrate_subscriber
 
@@ -32,8 +33,11 @@ class _JobConverter(_AbstractConverter):
             job.submit_id,
             job.submit_entity_id,
             job._creation_date.isoformat(),
+            {status.name: date.isoformat() for status, date in job._status_timestamps.items()},
             cls.__serialize_subscribers(job._subscribers),
             job._stacktrace,
+            job._metadata,
+            job._priority,
             version=job._version,
         )
 
@@ -48,19 +52,24 @@ class _JobConverter(_AbstractConverter):
             submit_id=model.submit_id,
             submit_entity_id=model.submit_entity_id,
             version=model.version,
+            priority=model.priority or 0,
         )
 
         job._status = model.status  # type: ignore
         job._force = model.force  # type: ignore
         job._creation_date = datetime.fromisoformat(model.creation_date)  # type: ignore
+        job._status_timestamps = {
+            Status[status]: datetime.fromisoformat(date) for status, date in (model.status_timestamps or {}).items()
+        }
         for it in model.subscribers:
             try:
                 # Migrate from taipy-core 2.2 to taipy-core 2.3
                 fct_module, fct_name = _migrate_subscriber(it.get("fct_module"), it.get("fct_name"))
-                job._subscribers.append(_load_fct(fct_module, fct_name))  # type:ignore
+                job._subscribers.append(_load_fct(fct_module, fct_name))  # type: ignore
             except AttributeError:
                 raise InvalidSubscriber(f"The subscriber function {it.get('fct_name')} cannot be loaded.")
         job._stacktrace = model.stacktrace
+        job._metadata = model.metadata or {}
 
         return job
 
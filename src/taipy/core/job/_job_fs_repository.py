@@ -8,11 +8,19 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
+from typing import Dict, Iterable, List, Optional
+
 from .._repository._filesystem_repository import _FileSystemRepository
 from ._job_converter import _JobConverter
 from ._job_model import _JobModel
+from .job import Job
+from .status import Status
 
 
 class _JobFSRepository(_FileSystemRepository):
     def __init__(self):
         super().__init__(model_type=_JobModel, converter=_JobConverter, dir_name="jobs")
+
+    def _load_all_by_status(self, statuses: Iterable[Status], filters: Optional[List[Dict]] = None) -> List[Job]:
+        # The status is matched in the content of the files, so only the files of the matching jobs are decoded.
+        return self._load_all_containing_any([f'"status": "{status!r}"' for status in statuses], filters)
@@ -19,8 +19,10 @@ from .._version._version_mixin import _VersionMixin
 from ..exceptions.exceptions import JobNotDeletedException
 from ..notification import EventEntityType, EventOperation, _publish_event
 from ..task.task import Task
+from ._job_owner import _JobOwner
 from .job import Job
 from .job_id import JobId
+from .status import Status
 
 
 class _JobManager(_Manager[Job], _VersionMixin):
@@ -37,11 +39,25 @@ class _JobManager(_Manager[Job], _VersionMixin):
         filters = cls._build_filters_with_version(version_number)
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _get_all_by_status(cls, statuses: Iterable[Status], version_number: Optional[str] = "all") -> List[Job]:
+        """
+        Returns the jobs with one of the given statuses, without loading the other jobs.
+        """
+        filters = cls._build_filters_with_version(version_number)
+        return cls._repository._load_all_by_status(statuses, filters)  # type: ignore
+
     _EVENT_ENTITY_TYPE = EventEntityType.JOB
 
     @classmethod
     def _create(
-        cls, task: Task, callbacks: Iterable[Callable], submit_id: str, submit_entity_id: str, force=False
+        cls,
+        task: Task,
+        callbacks: Iterable[Callable],
+        submit_id: str,
+        submit_entity_id: str,
+        force=False,
+        priority: int = 0,
     ) -> Job:
         version = _VersionManagerFactory._build_manager()._get_latest_version()
         job = Job(
@@ -51,7 +67,9 @@ class _JobManager(_Manager[Job], _VersionMixin):
             submit_entity_id=submit_entity_id,
             force=force,
             version=version,
+            priority=priority,
         )
+        job._metadata[Job._OWNER_KEY] = _JobOwner._current()
         cls._set(job)
         _publish_event(cls._EVENT_ENTITY_TYPE, job.id, EventOperation.CREATION, None)
         job._on_status_change(*callbacks)
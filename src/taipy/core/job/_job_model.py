@@ -11,7 +11,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
-from sqlalchemy import JSON, Boolean, Column, Enum, String, Table
+from sqlalchemy import JSON, Boolean, Column, Enum, Integer, String, Table
 
 from .._repository._base_taipy_model import _BaseModel
 from .._repository.db._sql_base_model import mapper_registry
@@ -28,13 +28,16 @@ class _JobModel(_BaseModel):
         mapper_registry.metadata,
         Column("id", String, primary_key=True),
         Column("task_id", String),
-        Column("status", Enum(Status)),
+        Column("status", Enum(Status), index=True),
         Column("force", Boolean),
         Column("submit_id", String),
         Column("submit_entity_id", String),
         Column("creation_date", String),
+        Column("status_timestamps", JSON),
         Column("subscribers", JSON),
         Column("stacktrace", JSON),
+        Column("metadata", JSON),
+        Column("priority", Integer),
         Column("version", String),
     )
     id: JobId
@@ -44,8 +47,11 @@ class _JobModel(_BaseModel):
     submit_id: str
     submit_entity_id: str
     creation_date: str
+    status_timestamps: Dict[str, str]
     subscribers: List[Dict]
     stacktrace: List[str]
+    metadata: Dict[str, Any]
+    priority: int
     version: str
 
     @staticmethod
@@ -58,7 +64,10 @@ class _JobModel(_BaseModel):
             submit_id=data["submit_id"],
             submit_entity_id=data["submit_entity_id"],
             creation_date=data["creation_date"],
+            status_timestamps=data.get("status_timestamps", {}),
             subscribers=data["subscribers"],
             stacktrace=data["stacktrace"],
+            metadata=data.get("metadata", {}),
+            priority=data.get("priority", 0),
             version=data["version"] if "version" in data.keys() else _version_migration(),
         )
@@ -0,0 +1,66 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import os
+import socket
+from typing import Any, Dict, Optional
+
+
+class _JobOwner:
+    """Identifies the application process orchestrating a job.
+
+    The owner is recorded in the metadata of the job, so that an application started on the same repository only
+    recovers the unfinished jobs of the processes that are gone.
+    """
+
+    _HOST_KEY = "host"
+    _PID_KEY = "pid"
+
+    @classmethod
+    def _current(cls) -> Dict[str, Any]:
+        return {cls._HOST_KEY: socket.gethostname(), cls._PID_KEY: os.getpid()}
+
+    @classmethod
+    def _is_current(cls, owner: Optional[Dict[str, Any]]) -> bool:
+        return owner == cls._current()
+
+    @classmethod
+    def _is_gone(cls, owner: Optional[Dict[str, Any]]) -> bool:
+        """Return True if the process owning a job is known to have stopped.
+
+        Jobs without owner were created before the owners were recorded and are considered orphaned. The processes
+        of another host cannot be checked, so they are considered alive.
+        """
+        if not owner:
+            return True
+        if owner.get(cls._HOST_KEY) != socket.gethostname():
+            return False
+        return not cls.__is_alive(int(owner[cls._PID_KEY]))
+
+    @staticmethod
+    def __is_alive(pid: int) -> bool:
+        if os.name == "nt":
+            import ctypes
+
+            # PROCESS_QUERY_LIMITED_INFORMATION. On Windows, os.kill() would terminate the process.
+            handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # type: ignore
+            if not handle:
+                return False
+            ctypes.windll.kernel32.CloseHandle(handle)  # type: ignore
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass  # The process exists but belongs to another user.
+        return True
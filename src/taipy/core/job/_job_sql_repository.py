@@ -8,11 +8,21 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
+from typing import Dict, Iterable, List, Optional
+
 from .._repository._sql_repository import _SQLRepository
 from ._job_converter import _JobConverter
 from ._job_model import _JobModel
+from .job import Job
+from .status import Status
 
 
 class _JobSQLRepository(_SQLRepository):
     def __init__(self):
         super().__init__(model_type=_JobModel, converter=_JobConverter)
+
+    def _load_all_by_status(self, statuses: Iterable[Status], filters: Optional[List[Dict]] = None) -> List[Job]:
+        query = self.db.query(_JobModel).filter(_JobModel.status.in_(list(statuses)))  # type: ignore
+        for f in filters or []:
+            query = query.filter_by(**f)
+        return [self.converter._model_to_entity(m) for m in query.all()]
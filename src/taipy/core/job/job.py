@@ -12,8 +12,9 @@
 __all__ = ["Job"]
 
 import traceback
+from copy import copy
 from datetime import datetime
-from typing import Callable, List
+from typing import Any, Callable, Dict, List
 
 from taipy.logger._taipy_logger import _TaipyLogger
 
@@ -23,6 +24,7 @@ from .._entity._reload import _self_reload, _self_setter
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._utils import _fcts_to_dict
 from ..task.task import Task
+from ._job_callback_executor import _JobCallbackExecutor
 from .job_id import JobId
 from .status import Status
 
@@ -30,8 +32,7 @@ from .status import Status
 def _run_callbacks(fn):
     def __run_callbacks(job):
         fn(job)
-        for fct in job._subscribers:
-            fct(job)
+        _JobCallbackExecutor._run(job, job._subscribers)
 
     return __run_callbacks
 
@@ -52,21 +53,46 @@ class Job(_Entity, _Labeled):
         stacktrace (List[str]): The list of stacktraces of the exceptions raised during the execution.
         version (str): The string indicates the application version of the job to instantiate. If not provided,
             the latest version is used.
+        priority (int): The priority of this job. Jobs with a higher priority run first. The default value is 0.
+        metadata (Dict[str, Any]): Information reported by the worker that executed the job, such as the
+            statistics of its data node read cache, the identifier of the job producing the batches
+            consumed by a streaming task, and the host and process id of the application orchestrating the job.
+        status_timestamps (Dict[Status^, datetime]): The date and time at which the job entered each status.
+        execution_metrics (Dict[str, Any]): The metrics measured by the worker that executed the job: the
+            durations in seconds of the read, compute and write phases, the peak resident set size in bytes
+            reached by the worker process since it started, which may come from a previous job executed by the
+            same worker, and the duration of each input and output data node read or write, with the size
+            of the file storing the data node (None for the data nodes not stored in a single file).
     """
 
     _MANAGER_NAME = "job"
     _ID_PREFIX = "JOB"
-
-    def __init__(self, id: JobId, task: Task, submit_id: str, submit_entity_id: str, force=False, version=None):
+    _EXECUTION_METRICS_KEY = "execution_metrics"
+    _STREAMED_FROM_KEY = "streamed_from"
+    _OWNER_KEY = "owner"
+
+    def __init__(
+        self,
+        id: JobId,
+        task: Task,
+        submit_id: str,
+        submit_entity_id: str,
+        force=False,
+        version=None,
+        priority: int = 0,
+    ):
         self.id = id
         self._task = task
         self._force = force
+        self._priority = priority
         self._status = Status.SUBMITTED
         self._creation_date = datetime.now()
+        self._status_timestamps: Dict[Status, datetime] = {Status.SUBMITTED: self._creation_date}
         self._submit_id: str = submit_id
         self._submit_entity_id: str = submit_entity_id
         self._subscribers: List[Callable] = []
         self._stacktrace: List[str] = []
+        self._metadata: Dict[str, Any] = {}
         self.__logger = _TaipyLogger._get_logger()
         self._version = version or _VersionManagerFactory._build_manager()._get_latest_version()
 
@@ -94,6 +120,10 @@ class Job(_Entity, _Labeled):
     def force(self, val):
         self._force = val
 
+    @property
+    def priority(self) -> int:
+        return self._priority
+
     @property
     def submit_id(self):
         return self._submit_id
@@ -117,6 +147,12 @@ class Job(_Entity, _Labeled):
     @_self_setter(_MANAGER_NAME)
     def status(self, val):
         self._status = val
+        self._status_timestamps[val] = datetime.now()
+
+    @property  # type: ignore
+    @_self_reload(_MANAGER_NAME)
+    def status_timestamps(self) -> Dict[Status, datetime]:
+        return self._status_timestamps
 
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
@@ -132,6 +168,16 @@ class Job(_Entity, _Labeled):
     def stacktrace(self) -> List[str]:
         return self._stacktrace
 
+    @property  # type: ignore
+    @_self_reload(_MANAGER_NAME)
+    def metadata(self) -> Dict[str, Any]:
+        return self._metadata
+
+    @property  # type: ignore
+    @_self_reload(_MANAGER_NAME)
+    def execution_metrics(self) -> Dict[str, Any]:
+        return self._metadata.get(self._EXECUTION_METRICS_KEY, {})
+
     @property
     def version(self):
         return self._version
@@ -282,6 +328,14 @@ class Job(_Entity, _Labeled):
         """
         return self._status in [Status.COMPLETED, Status.FAILED, Status.CANCELED, Status.SKIPPED, Status.ABANDONED]
 
+    def _snapshot(self) -> "Job":
+        """Return a copy of the job in its current state, which is not reloaded from the repository when read."""
+        snapshot = copy(self)
+        snapshot._status_timestamps = dict(self._status_timestamps)
+        snapshot._metadata = dict(self._metadata)
+        snapshot._is_snapshot = True
+        return snapshot
+
     def _on_status_change(self, *functions):
         """Get a notification when the status of the job changes.
 
@@ -305,12 +359,12 @@ class Job(_Entity, _Labeled):
     def update_status(self, exceptions):
         """Update the job status based on the success or the failure of its execution."""
         if exceptions:
-            self.failed()
             self.__logger.error(f" {len(exceptions)} errors occurred during execution of job {self.id}")
             for e in exceptions:
                 st = "".join(traceback.format_exception(type(e), value=e, tb=e.__traceback__))
                 self._stacktrace.append(st)
                 self.__logger.error(st)
+            self.failed()  # Once the stacktrace is complete, for the subscribers notified of the failure.
         else:
             self.completed()
             self.__logger.info(f"job {self.id} is completed.")
@@ -150,6 +150,7 @@ class _PipelineManager(_Manager[Pipeline], _VersionMixin):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
         check_inputs_are_ready: bool = True,
     ) -> List[Job]:
         pipeline_id = pipeline.id if isinstance(pipeline, Pipeline) else pipeline
@@ -164,7 +165,14 @@ class _PipelineManager(_Manager[Pipeline], _VersionMixin):
         jobs = (
             _TaskManagerFactory._build_manager()
             ._orchestrator()
-            .submit(pipeline, callbacks=pipeline_subscription_callback, force=force, wait=wait, timeout=timeout)
+            .submit(
+                pipeline,
+                callbacks=pipeline_subscription_callback,
+                force=force,
+                wait=wait,
+                timeout=timeout,
+                priority=priority,
+            )
         )
         _publish_event(cls._EVENT_ENTITY_TYPE, pipeline.id, EventOperation.SUBMISSION, None)
         return jobs
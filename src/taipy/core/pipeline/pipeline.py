@@ -249,6 +249,7 @@ class Pipeline(_Entity, _Submittable, _Labeled):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> List[Job]:
         """Submit the pipeline for execution.
 
@@ -262,12 +263,14 @@ class Pipeline(_Entity, _Submittable, _Labeled):
                 in asynchronous mode.
             timeout (Union[float, int]): The maximum number of seconds to wait for the jobs to be finished before
                 returning.
+            priority (int): The priority of the created jobs. Jobs with a higher priority run first.
+                The default value is 0.
         Returns:
             A list of created `Job^`s.
         """
         from ._pipeline_manager_factory import _PipelineManagerFactory
 
-        return _PipelineManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout)
+        return _PipelineManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout, priority)
 
     @staticmethod
     def __to_task_ids(tasks):
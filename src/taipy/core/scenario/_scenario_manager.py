@@ -159,6 +159,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
         check_inputs_are_ready: bool = True,
     ) -> List[Job]:
         scenario_id = scenario.id if isinstance(scenario, Scenario) else scenario
@@ -173,7 +174,14 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         jobs = (
             _TaskManagerFactory._build_manager()
             ._orchestrator()
-            .submit(scenario, callbacks=scenario_subscription_callback, force=force, wait=wait, timeout=timeout)
+            .submit(
+                scenario,
+                callbacks=scenario_subscription_callback,
+                force=force,
+                wait=wait,
+                timeout=timeout,
+                priority=priority,
+            )
         )
         _publish_event(cls._EVENT_ENTITY_TYPE, scenario.id, EventOperation.SUBMISSION, None)
         return jobs
@@ -297,6 +297,7 @@ class Scenario(_Entity, _Submittable, _Labeled):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> List[Job]:
         """Submit this scenario for execution.
 
@@ -310,13 +311,15 @@ class Scenario(_Entity, _Submittable, _Labeled):
                 asynchronous mode.
             timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be finished
                 before returning.
+            priority (int): The priority of the created jobs. Jobs with a higher priority run first.
+                The default value is 0.
 
         Returns:
             A list of created `Job^`s.
         """
         from ._scenario_manager_factory import _ScenarioManagerFactory
 
-        return _ScenarioManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout)
+        return _ScenarioManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout, priority)
 
     def export(
         self,
@@ -18,6 +18,7 @@ from taipy.config.config import Config
 from taipy.logger._taipy_logger import _TaipyLogger
 
 from ._entity._entity import _Entity
+from ._orchestrator._metrics_registry import _MetricsRegistry
 from ._version._version_manager_factory import _VersionManagerFactory
 from .common._warnings import _warn_deprecated, _warn_no_core_service
 from .config.pipeline_config import PipelineConfig
@@ -85,6 +86,7 @@ def submit(
     force: bool = False,
     wait: bool = False,
     timeout: Optional[Union[float, int]] = None,
+    priority: int = 0,
 ) -> Union[Job, List[Job]]:
     """Submit an entity for execution.
 
@@ -98,6 +100,9 @@ def submit(
             in asynchronous mode.
         timeout (Union[float, int]): The optional maximum number of seconds to wait
             for the jobs to be finished before returning.
+        priority (int): The priority of the created jobs. Jobs with a higher priority run
+            first, so interactive submissions are not delayed by large batch submissions.
+            The default value is 0.
     Returns:
         The created `Job^` or a collection of the created `Job^` depends on the submitted entity.
 
@@ -105,11 +110,17 @@ def submit(
         - If a `Task^` is provided, it will return the created `Job^`.
     """
     if isinstance(entity, Scenario):
-        return _ScenarioManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _ScenarioManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority
+        )
     if isinstance(entity, Pipeline):
-        return _PipelineManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _PipelineManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority
+        )
     if isinstance(entity, Task):
-        return _TaskManagerFactory._build_manager()._submit(entity, force=force, wait=wait, timeout=timeout)
+        return _TaskManagerFactory._build_manager()._submit(
+            entity, force=force, wait=wait, timeout=timeout, priority=priority
+        )
 
 
 @overload
@@ -536,6 +547,21 @@ def get_latest_job(task: Task) -> Optional[Job]:
     return _JobManagerFactory._build_manager()._get_latest(task)
 
 
+def get_metrics() -> Dict[str, Any]:
+    """Return the metrics of the job orchestration.
+
+    The metrics are measured since the start of the application: the number of submitted,
+    dispatched, and finished jobs, the number of jobs waiting to run or blocked, the number of
+    available workers, and the histograms of the time the jobs spend waiting for a worker and
+    running.
+
+    Returns:
+        A dictionary with the *"counters"*, *"gauges"*, and *"histograms"* keys. Each entry maps
+        the name of a metric, followed by its labels if any, to its value.
+    """
+    return _MetricsRegistry._get_metrics()
+
+
 def get_data_nodes() -> List[DataNode]:
     """Return all the existing data nodes.
 
@@ -165,6 +165,7 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
         check_inputs_are_ready: bool = True,
     ):
         task_id = task.id if isinstance(task, Task) else task
@@ -173,7 +174,9 @@ class _TaskManager(_Manager[Task], _VersionMixin):
             raise NonExistingTask(task_id)
         if check_inputs_are_ready:
             _warn_if_inputs_not_ready(task.input.values())
-        job = cls._orchestrator().submit_task(task, callbacks=callbacks, force=force, wait=wait, timeout=timeout)
+        job = cls._orchestrator().submit_task(
+            task, callbacks=callbacks, force=force, wait=wait, timeout=timeout, priority=priority
+        )
         _publish_event(cls._EVENT_ENTITY_TYPE, task.id, EventOperation.SUBMISSION, None)
         return job
 
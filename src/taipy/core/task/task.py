@@ -183,6 +183,7 @@ class Task(_Entity, _Labeled):
         force: bool = False,
         wait: bool = False,
         timeout: Optional[Union[float, int]] = None,
+        priority: int = 0,
     ) -> "Job":  # noqa
         """Submit the task for execution.
 
@@ -194,13 +195,15 @@ class Task(_Entity, _Labeled):
                 mode.
             timeout (Union[float, int]): The maximum number of seconds to wait for the job to be finished before
                 returning.
+            priority (int): The priority of the created job. Jobs with a higher priority run first.
+                The default value is 0.
 
         Returns:
             The created `Job^`.
         """
         from ._task_manager_factory import _TaskManagerFactory
 
-        return _TaskManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout)
+        return _TaskManagerFactory._build_manager()._submit(self, callbacks, force, wait, timeout, priority)
 
     @staticmethod
     def __to_ids(data_nodes):
@@ -13,12 +13,13 @@ import os
 import pickle
 import shutil
 from datetime import datetime
-from queue import Queue
 
 import pandas as pd
 import pytest
 from sqlalchemy import create_engine, text
 
+from src.taipy.core._orchestrator._job_queue import _JobQueue
+from src.taipy.core._orchestrator._metrics_registry import _MetricsRegistry
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core._repository.db import engine
 from src.taipy.core._version._version import _Version
@@ -46,6 +47,8 @@ from src.taipy.core.cycle.cycle import Cycle
 from src.taipy.core.cycle.cycle_id import CycleId
 from src.taipy.core.data._data_manager_factory import _DataManagerFactory
 from src.taipy.core.data._data_model import _DataNodeModel
+from src.taipy.core.data._mongo_client_registry import _MongoClientRegistry
+from src.taipy.core.data._sql_engine_registry import _SQLEngineRegistry
 from src.taipy.core.data.in_memory import InMemoryDataNode
 from src.taipy.core.job._job_manager_factory import _JobManagerFactory
 from src.taipy.core.job._job_model import _JobModel
@@ -335,6 +338,8 @@ def clean_repository():
     from sqlalchemy.orm import close_all_sessions
 
     close_all_sessions()
+    _MongoClientRegistry._close_all()
+    _SQLEngineRegistry._dispose_all()
     init_config()
     init_orchestrator()
     init_managers()
@@ -441,8 +446,10 @@ def init_orchestrator():
     if _OrchestratorFactory._orchestrator is None:
         _OrchestratorFactory._build_orchestrator()
     _OrchestratorFactory._build_dispatcher()
-    _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
+    _OrchestratorFactory._orchestrator.jobs_to_run = _JobQueue()
     _OrchestratorFactory._orchestrator.blocked_jobs = []
+    _OrchestratorFactory._orchestrator._submission_jobs = {}
+    _MetricsRegistry._clear()
 
 
 def init_notifier():
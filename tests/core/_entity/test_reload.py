@@ -0,0 +1,37 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+
+from src.taipy.core._entity._reload import _Reloader
+from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.data.in_memory import InMemoryDataNode
+from taipy.config.common.scope import Scope
+
+
+def test_no_reload_context_only_applies_to_the_current_thread():
+    dn = InMemoryDataNode("foo", Scope.SCENARIO)
+    _DataManager._set(dn)
+    reloaded = []
+
+    with _Reloader():
+        assert _Reloader()._reload("data", dn) is dn
+        with _Reloader():
+            assert _Reloader()._reload("data", dn) is dn
+        assert _Reloader()._reload("data", dn) is dn
+
+        thread = threading.Thread(target=lambda: reloaded.append(_Reloader()._reload("data", dn)))
+        thread.start()
+        thread.join()
+        assert reloaded[0] is not dn
+        assert reloaded[0].id == dn.id
+
+    assert _Reloader()._reload("data", dn) is not dn
@@ -9,24 +9,33 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import glob
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+import os
+import signal
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from functools import partial
 from time import sleep
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pandas as pd
 from pytest import raises
 
 from src.taipy.core import DataNodeId, JobId, TaskId
 from src.taipy.core._orchestrator._dispatcher._development_job_dispatcher import _DevelopmentJobDispatcher
+from src.taipy.core._orchestrator._dispatcher._partitioned_execution import _PartitionedExecution
 from src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import _StandaloneJobDispatcher
+from src.taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.data.in_memory import InMemoryDataNode
 from src.taipy.core.job.job import Job
 from src.taipy.core.task.task import Task
+from taipy.config.common.scope import Scope
 from taipy.config.config import Config
 
 
@@ -40,6 +49,10 @@ def _error():
     raise RuntimeError("Something bad has happened")
 
 
+def _crash():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
 def test_build_development_job_dispatcher():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -64,7 +77,8 @@ def test_build_standalone_job_dispatcher():
 
     assert not isinstance(dispatcher, _DevelopmentJobDispatcher)
     assert isinstance(dispatcher, _StandaloneJobDispatcher)
-    assert isinstance(dispatcher._executor, ProcessPoolExecutor)
+    assert [executor._max_workers for executor in dispatcher._executors] == [2]
+    assert isinstance(dispatcher._executors[0], ProcessPoolExecutor)
     assert dispatcher._nb_available_workers == 2
     assert_true_after_120_second_max(dispatcher.is_running)
     dispatcher.stop()
@@ -106,6 +120,174 @@ def test_can_execute_2_workers():
     assert_true_after_120_second_max(lambda: dispatcher._can_execute())
 
 
+def test_standalone_dispatcher_autoscaling():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=3, min_nb_of_workers=0, worker_idle_timeout=0.2
+    )
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+    task = Task("name", {}, partial(execute, lock), [], [], id=TaskId("task_id"))
+    jobs_to_run = _OrchestratorFactory._orchestrator.jobs_to_run
+
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    first_executor = dispatcher._executors[0]
+    assert first_executor._max_workers == 1
+    assert dispatcher._nb_available_workers == 3
+
+    with lock:
+        dispatcher._dispatch(Job(JobId("running"), task, "submit_id", task.id))
+        jobs_to_run.put(Job(JobId("waiting_1"), task, "submit_id", task.id))
+        jobs_to_run.put(Job(JobId("waiting_2"), task, "submit_id", task.id))
+        assert dispatcher._can_execute()
+        # The pool grows without replacing the executor running the job.
+        assert [executor._max_workers for executor in dispatcher._executors] == [1, 2]
+        assert dispatcher._executors[0] is first_executor
+        jobs_to_run.get(block=False)
+        jobs_to_run.get(block=False)
+
+    assert_true_after_120_second_max(lambda: dispatcher._nb_available_workers == 3)
+    sleep(0.3)
+    assert dispatcher._can_execute()
+    assert dispatcher._executors == []
+
+    job = Job(JobId("new"), task, "submit_id", task.id)
+    dispatcher._dispatch(job)
+    assert [executor._max_workers for executor in dispatcher._executors] == [1]
+    assert_true_after_120_second_max(job.is_completed)
+
+
+def test_resize_standalone_dispatcher():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    first_executor = dispatcher._executors[0]
+
+    dispatcher._resize(4)
+    assert dispatcher._nb_available_workers == 4
+    assert [executor._max_workers for executor in dispatcher._executors] == [2, 2]
+    assert dispatcher._executors[0] is first_executor
+    assert not first_executor._shutdown_thread
+
+    dispatcher._nb_available_workers -= 1  # A running job
+    dispatcher._resize(2, min_nb_of_workers=0)
+    assert dispatcher._nb_available_workers == 1
+    assert dispatcher._min_nb_of_workers == 0
+    # The idle executors exceeding the new maximum are shut down, newest first.
+    assert dispatcher._executors == [first_executor]
+
+    with raises(ValueError):
+        dispatcher._resize(0)
+
+
+def test_crashed_worker_fails_only_its_job():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    m = multiprocessing.Manager()
+    event = m.Event()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    broken_executor = dispatcher._executors[0]
+
+    waiting_task = Task("waiting", {}, event.wait, [], [])
+    crash_task = Task("crash", {}, _crash, [], [])
+    waiting_job = Job(JobId("waiting"), waiting_task, "submit_id", waiting_task.id)
+    crash_job = Job(JobId("crash"), crash_task, "submit_id", crash_task.id)
+
+    waiting_job.running()
+    dispatcher._dispatch(waiting_job)
+    crash_job.running()
+    dispatcher._dispatch(crash_job)
+
+    assert_true_after_120_second_max(crash_job.is_failed)
+    assert "BrokenProcessPool" in crash_job.stacktrace[0]
+    assert_true_after_120_second_max(waiting_job.is_pending)
+    assert waiting_job in _OrchestratorFactory._orchestrator.jobs_to_run
+    assert broken_executor not in dispatcher._executors
+    assert_true_after_120_second_max(lambda: dispatcher._nb_available_workers == 2)
+
+    event.set()
+    waiting_job.running()
+    dispatcher._dispatch(waiting_job)
+    assert_true_after_120_second_max(waiting_job.is_completed)
+
+
+def test_job_interrupted_too_many_times_fails():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    m = multiprocessing.Manager()
+    event = m.Event()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    waiting_task = Task("waiting", {}, event.wait, [], [])
+    crash_task = Task("crash", {}, _crash, [], [])
+    waiting_job = Job(JobId("waiting"), waiting_task, "submit_id", waiting_task.id)
+    crash_job = Job(JobId("crash"), crash_task, "submit_id", crash_task.id)
+    dispatcher._nb_of_requeues[waiting_job.id] = dispatcher._MAX_NB_OF_REQUEUES
+
+    waiting_job.running()
+    dispatcher._dispatch(waiting_job)
+    crash_job.running()
+    dispatcher._dispatch(crash_job)
+
+    assert_true_after_120_second_max(lambda: crash_job.is_failed() and waiting_job.is_failed())
+    assert "BrokenProcessPool" in waiting_job.stacktrace[0]
+    assert waiting_job not in _OrchestratorFactory._orchestrator.jobs_to_run
+    assert dispatcher._nb_of_requeues == {}
+
+
+def test_kill_job_exceeding_its_timeout():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    Config.configure_task("slow", sleep, timeout=0.5)
+    m = multiprocessing.Manager()
+    event = m.Event()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    waiting_task = Task("waiting", {}, event.wait, [], [])
+    waiting_job = Job(JobId("waiting"), waiting_task, "submit_id", waiting_task.id)
+    waiting_job.running()
+    dispatcher._dispatch(waiting_job)
+    slow_task = Task("slow", {}, partial(sleep, 60), [], [])
+    job = Job(JobId("slow_1"), slow_task, "submit_id", slow_task.id)
+    job.running()
+    dispatcher._dispatch(job)
+
+    try:
+        assert_true_after_120_second_max(lambda: dispatcher._can_execute() and job.is_failed())
+        assert "JobExecutionTimeout" in job.stacktrace[0]
+        assert dispatcher._dedicated_executors == {}
+        # The job was killed on its own process: the other running job is not interrupted.
+        assert waiting_job.is_running()
+    finally:
+        event.set()
+    assert_true_after_120_second_max(waiting_job.is_completed)
+    assert_true_after_120_second_max(lambda: dispatcher._nb_available_workers == 2)
+
+    other_task = Task("other", {}, print, [], [])
+    other_job = Job(JobId("other_1"), other_task, "submit_id", other_task.id)
+    dispatcher._dispatch(other_job)
+    assert_true_after_120_second_max(other_job.is_completed)
+
+
+def test_standalone_dispatcher_with_spawn_start_method():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="spawn")
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    assert dispatcher._executors[0]._mp_context.get_start_method() == "spawn"
+
+    task = Task("name", {}, print, [], [])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    dispatcher._dispatch(job)
+    assert_true_after_120_second_max(job.is_completed)
+
+
+def test_standalone_dispatcher_with_forkserver_start_method():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, start_method="forkserver", preload_modules=["json"]
+    )
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+    assert dispatcher._executors[0]._mp_context.get_start_method() == "forkserver"
+
+    task = Task("name", {}, print, [], [])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    dispatcher._dispatch(job)
+    assert_true_after_120_second_max(job.is_completed)
+
+
 def test_can_execute_synchronous():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -160,6 +342,364 @@ def test_exception_in_writing_data():
         assert "node" in job.stacktrace[0]
 
 
+def _sum_and_product(a, b, c):
+    return a + b + c, a * b * c
+
+
+def test_read_inputs_and_write_outputs_concurrently():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE, max_nb_of_io_threads=3)
+    _OrchestratorFactory._build_dispatcher()
+
+    inputs = [InMemoryDataNode(f"input_{i}", Scope.SCENARIO, properties={"default_data": i + 2}) for i in range(3)]
+    outputs = [InMemoryDataNode("sum", Scope.SCENARIO), InMemoryDataNode("product", Scope.SCENARIO)]
+    for dn in inputs + outputs:
+        _DataManager._set(dn)
+    task = Task(config_id="name", properties={}, input=inputs, function=_sum_and_product, output=outputs)
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    _OrchestratorFactory._dispatcher._dispatch(job)
+
+    assert job.is_completed()
+    assert _DataManager._get(outputs[0].id).read() == 9
+    assert _DataManager._get(outputs[1].id).read() == 24
+    assert len(_DataManager._get(outputs[1].id).edits) == 1
+    assert _DataManager._get(outputs[1].id).edits[0]["job_id"] == job.id
+
+
+def test_write_outputs_concurrently_through_the_data_node_write_method():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE, max_nb_of_io_threads=2)
+    _OrchestratorFactory._build_dispatcher()
+
+    inputs = [InMemoryDataNode(f"input_{i}", Scope.SCENARIO, properties={"default_data": i + 2}) for i in range(3)]
+    outputs = [InMemoryDataNode("sum", Scope.SCENARIO), InMemoryDataNode("product", Scope.SCENARIO)]
+    for dn in inputs + outputs:
+        _DataManager._set(dn)
+    task = Task(config_id="name", properties={}, input=inputs, function=_sum_and_product, output=outputs)
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    with mock.patch.object(InMemoryDataNode, "write", autospec=True, side_effect=InMemoryDataNode.write) as write:
+        _OrchestratorFactory._dispatcher._dispatch(job)
+
+    assert job.is_completed()
+    assert sorted(call.args[1] for call in write.call_args_list) == [9, 24]
+    assert all(call.kwargs["job_id"] == job.id for call in write.call_args_list)
+
+
+def test_exception_in_writing_data_concurrently():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE, max_nb_of_io_threads=2)
+    _OrchestratorFactory._build_dispatcher()
+
+    inputs = [InMemoryDataNode(f"input_{i}", Scope.SCENARIO, properties={"default_data": i + 2}) for i in range(3)]
+    outputs = [InMemoryDataNode("sum", Scope.SCENARIO), InMemoryDataNode("product", Scope.SCENARIO)]
+    for dn in inputs + outputs:
+        _DataManager._set(dn)
+    task = Task(config_id="name", properties={}, input=inputs, function=_sum_and_product, output=outputs)
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    def _raise_on_sum(data):
+        if data == 9:
+            raise ValueError()
+
+    with mock.patch("src.taipy.core.data.in_memory.InMemoryDataNode._write", side_effect=_raise_on_sum):
+        _OrchestratorFactory._dispatcher._dispatch(job)
+
+    assert job.is_failed()
+    assert len(job.stacktrace) == 1
+    assert "DataNodeWritingError" in job.stacktrace[0]
+    assert not _DataManager._get(outputs[0].id).is_ready_for_reading
+    assert _DataManager._get(outputs[1].id).is_ready_for_reading
+
+
+def _length(data):
+    return len(data)
+
+
+def test_standalone_workers_cache_reads_and_report_it_in_job_metadata():
+    Config.configure_job_executions(
+        mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=1, read_cache_budget=1 << 20, preload_modules=["json"]
+    )
+    input_cfg = Config.configure_pickle_data_node("reference", default_data=list(range(100)), scope=Scope.GLOBAL)
+    output_cfgs = [Config.configure_pickle_data_node(f"length_{i}") for i in range(2)]
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, *output_cfgs])
+
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    jobs = []
+    for i, output_cfg in enumerate(output_cfgs):
+        task = Task(f"t_{i}", {}, _length, input=[data_nodes[input_cfg]], output=[data_nodes[output_cfg]])
+        job = Job(JobId(f"id_{i}"), task, "submit_id", task.id)
+        dispatcher._dispatch(job)
+        assert_true_after_120_second_max(job.is_completed)
+        jobs.append(job)
+
+    assert jobs[0].metadata["read_cache"]["hits"] == 0
+    assert jobs[0].metadata["read_cache"]["misses"] == 1
+    assert jobs[1].metadata["read_cache"]["hits"] == 1
+    assert jobs[1].metadata["read_cache"]["misses"] == 0
+    assert jobs[1].metadata["read_cache"]["entries"] == 1
+    assert jobs[1].metadata["read_cache"]["budget"] == 1 << 20
+
+
+def test_development_dispatcher_does_not_cache_reads():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE, read_cache_budget=1 << 20)
+    input_cfg = Config.configure_pickle_data_node("reference", default_data=[1, 2])
+    input_dn = _DataManager._bulk_get_or_create([input_cfg])[input_cfg]
+    _OrchestratorFactory._build_dispatcher()
+
+    task = Task(config_id="name", properties={}, input=[input_dn], function=_length, output=[])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+
+    _OrchestratorFactory._dispatcher._dispatch(job)
+
+    assert job.is_completed()
+    assert "read_cache" not in job.metadata
+    assert _TaskFunctionWrapper._TaskFunctionWrapper__get_read_cache() is None
+
+
+def test_execution_metrics_are_reported_in_job_metadata():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    input_cfg = Config.configure_pickle_data_node("reference", default_data=list(range(100)))
+    output_cfg = Config.configure_pickle_data_node("length")
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    _OrchestratorFactory._build_dispatcher()
+
+    task = Task("name", {}, _length, input=[data_nodes[input_cfg]], output=[data_nodes[output_cfg]])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+
+    metrics = job.execution_metrics
+    assert job.is_completed()
+    assert metrics["read_duration"] >= 0
+    assert metrics["compute_duration"] >= 0
+    assert metrics["write_duration"] >= 0
+    assert metrics["worker_peak_rss"] > 0
+    input_path = data_nodes[input_cfg].path
+    assert metrics["inputs"][data_nodes[input_cfg].id]["storage_size"] == os.path.getsize(input_path)
+    output_path = data_nodes[output_cfg].path
+    assert metrics["outputs"][data_nodes[output_cfg].id]["storage_size"] == os.path.getsize(output_path)
+    assert metrics["outputs"][data_nodes[output_cfg].id]["duration"] >= 0
+
+
+def test_max_concurrent_jobs_per_task_config():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    Config.configure_task("capped", print, max_concurrent_jobs=1)
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    capped_task = Task("capped", {}, print, [], [])
+    free_task = Task("free", {}, print, [], [])
+    capped_job = Job(JobId("capped_1"), capped_task, "submit_id", capped_task.id)
+    free_job = Job(JobId("free_1"), free_task, "submit_id", free_task.id)
+
+    assert dispatcher._can_run(capped_job)
+    dispatcher._nb_running_jobs_by_task_config["capped"] = 1
+    assert not dispatcher._can_run(Job(JobId("capped_2"), capped_task, "submit_id", capped_task.id))
+    assert dispatcher._can_run(free_job)
+
+    dispatcher._update_job_status(capped_job, [])
+    assert dispatcher._can_run(capped_job)
+    assert dispatcher._nb_running_jobs_by_task_config == {}
+
+
+def _sum_rows(df):
+    return pd.DataFrame({"total": [df["a"].sum()]})
+
+
+def _sum_by_key(df):
+    return {df["key"].iloc[0]: int(df["a"].sum())}
+
+
+def _merge(results):
+    merged = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+def _create_partitioned_input(tmp_path):
+    path = str(tmp_path / "input.csv")
+    pd.DataFrame({"a": range(10), "key": [i % 3 for i in range(10)]}).to_csv(path, index=False)
+    return Config.configure_csv_data_node("input", default_path=path)
+
+
+def test_partitioned_task_in_development_mode(tmp_path):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    input_cfg = _create_partitioned_input(tmp_path)
+    output_cfg = Config.configure_pickle_data_node("output")
+    Config.configure_task("sum", _sum_rows, input_cfg, output_cfg, partition_by="chunks", partition_size=4)
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    _OrchestratorFactory._build_dispatcher()
+
+    task = Task("sum", {}, _sum_rows, input=[data_nodes[input_cfg]], output=[data_nodes[output_cfg]])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+
+    assert job.is_completed()
+    assert job.metadata["nb_of_partitions"] == 3
+    assert _DataManager._get(data_nodes[output_cfg].id).read()["total"].tolist() == [6, 22, 17]
+
+
+def test_partitioned_task_in_standalone_mode(tmp_path):
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    input_cfg = _create_partitioned_input(tmp_path)
+    output_cfg = Config.configure_pickle_data_node("output")
+    Config.configure_task("sum_by_key", _sum_by_key, input_cfg, output_cfg, partition_by="key", reducer=_merge)
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    task = Task("sum_by_key", {}, _sum_by_key, input=[data_nodes[input_cfg]], output=[data_nodes[output_cfg]])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    job.running()
+    dispatcher._dispatch(job)
+
+    assert_true_after_120_second_max(job.is_completed)
+    assert job.metadata["nb_of_partitions"] == 3
+    assert _DataManager._get(data_nodes[output_cfg].id).read() == {0: 18, 1: 12, 2: 15}
+    assert_true_after_120_second_max(lambda: dispatcher._nb_available_workers == 2)
+    # The results spilled by the partitions are removed with their folder.
+    assert not glob.glob(os.path.join(tempfile.gettempdir(), "taipy-id1-*"))
+
+
+def test_partitions_in_flight_are_limited_to_the_workers_held_by_the_job():
+    submitted = []
+    idle_workers = [True]
+    released_workers = []
+
+    def submit(fct, *args):
+        future = Future()
+        submitted.append(future)
+        return future
+
+    def acquire_worker():
+        return bool(idle_workers) and idle_workers.pop()
+
+    def nb_of_partitions_in_flight():
+        return len([future for future in submitted[1:] if not future.done()])
+
+    execution = _PartitionedExecution(
+        submit, "", JobId("id1"), None, acquire_worker, lambda: released_workers.append(True)
+    )
+    submitted[0].set_result([0, 1, 2, 3])
+    assert nb_of_partitions_in_flight() == 2
+
+    for i in range(1, 4):
+        submitted[i].set_result(([], {}))
+        assert nb_of_partitions_in_flight() <= 2
+    assert released_workers == [True]  # The acquired worker is released once no partition is left.
+
+    submitted[4].set_result(([], {}))
+    assert len(submitted) == 6  # The reduction is computed on the worker held by the job.
+    submitted[5].set_result(([], {"nb_of_partitions": 4}))
+    assert execution.future.result() == ([], {"nb_of_partitions": 4})
+    assert released_workers == [True]
+
+
+def test_partitioned_task_with_failing_partition(tmp_path):
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    input_cfg = _create_partitioned_input(tmp_path)
+    Config.configure_task("error", _error_on_partition, input_cfg, partition_by="chunks", partition_size=4)
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg])
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    task = Task("error", {}, _error_on_partition, input=[data_nodes[input_cfg]], output=[])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    job.running()
+    dispatcher._dispatch(job)
+
+    assert_true_after_120_second_max(job.is_failed)
+    assert "Something bad has happened" in job.stacktrace[0]
+
+
+_computed_days = []
+
+
+def _double_by_day(df):
+    _computed_days.append(int(df["day"].iloc[0]))
+    return pd.DataFrame({"a": df["a"], "b": df["a"] * 2, "day": df["day"].astype(int)})
+
+
+def test_incremental_partitioned_task(tmp_path):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    input_cfg = Config.configure_parquet_data_node(
+        "input", default_path=str(tmp_path / "input"), write_kwargs={"partition_cols": ["day"]}
+    )
+    output_cfg = Config.configure_csv_data_node("output", default_path=str(tmp_path / "output.csv"))
+    Config.configure_task("double", _double_by_day, input_cfg, output_cfg, partition_by="day", incremental=True)
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    input_dn, output_dn = data_nodes[input_cfg], data_nodes[output_cfg]
+    input_dn.write(pd.DataFrame({"a": [1, 2, 3], "day": [1, 1, 2]}))
+    assert _DataManager._get(input_dn.id).edits[-1]["partitions"] == ["1", "2"]
+    _OrchestratorFactory._build_dispatcher()
+    task = Task("double", {}, _double_by_day, input=[input_dn], output=[output_dn])
+
+    _computed_days.clear()
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+    assert job.is_completed()
+    assert sorted(_computed_days) == [1, 2]
+    assert "changed_partitions" not in job.metadata
+
+    # A new day is appended to the dataset: only its partition is computed and merged in the output.
+    _DataManager._get(input_dn.id).write(pd.DataFrame({"a": [4], "day": [3]}))
+    _computed_days.clear()
+    job = Job(JobId("id2"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+    assert job.is_completed()
+    assert _computed_days == [3]
+    assert job.metadata["changed_partitions"] == ["3"]
+    output = _DataManager._get(output_dn.id)
+    assert output.read().sort_values("a")["b"].tolist() == [2, 4, 6, 8]
+    assert output.edits[-1]["partitions"] == ["3"]
+
+    # An edit that does not record its partitions recomputes everything.
+    _DataManager._get(input_dn.id).write(pd.DataFrame({"a": [5], "day": [1]}), partitions=None)
+    _computed_days.clear()
+    job = Job(JobId("id3"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+    assert job.is_completed()
+    assert sorted(_computed_days) == [1, 2, 3]
+    assert "changed_partitions" not in job.metadata
+
+
+def test_incremental_partitioned_task_replaces_parquet_partitions_in_place(tmp_path):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    input_cfg = Config.configure_parquet_data_node(
+        "input", default_path=str(tmp_path / "input"), write_kwargs={"partition_cols": ["day"]}
+    )
+    output_cfg = Config.configure_parquet_data_node(
+        "output", default_path=str(tmp_path / "output"), write_kwargs={"partition_cols": ["day"]}
+    )
+    Config.configure_task("double", _double_by_day, input_cfg, output_cfg, partition_by="day", incremental=True)
+    data_nodes = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+    input_dn, output_dn = data_nodes[input_cfg], data_nodes[output_cfg]
+    input_dn.write(pd.DataFrame({"a": [1, 2, 3], "day": [1, 1, 2]}))
+    _OrchestratorFactory._build_dispatcher()
+    task = Task("double", {}, _double_by_day, input=[input_dn], output=[output_dn])
+    job = Job(JobId("id1"), task, "submit_id", task.id)
+    _OrchestratorFactory._dispatcher._dispatch(job)
+    assert job.is_completed()
+    unchanged_files = os.listdir(tmp_path / "output" / "day=1")
+
+    # Only the folder of the new day is written: the output is not read back.
+    _DataManager._get(input_dn.id).write(pd.DataFrame({"a": [4], "day": [3]}))
+    job = Job(JobId("id2"), task, "submit_id", task.id)
+    with mock.patch("src.taipy.core.data.parquet.ParquetDataNode.read_or_raise") as read_or_raise:
+        _OrchestratorFactory._dispatcher._dispatch(job)
+        read_or_raise.assert_not_called()
+    assert job.is_completed()
+    assert os.listdir(tmp_path / "output" / "day=1") == unchanged_files
+    output = _DataManager._get(output_dn.id)
+    assert output.read().sort_values("a")["b"].tolist() == [2, 4, 6, 8]
+    assert output.edits[-1]["partitions"] == ["3"]
+
+
+def _error_on_partition(df):
+    if 8 in df["a"].tolist():
+        _error()
+    return df
+
+
 def assert_true_after_120_second_max(assertion):
     start = datetime.now()
     while (datetime.now() - start).seconds < 120:
@@ -0,0 +1,144 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from multiprocessing.connection import Client
+
+import pytest
+
+from src.taipy.core._orchestrator._dispatcher._remote_job_dispatcher import _RemoteJobDispatcher
+from src.taipy.core._orchestrator._orchestrator import _Orchestrator
+from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core._orchestrator._worker import _Worker
+from src.taipy.core._orchestrator._worker._protocol import _REGISTER, _RUN, _parse_address
+from src.taipy.core.config.job_config import JobConfig
+from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.exceptions.exceptions import MissingAuthenticationKey
+from src.taipy.core.task._task_manager import _TaskManager
+from taipy.config.common.scope import Scope
+from taipy.config.config import Config
+from tests.core.utils import assert_true_after_time
+
+
+def multiply(nb1: float, nb2: float):
+    return nb1 * nb2
+
+
+@pytest.fixture
+def workers():
+    workers = []
+    yield workers
+    for worker in workers:
+        worker.stop()
+    _OrchestratorFactory._remove_dispatcher()
+
+
+def _create_tasks(nb_tasks):
+    input_configs = [
+        Config.configure_data_node("input1", "pickle", Scope.SCENARIO, default_data=21),
+        Config.configure_data_node("input2", "pickle", Scope.SCENARIO, default_data=2),
+    ]
+    task_configs = [
+        Config.configure_task(
+            f"task_{i}", multiply, input_configs, Config.configure_data_node(f"output_{i}", "pickle", Scope.SCENARIO)
+        )
+        for i in range(nb_tasks)
+    ]
+    return _TaskManager._bulk_get_or_create(task_configs)
+
+
+def _build_dispatcher() -> _RemoteJobDispatcher:
+    _OrchestratorFactory._build_dispatcher()
+    dispatcher = _OrchestratorFactory._dispatcher
+    assert isinstance(dispatcher, _RemoteJobDispatcher)
+    return dispatcher  # type: ignore
+
+
+def _start_worker(workers, dispatcher, **kwargs):
+    host, port = dispatcher.address
+    worker = _Worker(f"{host}:{port}", authkey="secret", heartbeat_interval=0.2, **kwargs)
+    threading.Thread(target=worker.run, daemon=True).start()
+    workers.append(worker)
+    return worker
+
+
+def _connect_fake_worker(dispatcher, worker_id):
+    connection = Client(dispatcher.address, authkey=b"secret")
+    connection.send((_REGISTER, worker_id, 1))
+    return connection
+
+
+def test_parse_address():
+    assert _parse_address("localhost:5555") == ("localhost", 5555)
+    assert _parse_address("/tmp/taipy.sock") == "/tmp/taipy.sock"
+
+
+def test_authentication_key_is_required():
+    Config.configure_job_executions(mode=JobConfig._REMOTE_MODE, remote_address="127.0.0.1:0")
+    with pytest.raises(MissingAuthenticationKey):
+        _RemoteJobDispatcher(_Orchestrator)
+    with pytest.raises(MissingAuthenticationKey):
+        _Worker("127.0.0.1:5555", authkey="")
+
+
+def test_dispatch_jobs_on_several_workers(workers):
+    Config.configure_job_executions(
+        mode=JobConfig._REMOTE_MODE, remote_address="127.0.0.1:0", remote_authkey="secret", heartbeat_interval=0.2
+    )
+    tasks = _create_tasks(4)
+    dispatcher = _build_dispatcher()
+    assert dispatcher._nb_available_workers == 0
+
+    _start_worker(workers, dispatcher, max_nb_of_workers=2)
+    _start_worker(workers, dispatcher)
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 3)
+
+    jobs = [_Orchestrator.submit_task(task) for task in tasks]
+
+    assert_true_after_time(lambda: all(job.is_completed() for job in jobs))
+    for task in tasks:
+        assert _DataManager._get(list(task.output.values())[0].id).read() == 42
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 3)
+
+
+def test_reassign_jobs_of_disconnected_worker(workers):
+    Config.configure_job_executions(
+        mode=JobConfig._REMOTE_MODE, remote_address="127.0.0.1:0", remote_authkey="secret", heartbeat_interval=5
+    )
+    task = _create_tasks(1)[0]
+    dispatcher = _build_dispatcher()
+    connection = _connect_fake_worker(dispatcher, "lost_worker")
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 1)
+
+    job = _Orchestrator.submit_task(task)
+    assert connection.poll(10)
+    assert connection.recv()[:2] == (_RUN, job.id)
+    assert_true_after_time(job.is_running)
+
+    connection.close()
+    assert_true_after_time(job.is_pending)
+    assert dispatcher._nb_available_workers == 0
+
+    _start_worker(workers, dispatcher)
+    assert_true_after_time(job.is_completed)
+    assert _DataManager._get(list(task.output.values())[0].id).read() == 42
+
+
+def test_remove_worker_missing_heartbeats(workers):
+    Config.configure_job_executions(
+        mode=JobConfig._REMOTE_MODE, remote_address="127.0.0.1:0", remote_authkey="secret", heartbeat_interval=1
+    )
+    dispatcher = _build_dispatcher()
+    connection = _connect_fake_worker(dispatcher, "silent_worker")
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 1)
+
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 0)
+    connection.close()
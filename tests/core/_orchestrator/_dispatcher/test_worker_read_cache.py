@@ -0,0 +1,96 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.taipy.core._orchestrator._dispatcher._worker_read_cache import _WorkerReadCache
+from src.taipy.core.data.in_memory import InMemoryDataNode
+from src.taipy.core.data.pickle import PickleDataNode
+from taipy.config.common.scope import Scope
+
+
+@pytest.fixture(scope="function", autouse=True)
+def cleanup():
+    yield
+    for path in [".data/pickles/reference_0.p", ".data/pickles/reference_1.p"]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _pickle_data_node(name, data):
+    return PickleDataNode(name, Scope.GLOBAL, properties={"default_data": data})
+
+
+def test_cache_hit_and_invalidation_on_write():
+    cache = _WorkerReadCache(1 << 20)
+    dn = _pickle_data_node("reference", np.arange(10))
+
+    assert cache._read(dn).tolist() == list(range(10))
+    assert cache._read(dn).tolist() == list(range(10))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    dn.write(np.arange(5))
+    assert cache._read(dn).tolist() == list(range(5))
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 1)
+    assert cache._stats()["entries"] == 1
+    assert cache._stats()["size"] == np.arange(5).nbytes
+
+
+def test_least_recently_used_entries_are_evicted_beyond_budget():
+    data = np.zeros(100, dtype=np.int8)
+    cache = _WorkerReadCache(150)
+    dn_0 = _pickle_data_node("reference_0", data)
+    dn_1 = _pickle_data_node("reference_1", data)
+
+    cache._read(dn_0)
+    cache._read(dn_1)
+    assert cache._stats()["entries"] == 1
+    assert cache.evictions == 1
+
+    cache._read(dn_1)
+    assert cache.hits == 1
+
+
+def test_data_larger_than_budget_and_non_file_data_nodes_are_not_cached():
+    cache = _WorkerReadCache(10)
+    cache._read(_pickle_data_node("reference", np.zeros(100, dtype=np.int8)))
+    assert cache._stats()["entries"] == 0
+
+    cache = _WorkerReadCache(1 << 20)
+    dn = InMemoryDataNode("in_memory", Scope.SCENARIO, properties={"default_data": [1, 2]})
+    assert cache._read(dn) == [1, 2]
+    assert cache._read(dn) == [1, 2]
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache._stats()["entries"] == 0
+
+
+class _Opaque:
+    pass
+
+
+def test_size_is_estimated_without_pickling_the_data():
+    cache = _WorkerReadCache(1 << 20)
+    df = pd.DataFrame({"a": range(10), "b": ["x"] * 10})
+    with mock.patch("pickle.dumps") as dumps:
+        cache._read(_pickle_data_node("reference_0", df))
+        cache._read(_pickle_data_node("reference_1", {"a": [1, 2], "b": "text"}))
+        dumps.assert_not_called()
+    assert cache._stats()["entries"] == 2
+    assert cache._stats()["size"] > df.memory_usage(deep=True).sum()
+
+    cache = _WorkerReadCache(1 << 20)
+    cache._read(_pickle_data_node("reference_0", [_Opaque()]))
+    assert cache._stats()["entries"] == 0
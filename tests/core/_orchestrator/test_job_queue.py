@@ -0,0 +1,114 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from queue import Empty
+
+import pytest
+
+from src.taipy.core._orchestrator._job_queue import _JobQueue
+from src.taipy.core.job.job import Job
+from src.taipy.core.job.job_id import JobId
+from src.taipy.core.task.task import Task
+
+
+def _job(name, submit_id, priority=0, config_id="task"):
+    task = Task(config_id, {}, print, [], [])
+    return Job(JobId(name), task, submit_id, task.id, priority=priority)
+
+
+def _drain(queue, **kwargs):
+    jobs = []
+    while not queue.empty():
+        jobs.append(queue.get(block=False, **kwargs).id)
+    return jobs
+
+
+def test_get_follows_priority_then_submission_order():
+    queue = _JobQueue()
+    queue.put(_job("low", "s1"))
+    queue.put(_job("high", "s2", priority=10))
+    queue.put(_job("low_2", "s1"))
+
+    assert queue.qsize() == 3
+    assert _drain(queue) == ["high", "low", "low_2"]
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+
+
+def test_submissions_share_the_queue_fairly():
+    queue = _JobQueue()
+    for i in range(4):
+        queue.put(_job(f"batch_{i}", "batch"))
+    assert queue.get(block=False).id == "batch_0"
+
+    queue.put(_job("interactive_0", "interactive"))
+    queue.put(_job("interactive_1", "interactive"))
+
+    assert _drain(queue) == ["interactive_0", "batch_1", "interactive_1", "batch_2", "batch_3"]
+
+
+def test_remove_by_job_id():
+    queue = _JobQueue()
+    jobs = [_job(f"job_{i}", "s1") for i in range(3)]
+    for job in jobs:
+        queue.put(job)
+
+    assert queue.remove(jobs[0].id)
+    assert queue.remove(jobs[2].id)
+    assert not queue.remove(jobs[2].id)
+    assert jobs[1] in queue
+    assert jobs[0] not in queue
+    assert queue.qsize() == 1
+    assert _drain(queue) == ["job_1"]
+
+
+def test_jobs_that_cannot_run_stay_in_the_queue():
+    queue = _JobQueue()
+    queue.put(_job("capped", "s1", priority=1, config_id="capped"))
+    queue.put(_job("free", "s1", config_id="free"))
+
+    assert queue.get(block=False, can_run=lambda job: job._task.config_id != "capped").id == "free"
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01, can_run=lambda job: job._task.config_id != "capped")
+    assert queue.get(block=False).id == "capped"
+
+
+def test_blocked_jobs_are_not_checked_again_until_something_changes():
+    queue = _JobQueue()
+    for i in range(5):
+        queue.put(_job(f"capped_{i}", "s1", config_id="capped"))
+    checked = []
+    capped = {"capped"}
+
+    def can_run(job):
+        checked.append(job.id)
+        return job._task.config_id not in capped
+
+    with pytest.raises(Empty):
+        queue.get(block=False, can_run=can_run)
+    assert len(checked) == 5
+    with pytest.raises(Empty):
+        queue.get(block=False, can_run=can_run)
+    assert len(checked) == 5
+
+    queue.put(_job("free", "s2", config_id="free"))
+    assert queue.get(block=False, can_run=can_run).id == "free"
+    assert len(checked) == 6
+
+    capped.clear()
+    with pytest.raises(Empty):
+        queue.get(block=False, can_run=can_run)
+    queue._notify_change()
+    assert queue.get(block=False, can_run=can_run).id == "capped_0"
+    assert [queue.get(block=False, can_run=can_run).id for _ in range(4)] == [f"capped_{i}" for i in range(1, 5)]
+    assert queue.empty()
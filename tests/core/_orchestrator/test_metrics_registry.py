@@ -0,0 +1,70 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from urllib.request import urlopen
+
+from src.taipy.core._orchestrator._metrics_registry import _MetricsRegistry
+
+
+def test_counters_gauges_and_histograms():
+    _MetricsRegistry._increment(_MetricsRegistry._JOBS_SUBMITTED)
+    _MetricsRegistry._increment(_MetricsRegistry._JOBS_SUBMITTED, 2)
+    _MetricsRegistry._increment(_MetricsRegistry._JOBS_FINISHED, labels={"status": "failed"})
+    _MetricsRegistry._set_gauge(_MetricsRegistry._JOBS_TO_RUN, 5)
+    _MetricsRegistry._set_gauge(_MetricsRegistry._JOBS_TO_RUN, 3)
+    _MetricsRegistry._observe(_MetricsRegistry._JOB_PENDING_SECONDS, 0.002)
+    _MetricsRegistry._observe(_MetricsRegistry._JOB_PENDING_SECONDS, 2)
+    _MetricsRegistry._observe(_MetricsRegistry._JOB_PENDING_SECONDS, 10000)
+
+    metrics = _MetricsRegistry._get_metrics()
+    assert metrics["counters"] == {"jobs_submitted_total": 3, 'jobs_finished_total{status="failed"}': 1}
+    assert metrics["gauges"] == {"jobs_to_run": 3}
+    histogram = metrics["histograms"]["job_pending_seconds"]
+    assert histogram["count"] == 3
+    assert histogram["sum"] == 10002.002
+    assert histogram["buckets"][0.005] == 1
+    assert histogram["buckets"][1] == 1
+    assert histogram["buckets"][5] == 2
+    assert histogram["buckets"][3600] == 2
+
+    _MetricsRegistry._clear()
+    assert _MetricsRegistry._get_metrics() == {"counters": {}, "gauges": {}, "histograms": {}}
+
+
+def test_to_prometheus():
+    _MetricsRegistry._increment(_MetricsRegistry._JOBS_FINISHED, labels={"status": "completed"})
+    _MetricsRegistry._set_gauge(_MetricsRegistry._AVAILABLE_WORKERS, 2)
+    _MetricsRegistry._observe(_MetricsRegistry._JOB_RUNNING_SECONDS, 0.2)
+
+    lines = _MetricsRegistry._to_prometheus().splitlines()
+    assert "# TYPE taipy_jobs_finished_total counter" in lines
+    assert 'taipy_jobs_finished_total{status="completed"} 1' in lines
+    assert "# TYPE taipy_available_workers gauge" in lines
+    assert "taipy_available_workers 2" in lines
+    assert "# TYPE taipy_job_running_seconds histogram" in lines
+    assert 'taipy_job_running_seconds_bucket{le="0.1"} 0' in lines
+    assert 'taipy_job_running_seconds_bucket{le="0.5"} 1' in lines
+    assert 'taipy_job_running_seconds_bucket{le="+Inf"} 1' in lines
+    assert "taipy_job_running_seconds_sum 0.2" in lines
+    assert "taipy_job_running_seconds_count 1" in lines
+
+
+def test_http_server():
+    _MetricsRegistry._set_gauge(_MetricsRegistry._BLOCKED_JOBS, 4)
+    _MetricsRegistry._start_http_server(0)
+    try:
+        port = _MetricsRegistry._server.server_port
+        with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.status == 200
+            assert "taipy_blocked_jobs 4" in response.read().decode().splitlines()
+    finally:
+        _MetricsRegistry._stop_http_server()
+    assert _MetricsRegistry._server is None
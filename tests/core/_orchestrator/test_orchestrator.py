@@ -10,21 +10,31 @@
 # specific language governing permissions and limitations under the License.
 
 import multiprocessing
+import os
 import random
+import socket
 import string
 from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial
 from time import sleep
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from src.taipy.core import taipy
+from src.taipy.core._orchestrator._metrics_registry import _MetricsRegistry
 from src.taipy.core._orchestrator._orchestrator import _Orchestrator
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from src.taipy.core._orchestrator._stream_channel import _StreamChannel
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.data._shared_memory import _SharedMemoryRegistry
 from src.taipy.core.data.in_memory import InMemoryDataNode
+from src.taipy.core.job._job_manager import _JobManager
+from src.taipy.core.job._job_owner import _JobOwner
+from src.taipy.core.job.job import Job
 from src.taipy.core.pipeline._pipeline_manager import _PipelineManager
 from src.taipy.core.pipeline.pipeline import Pipeline
 from src.taipy.core.scenario._scenario_manager import _ScenarioManager
@@ -95,6 +105,104 @@ def test_submit_task():
     assert job.is_completed()
 
 
+def test_submit_task_with_priority():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    task = _create_task(multiply)
+    _TaskManager._set(task)
+    _OrchestratorFactory._build_dispatcher()
+
+    job = _Orchestrator.submit_task(task, priority=5)
+
+    assert job.priority == 5
+    assert taipy.get(job.id).priority == 5
+    assert job.is_completed()
+
+
+def test_submit_task_updates_metrics():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    task = _create_task(multiply)
+    _TaskManager._set(task)
+    _OrchestratorFactory._build_dispatcher()
+
+    _Orchestrator.submit_task(task)
+    _Orchestrator.submit_task(task)
+
+    metrics = taipy.get_metrics()
+    assert metrics["counters"][_MetricsRegistry._JOBS_SUBMITTED] == 2
+    assert metrics["counters"][_MetricsRegistry._JOBS_DISPATCHED] == 2
+    assert metrics["counters"][f'{_MetricsRegistry._JOBS_FINISHED}{{status="completed"}}'] == 2
+    assert metrics["gauges"][_MetricsRegistry._JOBS_TO_RUN] == 0
+    assert metrics["gauges"][_MetricsRegistry._BLOCKED_JOBS] == 0
+    assert metrics["histograms"][_MetricsRegistry._JOB_PENDING_SECONDS]["count"] == 2
+    running_seconds = metrics["histograms"][_MetricsRegistry._JOB_RUNNING_SECONDS]
+    assert running_seconds["count"] == 2
+    assert running_seconds["sum"] >= 0.2
+
+
+def test_recover_jobs():
+    dn_1 = InMemoryDataNode("dn_config_1", Scope.SCENARIO, properties={"default_data": 1})
+    dn_2 = InMemoryDataNode("dn_config_2", Scope.SCENARIO)
+    dn_3 = InMemoryDataNode("dn_config_3", Scope.SCENARIO)
+    task_1 = Task("task_config_1", {}, mult_by_2, [dn_1], [dn_2])
+    task_2 = Task("task_config_2", {}, mult_by_2, [dn_2], [dn_3])
+    for dn in [dn_1, dn_2, dn_3]:
+        _DataManager._set(dn)
+    _TaskManager._set(task_1)
+    _TaskManager._set(task_2)
+
+    # Unfinished jobs left in the repository by a previous run of the application.
+    running_job = _JobManager._create(task_1, [_Orchestrator._on_status_change], "submit_id", task_1.id)
+    running_job.running()
+    blocked_job = _JobManager._create(task_2, [_Orchestrator._on_status_change], "submit_id", task_1.id)
+    blocked_job.blocked()
+    completed_job = _JobManager._create(task_1, [_Orchestrator._on_status_change], "submit_id", task_1.id)
+    completed_job.completed()
+
+    recovered_jobs = _Orchestrator._recover_jobs()
+
+    assert [job.id for job in recovered_jobs] == [running_job.id, blocked_job.id]
+    assert _Orchestrator.jobs_to_run.qsize() == 1
+    assert running_job in _Orchestrator.jobs_to_run
+    assert [job.id for job in _Orchestrator.blocked_jobs] == [blocked_job.id]
+    assert _JobManager._get(running_job.id).is_pending()
+    assert _JobManager._get(blocked_job.id).is_blocked()
+    assert _JobManager._get(completed_job.id).is_completed()
+    assert _DataManager._get(dn_2.id).edit_in_progress
+    assert _Orchestrator._recover_jobs() == []
+
+
+def test_recover_only_jobs_whose_owner_is_gone():
+    dn_1 = InMemoryDataNode("dn_config_1", Scope.SCENARIO, properties={"default_data": 1})
+    dn_2 = InMemoryDataNode("dn_config_2", Scope.SCENARIO)
+    task = Task("task_config_1", {}, mult_by_2, [dn_1], [dn_2])
+    _DataManager._set(dn_1)
+    _DataManager._set(dn_2)
+    _TaskManager._set(task)
+    exited_process = multiprocessing.Process(target=print)
+    exited_process.start()
+    exited_process.join()
+
+    owners = {
+        "exited_process": {"host": socket.gethostname(), "pid": exited_process.pid},
+        "live_process": {"host": socket.gethostname(), "pid": os.getppid()},
+        "other_host": {"host": f"not_{socket.gethostname()}", "pid": exited_process.pid},
+    }
+    jobs = {}
+    for name, owner in owners.items():
+        job = _JobManager._create(task, [_Orchestrator._on_status_change], name, task.id)
+        job._metadata[Job._OWNER_KEY] = owner
+        _JobManager._set(job)
+        job.running()
+        jobs[name] = job
+
+    recovered_jobs = _Orchestrator._recover_jobs()
+
+    assert [job.id for job in recovered_jobs] == [jobs["exited_process"].id]
+    assert _JobManager._get(jobs["exited_process"].id).metadata[Job._OWNER_KEY] == _JobOwner._current()
+    assert _JobManager._get(jobs["live_process"].id).is_running()
+    assert _JobManager._get(jobs["other_host"].id).is_running()
+
+
 def test_submit_pipeline_generate_unique_submit_id(pipeline, task):
     dn_1 = InMemoryDataNode("dn_config_id_1", Scope.SCENARIO)
     dn_2 = InMemoryDataNode("dn_config_id_2", Scope.SCENARIO)
@@ -858,6 +966,138 @@ def test_blocked_scenario():
     assert_true_after_time(lambda: len(_OrchestratorFactory._dispatcher._dispatched_processes) == 0)
 
 
+def _produce_batches(n):
+    for i in range(3):
+        yield pd.DataFrame({"a": [i * n, i * n + 1]})
+
+
+def _sum_batches(batches):
+    for batch in batches:
+        yield pd.DataFrame({"total": [batch["a"].sum()]})
+
+
+def _produce_batches_until_consumed(signal_path):
+    yield pd.DataFrame({"a": [1]})
+    for _ in range(600):
+        if os.path.exists(signal_path):
+            break
+        sleep(0.1)
+    else:
+        raise Exception("The first batch was not consumed while the stream was produced.")
+    yield pd.DataFrame({"a": [2]})
+
+
+def _consume_batches(batches, signal_path):
+    total = 0
+    for batch in batches:
+        open(signal_path, "w").close()
+        total += int(batch["a"].sum())
+    return total
+
+
+def test_stream_batches_between_tasks(tmpdir_factory):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    folder = tmpdir_factory.mktemp("streams")
+    n_cfg = Config.configure_data_node("n", default_data=10)
+    batches_cfg = Config.configure_csv_data_node("batches", default_path=str(folder.join("batches.csv")))
+    totals_cfg = Config.configure_csv_data_node("totals", default_path=str(folder.join("totals.csv")))
+    produce_cfg = Config.configure_task("produce", _produce_batches, n_cfg, batches_cfg)
+    sum_cfg = Config.configure_task("sum", _sum_batches, batches_cfg, totals_cfg, streaming=True)
+    _OrchestratorFactory._build_dispatcher()
+
+    produce, sum_task = _TaskManager._bulk_get_or_create([produce_cfg, sum_cfg])
+    jobs = _Orchestrator.submit(Pipeline("pipeline", {}, [produce, sum_task]))
+
+    produce_job, sum_job = sorted(jobs, key=lambda job: job.creation_date)
+    assert produce_job.is_completed()
+    assert sum_job.is_completed()
+    assert sum_job.metadata["streamed_from"] == produce_job.id
+    assert _DataManager._get(produce.batches.id).read()["a"].tolist() == [0, 1, 10, 11, 20, 21]
+    assert _DataManager._get(sum_task.totals.id).read()["total"].tolist() == [1, 21, 41]
+    assert not os.path.exists(_StreamChannel._get_folder(produce_job.submit_id))
+
+    # Submitted alone, a streaming task iterates over the chunks of its input.
+    sum_job = _Orchestrator.submit_task(sum_task)
+    assert sum_job.is_completed()
+    assert "streamed_from" not in sum_job.metadata
+    assert _DataManager._get(sum_task.totals.id).read()["total"].tolist() == [63]
+
+
+def _produce_batches_and_fail():
+    yield 1
+    raise Exception("Interrupted")
+
+
+def test_stream_interrupted_by_failed_producer():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    batches_cfg = Config.configure_data_node("batches")
+    total_cfg = Config.configure_data_node("total")
+    produce_cfg = Config.configure_task("produce", _produce_batches_and_fail, [], batches_cfg)
+    sum_cfg = Config.configure_task("sum", sum, batches_cfg, total_cfg, streaming=True)
+    _OrchestratorFactory._build_dispatcher()
+
+    produce, sum_task = _TaskManager._bulk_get_or_create([produce_cfg, sum_cfg])
+    jobs = _Orchestrator.submit(Pipeline("pipeline", {}, [produce, sum_task]))
+
+    produce_job, sum_job = sorted(jobs, key=lambda job: job.creation_date)
+    assert produce_job.is_failed()
+    assert sum_job.is_failed()
+    assert "StreamInterrupted" in sum_job.stacktrace[0]
+
+
+def test_stream_batches_between_running_tasks(tmpdir_factory):
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    signal_path = str(tmpdir_factory.mktemp("streams").join("signal"))
+    signal_cfg = Config.configure_data_node("signal_path", default_data=signal_path)
+    batches_cfg = Config.configure_data_node("batches")
+    total_cfg = Config.configure_data_node("total")
+    produce_cfg = Config.configure_task("produce", _produce_batches_until_consumed, signal_cfg, batches_cfg)
+    consume_cfg = Config.configure_task(
+        "consume", _consume_batches, [batches_cfg, signal_cfg], total_cfg, streaming=True
+    )
+    _OrchestratorFactory._build_dispatcher()
+
+    produce, consume = _TaskManager._bulk_get_or_create([produce_cfg, consume_cfg])
+    jobs = _Orchestrator.submit(Pipeline("pipeline", {}, [produce, consume]))
+
+    # The producer only yields its second batch once the first one is consumed.
+    assert_true_after_time(lambda: all(job.is_completed() for job in jobs))
+    assert _DataManager._get(consume.total.id).read() == 3
+    assert _DataManager._get(produce.batches.id).read()["a"].tolist() == [1, 2]
+
+
+def _make_array(n):
+    return np.arange(n)
+
+
+def _sum_read_only_array(array):
+    assert not array.flags.writeable  # The array is mapped from the shared memory segment.
+    return int(array.sum())
+
+
+def test_shared_memory_segments_are_evicted_once_the_submission_is_over(tmpdir_factory):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    n_cfg = Config.configure_data_node("n", default_data=1000)
+    array_cfg = Config.configure_pickle_data_node(
+        "array", default_path=str(tmpdir_factory.mktemp("shared").join("array.p")), transport="shared_memory"
+    )
+    total_cfg = Config.configure_data_node("total")
+    make_cfg = Config.configure_task("make", _make_array, n_cfg, array_cfg)
+    sum_cfg = Config.configure_task("sum", _sum_read_only_array, array_cfg, total_cfg)
+    _OrchestratorFactory._build_dispatcher()
+
+    make, sum_task = _TaskManager._bulk_get_or_create([make_cfg, sum_cfg])
+    jobs = _Orchestrator.submit(Pipeline("pipeline", {}, [make, sum_task]))
+
+    assert all(job.is_completed() for job in jobs)
+    assert _DataManager._get(sum_task.total.id).read() == 499500
+    array_dn = _DataManager._get(make.array.id)
+    assert array_dn._get_shared_memory_reference() is None
+    assert np.array_equal(array_dn.read(), np.arange(1000))
+    assert _SharedMemoryRegistry._owned_segments == {}
+    assert _Orchestrator._submission_jobs == {}
+
+
 def test_task_orchestrator_create_synchronous_dispatcher():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
     _OrchestratorFactory._build_dispatcher()
@@ -868,7 +1108,7 @@ def test_task_orchestrator_create_synchronous_dispatcher():
 def test_task_orchestrator_create_standalone_dispatcher():
     Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=3)
     _OrchestratorFactory._build_dispatcher()
-    assert isinstance(_OrchestratorFactory._dispatcher._executor, ProcessPoolExecutor)
+    assert isinstance(_OrchestratorFactory._dispatcher._executors[0], ProcessPoolExecutor)
     assert _OrchestratorFactory._dispatcher._nb_available_workers == 3
 
 
@@ -45,3 +45,29 @@ class TestJobConfigChecker:
             ' value of property `storage_type` is "in_memory".'
         )
         assert expected_error_message in caplog.text
+
+    def test_check_start_method(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="spawn")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, start_method="thread")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "The start method of the worker processes must be one of" in caplog.text
+
+    def test_check_remote_authkey(self, caplog):
+        Config.configure_job_executions(mode=JobConfig._REMOTE_MODE)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "An authentication key is required in remote mode." in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._REMOTE_MODE, remote_authkey="secret")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
@@ -27,6 +27,21 @@ def test_job_config():
     Config.configure_job_executions(foo="bar")
     assert Config.job_config.foo == "bar"
 
+    Config.configure_job_executions(max_nb_of_io_threads=4)
+    assert Config.job_config.max_nb_of_io_threads == 4
+
+    job_c = Config.configure_job_executions(
+        mode="remote", remote_address="0.0.0.0:5000", remote_authkey="key", heartbeat_interval=2
+    )
+    assert job_c.is_remote
+    assert not job_c.is_standalone
+    assert Config.job_config.remote_address == "0.0.0.0:5000"
+    assert Config.job_config.remote_authkey == "key"
+    assert Config.job_config.heartbeat_interval == 2
+
+    Config.configure_job_executions(mode="standalone", start_method="forkserver")
+    assert Config.job_config.start_method == "forkserver"
+
 
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=2, prop="foo")
@@ -22,7 +22,7 @@ import pytest
 from src.taipy.core.data._data_manager import _DataManager
 from src.taipy.core.data.csv import CSVDataNode
 from src.taipy.core.data.data_node_id import DataNodeId
-from src.taipy.core.exceptions.exceptions import InvalidExposedType, NoData
+from src.taipy.core.exceptions.exceptions import DataNodeWritingError, InvalidExposedType, NoData, UnknownCSVEngine
 from taipy.config.common.scope import Scope
 from taipy.config.config import Config
 from taipy.config.exceptions.exceptions import InvalidConfigurationId
@@ -250,6 +250,124 @@ class TestCSVDataNode:
         with pytest.raises(InvalidExposedType):
             CSVDataNode("foo", Scope.SCENARIO, properties={"path": path, "exposed_type": "foo"})
 
+    def test_raise_error_unknown_engine(self):
+        path = os.path.join(pathlib.Path(__file__).parent.resolve(), "data_sample/example.csv")
+        with pytest.raises(UnknownCSVEngine):
+            CSVDataNode("foo", Scope.SCENARIO, properties={"path": path, "engine": "foo"})
+
+    @pytest.mark.parametrize("engine", [None, "python", "pyarrow"])
+    def test_read_chunks(self, tmpdir_factory, engine):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        pd.DataFrame({"id": range(5), "integer": range(10, 15), "text": list("abcde")}).to_csv(
+            temp_file_path, index=False
+        )
+
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path, "engine": engine})
+        chunks = list(dn.read_chunks(2))
+        assert [chunk["id"].tolist() for chunk in chunks] == [[0, 1], [2, 3], [4]]
+        assert dn.read()["text"].tolist() == list("abcde")
+
+        chunks = list(dn.read_chunks(3, columns=["text", "id"], dtype={"id": "float64"}))
+        assert [list(chunk.columns) for chunk in chunks] == [["text", "id"], ["text", "id"]]
+        assert chunks[1]["id"].tolist() == [3.0, 4.0]
+        assert chunks[1]["id"].dtype == "float64"
+        (chunk,) = dn.read_chunks(5, dtype={"integer": str, "text": "category"})
+        assert chunk["integer"].tolist() == ["10", "11", "12", "13", "14"]
+        assert chunk["text"].dtype == "category"
+
+        properties = {"path": temp_file_path, "engine": engine, "exposed_type": MyCustomObject}
+        dn = CSVDataNode("bar", Scope.SCENARIO, properties=properties)
+        chunks = list(dn.read_chunks(4))
+        assert [len(chunk) for chunk in chunks] == [4, 1]
+        assert isinstance(chunks[1][0], MyCustomObject)
+        assert chunks[1][0].text == "e"
+
+        properties = {"path": temp_file_path, "engine": engine, "has_header": False, "exposed_type": "numpy"}
+        dn = CSVDataNode("baz", Scope.SCENARIO, properties=properties)
+        chunks = list(dn.read_chunks(4, columns=[2]))
+        assert [chunk.tolist() for chunk in chunks] == [[["text"], ["a"], ["b"], ["c"]], [["d"], ["e"]]]
+
+        open(temp_file_path, "w").close()
+        assert list(dn.read_chunks(4)) == []
+
+    def test_read_partitions(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        df = pd.DataFrame({"a": range(10), "key": [i % 3 for i in range(10)]})
+        df.to_csv(temp_file_path, index=False)
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+
+        partitions = dn._get_partitions("chunks", 4)
+        assert len(partitions) == 3
+        chunks = [dn._read_partition(partition) for partition in partitions]
+        assert [chunk["a"].tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert list(chunks[1].columns) == ["a", "key"]
+
+        partitions = dn._get_partitions("key", 4)
+        assert [partition["value"] for partition in partitions] == [0, 1, 2]
+        assert dn._read_partition(partitions[1])["a"].tolist() == [1, 4, 7]
+
+        dn = CSVDataNode(
+            "bar", Scope.SCENARIO, properties={"path": temp_file_path, "has_header": False, "exposed_type": "numpy"}
+        )
+        partitions = dn._get_partitions("chunks", 6)
+        assert [len(dn._read_partition(partition)) for partition in partitions] == [6, 5]
+
+    def test_read_partitions_with_multi_line_fields(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        df = pd.DataFrame({"a": range(6), "text": ["x", 'first\nsecond "quoted"', "y", "line\n\nbreaks", "z", "t"]})
+        df.to_csv(temp_file_path, index=False)
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+
+        partitions = dn._get_partitions("chunks", 2)
+        assert pd.concat((dn._read_partition(partition) for partition in partitions), ignore_index=True).equals(df)
+
+        partitions = dn._get_partitions("text", 2)
+        assert [partition["value"] for partition in partitions] == df["text"].tolist()
+        assert dn._read_partition(partitions[3])["a"].tolist() == [3]
+
+    def test_read_partitions_with_the_types_of_the_first_rows(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        pd.DataFrame({"a": [1, None, 3, 4], "key": [0, 0, 1, 1]}).to_csv(temp_file_path, index=False)
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+
+        partitions = dn._get_partitions("chunks", 2)
+        assert [str(dn._read_partition(partition)["a"].dtype) for partition in partitions] == ["float64", "float64"]
+        partitions = dn._get_partitions("key", 2)
+        assert [str(dn._read_partition(partition)["a"].dtype) for partition in partitions] == ["float64", "float64"]
+
+    def test_append(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn.append(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        dn.append(modin_pd.DataFrame({"b": ["z"], "a": [3]}))
+        dn.append([{"a": 4, "b": "t"}])
+        assert dn.read().to_dict(orient="list") == {"a": [1, 2, 3, 4], "b": ["x", "y", "z", "t"]}
+        assert len(dn.edits) == 3
+
+        with pytest.raises(DataNodeWritingError):
+            dn.append(pd.DataFrame({"a": [5], "c": ["u"]}))
+        with pytest.raises(DataNodeWritingError):
+            dn.append(pd.DataFrame({"a": [5]}))
+        assert dn.read()["a"].tolist() == [1, 2, 3, 4]
+
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": temp_file_path, "has_header": False})
+        dn.append(pd.DataFrame({"a": [1], "b": ["x"]}))
+        dn.append(pd.DataFrame({"c": [2], "d": ["y"]}))
+        assert dn.read().values.tolist() == [[1, "x"], [2, "y"]]
+        with pytest.raises(DataNodeWritingError):
+            dn.append(pd.DataFrame({"a": [3]}))
+
+    def test_write_batches(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn._write_batches(iter([pd.DataFrame({"a": [1, 2]}), [{"a": 3}], modin_pd.DataFrame({"a": [4]})]))
+        dn._track_edit()
+        assert dn.read()["a"].tolist() == [1, 2, 3, 4]
+
+        dn._write_batches(iter([]))
+        assert dn.read().empty
+
     def test_get_system_modified_date_instead_of_last_edit_date(self, tmpdir_factory):
         temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.csv"))
         pd.DataFrame([]).to_csv(temp_file_path)
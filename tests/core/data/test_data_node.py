@@ -24,7 +24,7 @@ from src.taipy.core.data.data_node import DataNode
 from src.taipy.core.data.data_node_id import DataNodeId
 from src.taipy.core.data.in_memory import InMemoryDataNode
 from src.taipy.core.data.operator import JoinOperator, Operator
-from src.taipy.core.exceptions.exceptions import NoData
+from src.taipy.core.exceptions.exceptions import AppendNotSupported, NoData
 from src.taipy.core.job.job_id import JobId
 from taipy.config import Config
 from taipy.config.common.scope import Scope
@@ -185,6 +185,13 @@ class TestDataNode:
         assert dn.is_ready_for_reading
         assert dn.job_ids == [job_id]
 
+    def test_append_not_supported(self):
+        dn = FakeDataNode("foo_bar")
+        dn.write("Any data")
+        with pytest.raises(AppendNotSupported):
+            dn.append("Any other data")
+        assert len(dn.edits) == 1
+
     def test_ready_for_reading(self):
         dn = InMemoryDataNode("foo_bar", Scope.CYCLE)
         assert dn.last_edit_date is None
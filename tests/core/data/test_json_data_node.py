@@ -24,7 +24,7 @@ import pytest
 from src.taipy.core.data._data_manager import _DataManager
 from src.taipy.core.data.data_node_id import DataNodeId
 from src.taipy.core.data.json import JSONDataNode
-from src.taipy.core.exceptions.exceptions import NoData
+from src.taipy.core.exceptions.exceptions import AppendNotSupported, NoData
 from taipy.config.common.scope import Scope
 from taipy.config.config import Config
 from taipy.config.exceptions.exceptions import InvalidConfigurationId
@@ -158,6 +158,21 @@ class TestJSONDataNode:
         json_dn.write(data)
         assert np.array_equal(json_dn.read(), data)
 
+    def test_append(self, json_file):
+        json_dn = JSONDataNode("foo", Scope.SCENARIO, properties={"default_path": json_file, "lines": True})
+        now = datetime.datetime.now()
+        json_dn.write([{"a": 1}, {"a": 2}])
+        json_dn.append([{"a": 3, "date": now}])
+        json_dn.append({"a": 4})
+        assert json_dn.read() == [{"a": 1}, {"a": 2}, {"a": 3, "date": now}, {"a": 4}]
+        with open(json_file) as f:
+            assert len(f.readlines()) == 4
+        assert len(json_dn.edits) == 3
+
+        json_dn = JSONDataNode("bar", Scope.SCENARIO, properties={"default_path": json_file})
+        with pytest.raises(AppendNotSupported):
+            json_dn.append([{"a": 5}])
+
     def test_write_non_serializable(self, json_file):
         json_dn = JSONDataNode("foo", Scope.SCENARIO, properties={"default_path": json_file})
         data = {"a": 1, "b": json_dn}
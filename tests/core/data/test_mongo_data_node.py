@@ -10,8 +10,10 @@
 # specific language governing permissions and limitations under the License.
 
 
+import pickle
 from dataclasses import dataclass
 from datetime import datetime
+from unittest import mock
 
 import mongomock
 import pymongo
@@ -22,6 +24,7 @@ from bson.errors import InvalidDocument
 from src.taipy.core import MongoDefaultDocument
 from src.taipy.core.data.data_node_id import DataNodeId
 from src.taipy.core.data.mongo import MongoCollectionDataNode
+from src.taipy.core.data.operator import JoinOperator, Operator
 from src.taipy.core.exceptions.exceptions import InvalidCustomDocument, MissingRequiredProperty
 from taipy.config.common.scope import Scope
 
@@ -283,3 +286,68 @@ class TestMongoCollectionDataNode:
         assert read_data[1].integer == 2
         assert read_data[1].text == "def"
         assert isinstance(read_data[1].time, datetime)
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_share_client_between_data_nodes(self, properties):
+        with mock.patch("pymongo.MongoClient", wraps=pymongo.MongoClient) as client_mock:
+            mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+            other_mongo_dn = MongoCollectionDataNode("bar", Scope.SCENARIO, properties=properties)
+            client_mock.assert_not_called()
+
+            mongo_dn.write([{"foo": 1}])
+            assert [document.foo for document in other_mongo_dn.read()] == [1]
+            client_mock.assert_called_once()
+            assert other_mongo_dn.collection.database.client is mongo_dn.collection.database.client
+
+            custom_properties = properties.copy()
+            custom_properties["db_extra_args"] = {**properties.get("db_extra_args", {}), "appname": "taipy"}
+            third_mongo_dn = MongoCollectionDataNode("baz", Scope.SCENARIO, properties=custom_properties)
+            assert third_mongo_dn.collection.database.client is not mongo_dn.collection.database.client
+            assert client_mock.call_count == 2
+
+        copied_mongo_dn = pickle.loads(pickle.dumps(mongo_dn))
+        assert copied_mongo_dn._collection is None
+        assert copied_mongo_dn.collection.database.client is mongo_dn.collection.database.client
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_filter(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties={**properties, "batch_size": "2"})
+        mongo_dn.write([{"foo": i, "bar": i % 3} for i in range(10)])
+
+        with mock.patch.object(MongoCollectionDataNode, "_read") as read_all:
+            documents = mongo_dn.filter([("foo", 3, Operator.GREATER_THAN), ("bar", 1, Operator.EQUAL)])
+            read_all.assert_not_called()
+        assert [(document.foo, document.bar) for document in documents] == [(4, 1), (7, 1)]
+        documents = mongo_dn.filter(
+            [("foo", 1, Operator.LESS_THAN), ("foo", 8, Operator.GREATER_OR_EQUAL)], JoinOperator.OR
+        )
+        assert [document.foo for document in documents] == [0, 8, 9]
+        documents = mongo_dn.filter(("bar", 0, Operator.NOT_EQUAL), columns=["foo"], order_by="-foo", limit=3)
+        assert [vars(document) for document in documents] == [{"foo": 8}, {"foo": 7}, {"foo": 5}]
+        documents = mongo_dn.filter(
+            ("foo", 2, Operator.LESS_OR_EQUAL), columns=["_id", "bar"], order_by=["bar", "-_id"]
+        )
+        assert [sorted(vars(document)) for document in documents] == [["_id", "bar"]] * 3
+        assert len(mongo_dn.filter([])) == 10
+
+        with mock.patch.object(mongo_dn.collection, "find", wraps=mongo_dn.collection.find) as find:
+            mongo_dn.read()
+            assert find.call_args.kwargs["batch_size"] == 2
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_chunks(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+        mongo_dn.write([{"foo": i} for i in range(5)])
+
+        chunks = list(mongo_dn.read_chunks(2))
+        assert [[document.foo for document in chunk] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+        assert isinstance(chunks[0][0], MongoDefaultDocument)
+
+        last_id = chunks[-1][-1]._id
+        assert list(mongo_dn.read_chunks(2, after_id=last_id)) == []
+        mongo_dn.collection.insert_many([{"foo": 5}, {"foo": 6}])
+        chunks = list(mongo_dn.read_chunks(10, after_id=last_id))
+        assert [[document.foo for document in chunk] for chunk in chunks] == [[5, 6]]
@@ -9,21 +9,27 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
 import pathlib
 from datetime import datetime
 from importlib import util
 from time import sleep
+from unittest import mock
 
 import modin.pandas as modin_pd
 import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import pytest
 
 from src.taipy.core.data._data_manager import _DataManager
 from src.taipy.core.data.data_node_id import DataNodeId
+from src.taipy.core.data.operator import JoinOperator, Operator
 from src.taipy.core.data.parquet import ParquetDataNode
 from src.taipy.core.exceptions.exceptions import (
+    AppendNotSupported,
     InvalidExposedType,
     NoData,
     UnknownCompressionAlgorithm,
@@ -407,6 +413,161 @@ class TestParquetDataNode:
             check_categorical=False,
         )
 
+    def test_read_partitions(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"a": range(10), "key": [i % 3 for i in range(10)]})
+        df.to_parquet(temp_file_path, row_group_size=2)
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+
+        partitions = dn._get_partitions("chunks", 4)
+        assert partitions == [{"row_groups": [0, 1]}, {"row_groups": [2, 3]}, {"row_groups": [4]}]
+        assert dn._read_partition(partitions[2])["a"].tolist() == [8, 9]
+
+        partitions = dn._get_partitions("key", 4)
+        assert sorted(partition["value"] for partition in partitions) == [0, 1, 2]
+        partition = next(partition for partition in partitions if partition["value"] == 1)
+        assert dn._read_partition(partition)["a"].tolist() == [1, 4, 7]
+
+    def test_read_partitions_of_folder(self, tmpdir_factory, default_data_frame: pd.DataFrame):
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("temp_dir"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_dir_path, "exposed_type": "numpy"})
+        dn.write_with_kwargs(default_data_frame, partition_cols=["a"])
+
+        partitions = dn._get_partitions("chunks", 4)
+        assert len(partitions) == len(default_data_frame["a"].unique())
+        assert sum(len(dn._read_partition(partition)) for partition in partitions) == len(default_data_frame)
+
+    def test_write_batches(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn._write_batches(iter([pd.DataFrame({"a": [1, 2]}), [{"a": 3}], modin_pd.DataFrame({"a": [4]})]))
+        dn._track_edit()
+        assert dn.read()["a"].tolist() == [1, 2, 3, 4]
+        assert pq.ParquetFile(temp_file_path).metadata.num_row_groups == 3
+
+        dn = ParquetDataNode(
+            "bar", Scope.SCENARIO, properties={"path": temp_file_path, "write_kwargs": {"index": False}}
+        )
+        dn._write_batches(iter([pd.DataFrame({"a": [5]}), pd.DataFrame({"a": [6]})]))
+        dn._track_edit()
+        assert dn.read()["a"].tolist() == [5, 6]
+
+    def test_filter_pushdown(self, tmpdir_factory):
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("temp_dir"))
+        properties = {"path": temp_dir_path, "write_kwargs": {"partition_cols": ["key"]}}
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"a": range(10), "b": [i * 10 for i in range(10)], "key": [i % 3 for i in range(10)]}))
+
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as read_parquet:
+            df = dn.filter([("a", 3, Operator.GREATER_THAN), ("key", 1, Operator.EQUAL)], columns=["a", "b"])
+            expected_filters = (pc.field("a") > 3) & (pc.field("key") == 1)
+            assert read_parquet.call_args.kwargs["filters"].equals(expected_filters)
+            assert read_parquet.call_args.kwargs["columns"] == ["a", "b"]
+        assert list(df.columns) == ["a", "b"]
+        assert sorted(df["a"].tolist()) == [4, 7]
+
+        df = dn.filter([("a", 1, Operator.LESS_OR_EQUAL), ("a", 8, Operator.GREATER_OR_EQUAL)], JoinOperator.OR)
+        assert sorted(df["a"].tolist()) == [0, 1, 8, 9]
+        assert sorted(dn.filter(("b", 50, Operator.NOT_EQUAL))["a"].tolist()) == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+        assert len(dn.filter([])) == 10
+        assert dn.properties["read_kwargs"] == {}
+
+        assert dn["b"].column == "b"
+        assert sorted(dn["b"].data.tolist()) == [i * 10 for i in range(10)]
+        assert list(dn[["a", "b"]].data.columns) == ["a", "b"]
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as read_parquet:
+            filtered = dn[((dn["a"] > 3) & (dn["key"] == 1)) | (dn["b"] == 0)]
+            expected_filters = ((pc.field("a") > 3) & (pc.field("key") == 1)) | (pc.field("b") == 0)
+            assert read_parquet.call_args.kwargs["filters"].equals(expected_filters)
+        assert sorted(filtered.data["a"].tolist()) == [0, 4, 7]
+
+    def test_filter_pushdown_keeps_missing_values_different_from_any_value(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn.write(pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]}))
+
+        assert dn.filter(("b", "x", Operator.NOT_EQUAL))["a"].tolist() == [2, 3]
+        assert dn[dn["b"] != "x"].data["a"].tolist() == [2, 3]
+        assert dn.filter([("b", "x", Operator.NOT_EQUAL), ("a", 3, Operator.LESS_THAN)])["a"].tolist() == [2]
+
+    def test_partitioned_dataset(self, tmpdir_factory):
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("temp_dir"))
+        properties = {"path": temp_dir_path, "partition_cols": ["day"]}
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"a": [1, 2, 3], "day": [1, 2, 2]}))
+        dn.write(pd.DataFrame({"a": [4, 5], "day": [2, 3]}))
+
+        assert sorted(os.listdir(temp_dir_path)) == ["_taipy_manifest.json", "day=1", "day=2", "day=3"]
+        df = dn.read()
+        assert sorted(zip(df["day"].astype(int).tolist(), df["a"].tolist())) == [(1, 1), (2, 4), (3, 5)]
+        assert dn.edits[-1]["partitions"] == ["2", "3"]
+        assert sorted(dn.read_partitions(day=[2, 3])["a"].tolist()) == [4, 5]
+        assert dn.read_partitions(day=1)["a"].tolist() == [1]
+        assert len(dn.read_partitions()) == 3
+
+        with open(os.path.join(temp_dir_path, "_taipy_manifest.json")) as manifest_file:
+            manifest = json.load(manifest_file)
+        assert manifest["partition_cols"] == ["day"]
+        assert sorted(manifest["partitions"]) == ["day=1", "day=2", "day=3"]
+
+        sleep(0.1)
+        os.utime(os.path.join(temp_dir_path, "_taipy_manifest.json"))
+        assert dn.last_edit_date > dn.edits[-1]["timestamp"]
+
+    def test_append(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn.append(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        assert dn.read().to_dict(orient="list") == {"a": [1, 2], "b": ["x", "y"]}
+        with pytest.raises(AppendNotSupported):
+            dn.append(modin_pd.DataFrame({"a": [3], "b": ["z"]}))
+        assert dn.read().to_dict(orient="list") == {"a": [1, 2], "b": ["x", "y"]}
+        assert len(dn.edits) == 1
+
+    @pytest.mark.skipif(not util.find_spec("fastparquet"), reason="Append to a Parquet file requires fastparquet")
+    def test_append_with_fastparquet(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path, "engine": "fastparquet"})
+        dn.append(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        dn.append(modin_pd.DataFrame({"a": [3], "b": ["z"]}))
+        dn.append([{"a": 4, "b": "t"}])
+        assert dn.read().to_dict(orient="list") == {"a": [1, 2, 3, 4], "b": ["x", "y", "z", "t"]}
+        assert pq.ParquetFile(temp_file_path).metadata.num_row_groups == 3
+        assert len(dn.edits) == 3
+
+    def test_append_to_folder(self, tmpdir_factory):
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("temp_dir"))
+        os.mkdir(temp_dir_path)
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_dir_path})
+        dn.append(pd.DataFrame({"a": [1, 2]}))
+        dn.append(pd.DataFrame({"a": [3]}))
+        assert sorted(dn.read()["a"].tolist()) == [1, 2, 3]
+        assert len(os.listdir(temp_dir_path)) == 2
+
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("partitioned_dir"))
+        properties = {"path": temp_dir_path, "write_kwargs": {"partition_cols": ["day"]}}
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"a": [1, 2], "day": [1, 2]}))
+        dn.append(pd.DataFrame({"a": [3, 4], "day": [2, 3]}))
+        assert dn.edits[-1]["partitions"] == ["2", "3"]
+        df = dn.read()
+        assert sorted(zip(df["a"].tolist(), df["day"].astype(int).tolist())) == [(1, 1), (2, 2), (3, 2), (4, 3)]
+
+    def test_record_written_partitions_in_edits(self, tmpdir_factory):
+        temp_dir_path = str(tmpdir_factory.mktemp("data").join("temp_dir"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_dir_path})
+        dn.write_with_kwargs(pd.DataFrame({"a": [1, 2, 3], "day": [2, 1, 2]}), partition_cols=["day"])
+        assert dn._edits[-1]["partitions"] == ["1", "2"]
+
+        dn = ParquetDataNode(
+            "bar", Scope.SCENARIO, properties={"path": temp_dir_path, "write_kwargs": {"partition_cols": ["day"]}}
+        )
+        _DataManager._set(dn)
+        dn.write(pd.DataFrame({"a": [4], "day": [3]}))
+        assert dn.edits[-1]["partitions"] == ["3"]
+        assert len(dn.edits) == 1
+        assert sorted(dn.read()["a"].tolist()) == [1, 2, 3, 4]
+
     def test_read_with_kwargs_never_written(self):
         path = "data/node/path"
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
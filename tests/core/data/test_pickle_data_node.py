@@ -11,16 +11,24 @@
 
 import os
 import pathlib
+import pickle
+import subprocess
+import sys
 from datetime import datetime
+from multiprocessing import shared_memory
 from time import sleep
+from unittest import mock
 
 import modin.pandas as modin_pd
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.taipy.core.data._data_manager import _DataManager
+from src.taipy.core.data._shared_memory import _SharedMemoryReference, _SharedMemoryRegistry
 from src.taipy.core.data.pickle import PickleDataNode
-from src.taipy.core.exceptions.exceptions import NoData
+from src.taipy.core.exceptions.exceptions import InvalidTransport, NoData
+from src.taipy.core.job.job_id import JobId
 from taipy.config.common.scope import Scope
 from taipy.config.config import Config
 from taipy.config.exceptions.exceptions import InvalidConfigurationId
@@ -175,6 +183,134 @@ class TestPickleDataNodeEntity:
         dn.write({"other": "stuff"})
         assert dn.read() == {"other": "stuff"}
 
+    def test_read_and_write_with_shared_memory_transport(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        array = np.arange(100_000)
+        dn.write(array, job_id=JobId("job_1"))
+
+        reference = dn._get_shared_memory_reference()
+        assert isinstance(reference, _SharedMemoryReference)
+        assert os.path.getsize(dn.path) < array.nbytes
+        read_array = dn.read()
+        assert np.array_equal(read_array, array)
+        assert not read_array.flags.writeable
+
+        dn.write(pd.DataFrame({"a": [1, 2], "b": [3, 4]}), job_id=JobId("job_2"))
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=reference.name)
+        assert dn._get_shared_memory_reference() != reference
+        assert dn.read().equals(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+
+        reference = dn._get_shared_memory_reference()
+        _DataManager._clean_pickle_file(dn)
+        assert not os.path.exists(dn.path)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=reference.name)
+
+    def test_write_outside_of_a_job_with_shared_memory_transport(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        dn.write(np.arange(1000))
+        assert dn._get_shared_memory_reference() is None
+        assert np.array_equal(dn.read(), np.arange(1000))
+
+    def test_shared_memory_transport_falls_back_to_file_above_budget(self):
+        dn = PickleDataNode(
+            "foo", Scope.SCENARIO, properties={"transport": "shared_memory", "shared_memory_budget": 10}
+        )
+        dn.write(np.arange(1000), job_id=JobId("job_1"))
+        assert dn._get_shared_memory_reference() is None
+        assert np.array_equal(dn.read(), np.arange(1000))
+
+    def test_read_closes_shared_memory_mapping_once_data_is_released(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        dn.write(np.arange(1000), job_id=JobId("job_1"))
+
+        array = dn.read()
+        mapping = _SharedMemoryRegistry._open_mappings[-1]
+        dn.read()
+        assert mapping in _SharedMemoryRegistry._open_mappings
+        del array
+        dn.read()
+        assert mapping not in _SharedMemoryRegistry._open_mappings
+
+        mappings = list(_SharedMemoryRegistry._open_mappings)
+        dn.write([1, 2, 3], job_id=JobId("job_2"))
+        assert dn.read() == [1, 2, 3]
+        assert all(mapping in mappings for mapping in _SharedMemoryRegistry._open_mappings)
+        dn._release_shared_memory()
+
+    def test_evict_shared_memory_once_all_owners_are_released(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        dn.write(np.arange(1000), job_id=JobId("job_1"))
+        reference = dn._get_shared_memory_reference()
+        modified_time = os.path.getmtime(dn.path)
+
+        dn._acquire_shared_memory("submission_1")
+        dn._acquire_shared_memory("submission_2")
+        _SharedMemoryRegistry._release_owner("submission_1")
+        assert dn._get_shared_memory_reference() == reference
+
+        _SharedMemoryRegistry._release_owner("submission_2")
+        assert dn._get_shared_memory_reference() is None
+        assert reference.name not in _SharedMemoryRegistry._owned_segments
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=reference.name)
+        assert os.path.getmtime(dn.path) == modified_time
+        assert np.array_equal(dn.read(), np.arange(1000))
+
+    def test_evict_overwritten_shared_memory_keeps_the_new_data(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        dn.write([1, 2, 3], job_id=JobId("job_1"))
+        dn._acquire_shared_memory("submission_1")
+        dn.write([4, 5, 6], job_id=JobId("job_2"))
+        reference = dn._get_shared_memory_reference()
+
+        _SharedMemoryRegistry._release_owner("submission_1")
+        assert dn._get_shared_memory_reference() == reference
+        assert dn.read() == [4, 5, 6]
+        dn._release_shared_memory()
+
+    def test_read_released_shared_memory_raises_no_data(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "shared_memory"})
+        dn.write([1, 2, 3], job_id=JobId("job_1"))
+        dn._release_shared_memory()
+        with pytest.raises(NoData):
+            dn.read_or_raise()
+
+        with open(dn.path, "wb") as pf:
+            pickle.dump(_SharedMemoryReference("taipy_missing_segment", 0), pf)
+        with pytest.raises(NoData):
+            dn.read_or_raise()
+
+    def test_read_shared_memory_written_by_exited_process(self, tmpdir_factory):
+        path = os.path.join(tmpdir_factory.mktemp("data").strpath, "shared.p")
+        properties = {"transport": "shared_memory", "path": path}
+        code = (
+            "from src.taipy.core.data.pickle import PickleDataNode\n"
+            "from taipy.config.common.scope import Scope\n"
+            f"dn = PickleDataNode('foo', Scope.SCENARIO, version='1', properties={properties!r})\n"
+            "dn._is_written_by_job = True\n"
+            "dn._write(list(range(5)))\n"
+        )
+        subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True, cwd=os.getcwd())
+
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties=properties)
+        assert isinstance(dn._get_shared_memory_reference(), _SharedMemoryReference)
+        assert dn.read() == [0, 1, 2, 3, 4]
+        dn._release_shared_memory()
+
+    def test_write_with_file_transport_does_not_load_previous_file(self):
+        dn = PickleDataNode("foo", Scope.SCENARIO, properties={"shared_memory_budget": "10"})
+        dn.write([1, 2, 3])
+        with mock.patch("pickle.load") as load:
+            dn.write([4, 5, 6])
+            load.assert_not_called()
+        assert dn.read() == [4, 5, 6]
+
+    def test_create_with_invalid_transport(self):
+        with pytest.raises(InvalidTransport):
+            PickleDataNode("foo", Scope.SCENARIO, properties={"transport": "foo"})
+
     def test_get_system_modified_date_instead_of_last_edit_date(self, tmpdir_factory):
         temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.pickle"))
         pd.DataFrame([]).to_pickle(temp_file_path)
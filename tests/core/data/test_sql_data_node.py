@@ -9,14 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 from importlib import util
 from unittest import mock
 
 import modin.pandas as modin_pd
 import pandas as pd
 import pytest
+from sqlalchemy import create_engine
 
 from src.taipy.core.data.data_node_id import DataNodeId
+from src.taipy.core.data.operator import JoinOperator, Operator
 from src.taipy.core.data.sql import SQLDataNode
 from src.taipy.core.exceptions.exceptions import MissingRequiredProperty
 from taipy.config.common.scope import Scope
@@ -278,3 +281,30 @@ class TestSQLDataNode:
         dn = SQLDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
         data = dn.read()
         assert data.equals(pd.DataFrame([{"a": 1, "b": 2, "c": 3}, {"a": 4, "b": 5, "c": 6}]))
+
+    def test_filter(self, tmpdir_factory):
+        folder_path = tmpdir_factory.mktemp("data").strpath
+        engine = create_engine("sqlite:///" + os.path.join(folder_path, "filter.db"))
+        pd.DataFrame({"foo": range(10), "bar": [i % 3 for i in range(10)]}).to_sql("example", engine, index=False)
+        engine.dispose()
+        properties = {
+            "db_engine": "sqlite",
+            "db_name": "filter",
+            "sqlite_folder_path": folder_path,
+            "read_query": "SELECT foo, bar FROM example WHERE foo >= 2",
+            "write_query_builder": my_write_query_builder_with_pandas,
+        }
+        dn = SQLDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        df = dn.filter([("foo", 5, Operator.LESS_THAN), ("bar", 0, Operator.NOT_EQUAL)], order_by="-foo")
+        assert df.to_dict(orient="list") == {"foo": [4, 2], "bar": [1, 2]}
+        df = dn.filter(("bar", 0, Operator.EQUAL), JoinOperator.OR, columns=["foo"], limit=2)
+        assert df.to_dict(orient="list") == {"foo": [3, 6]}
+
+        dn = SQLDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "modin"})
+        assert isinstance(dn.filter(("foo", 9, Operator.EQUAL)), modin_pd.DataFrame)
+
+        dn = SQLDataNode(
+            "sqlite_dn", Scope.SCENARIO, properties={**properties, "read_query": "SELECT * FROM example; \n"}
+        )
+        assert dn.filter(("foo", 1, Operator.EQUAL)).to_dict(orient="list") == {"foo": [1], "bar": [1]}
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 from importlib import util
 from unittest import mock
 
@@ -16,10 +17,13 @@ import modin.pandas as modin_pd
 import numpy as np
 import pandas as pd
 import pytest
+from sqlalchemy import create_engine
 
+from src.taipy.core.data._sql_bulk_writers import _postgresql_copy_writer
 from src.taipy.core.data.data_node_id import DataNodeId
+from src.taipy.core.data.operator import JoinOperator, Operator
 from src.taipy.core.data.sql_table import SQLTableDataNode
-from src.taipy.core.exceptions.exceptions import InvalidExposedType, MissingRequiredProperty
+from src.taipy.core.exceptions.exceptions import InvalidExposedType, MissingRequiredProperty, UnknownSQLWriteMode
 from taipy.config.common.scope import Scope
 
 
@@ -312,7 +316,7 @@ class TestSQLTableDataNode:
 
             with mock.patch(f"src.taipy.core.data.sql_table.SQLTableDataNode.{called_func}") as mck:
                 dn.write(data)
-                mck.assert_called_once_with(written_data, create_table_mock.return_value, cursor_mock)
+                mck.assert_called_once_with(written_data, create_table_mock.return_value, cursor_mock, "replace")
 
     @pytest.mark.parametrize("pandas_properties", __pandas_properties)
     def test_raise_error_invalid_exposed_type(self, pandas_properties):
@@ -431,3 +435,182 @@ class TestSQLTableDataNode:
         data = dn.read()
 
         assert data.equals(pd.DataFrame([{"a": 1, "b": 2, "c": 3}, {"a": 4, "b": 5, "c": 6}]))
+
+    def test_filter(self, tmpdir_factory):
+        folder_path = tmpdir_factory.mktemp("data").strpath
+        engine = create_engine("sqlite:///" + os.path.join(folder_path, "filter.db"))
+        pd.DataFrame({"foo": range(10), "bar": [i % 3 for i in range(10)]}).to_sql("example", engine, index=False)
+        engine.dispose()
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": "filter",
+            "sqlite_folder_path": folder_path,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        with mock.patch.object(SQLTableDataNode, "_read_as_pandas_dataframe") as read_all:
+            df = dn.filter([("foo", 3, Operator.GREATER_THAN), ("bar", 1, Operator.EQUAL)])
+            read_all.assert_not_called()
+        assert df.to_dict(orient="list") == {"foo": [4, 7], "bar": [1, 1]}
+        df = dn.filter([("foo", 1, Operator.LESS_THAN), ("foo", 8, Operator.GREATER_OR_EQUAL)], JoinOperator.OR)
+        assert df["foo"].tolist() == [0, 8, 9]
+        df = dn.filter(("bar", 0, Operator.NOT_EQUAL), columns=["foo"], order_by="-foo", limit=3)
+        assert df.to_dict(orient="list") == {"foo": [8, 7, 5]}
+        assert len(dn.filter([])) == 10
+
+        engine = create_engine("sqlite:///" + os.path.join(folder_path, "filter.db"))
+        pd.DataFrame({"foo": [10], "bar": [None]}).to_sql("example", engine, index=False, if_exists="append")
+        engine.dispose()
+        # As in pandas, a missing value is different from any value.
+        assert dn.filter(("bar", 0, Operator.NOT_EQUAL), order_by="-foo", limit=1)["foo"].tolist() == [10]
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "numpy"})
+        assert dn.filter(("foo", 2, Operator.LESS_OR_EQUAL), order_by=["bar", "-foo"]).tolist() == [
+            [0, 0],
+            [1, 1],
+            [2, 2],
+        ]
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": MyCustomObject})
+        objects = dn.filter(("foo", 9, Operator.EQUAL))
+        assert len(objects) == 1
+        assert isinstance(objects[0], MyCustomObject)
+        assert (objects[0].foo, objects[0].bar) == (9, 0)
+
+    def test_read_chunks(self, tmpdir_factory):
+        folder_path = tmpdir_factory.mktemp("data").strpath
+        engine = create_engine("sqlite:///" + os.path.join(folder_path, "chunks.db"))
+        pd.DataFrame({"foo": range(10), "bar": [str(i) for i in range(10)]}).to_sql("example", engine, index=False)
+        engine.dispose()
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": "chunks",
+            "sqlite_folder_path": folder_path,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        chunks = list(dn.read_chunks(4))
+        assert [chunk["foo"].tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        chunks = list(dn.read_chunks(6, dtype_backend="pyarrow"))
+        assert [len(chunk) for chunk in chunks] == [6, 4]
+        assert str(chunks[0]["bar"].dtype) == "string[pyarrow]"
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": MyCustomObject})
+        chunks = list(dn.read_chunks(8))
+        assert [len(chunk) for chunk in chunks] == [8, 2]
+        assert isinstance(chunks[1][1], MyCustomObject)
+        assert (chunks[1][1].foo, chunks[1][1].bar) == (9, "9")
+
+    def test_share_engine_between_data_nodes(self, tmpdir_factory):
+        folder_path = tmpdir_factory.mktemp("data").strpath
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": "shared",
+            "sqlite_folder_path": folder_path,
+        }
+        dn_1 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        dn_2 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        assert dn_1._get_engine() is dn_2._get_engine()
+
+        dn_3 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "db_name": "other"})
+        assert dn_3._get_engine() is not dn_1._get_engine()
+
+        pool_properties = {**properties, "db_pool_size": 2, "db_max_overflow": 1, "db_pool_recycle": "60"}
+        dn_4 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=pool_properties)
+        dn_5 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=pool_properties)
+        engine = dn_4._get_engine()
+        assert engine is not dn_1._get_engine()
+        assert engine is dn_5._get_engine()
+        assert engine.pool.size() == 2
+        assert engine.pool._max_overflow == 1
+        assert engine.pool._recycle == 60
+
+        with mock.patch("os.getpid", return_value=-1):
+            dn_6 = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+            assert dn_6._get_engine() is not dn_1._engine
+
+    @staticmethod
+    def __create_example_table(folder_path, db_name):
+        engine = create_engine("sqlite:///" + os.path.join(folder_path, f"{db_name}.db"))
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE example (id INTEGER, day TEXT, value REAL)")
+        engine.dispose()
+        return {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+        }
+
+    def test_write_modes(self, tmpdir_factory):
+        properties = self.__create_example_table(tmpdir_factory.mktemp("data").strpath, "write_modes")
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "write_chunksize": 2})
+        assert dn.properties["write_mode"] == "replace"
+        df = pd.DataFrame({"id": [1, 2, 3], "day": ["a", "a", "a"], "value": [1.0, 2.0, None]})
+        dn.write(df)
+        dn.write(df)
+        assert dn.read().equals(df)
+        dn.write([(4, "b", 4.0)])
+        assert dn.read()["id"].tolist() == [4]
+        dn.append([{"id": 5, "day": "b", "value": 5.0}])
+        assert dn.read()["id"].tolist() == [4, 5]
+        # The keys missing in the first dictionary are not dropped.
+        dn.write([{"id": 7}, {"id": 8, "day": "b", "value": 8.0}])
+        assert dn.read().fillna(0).values.tolist() == [[7, 0, 0], [8, "b", 8.0]]
+        dn.write([(4, "b", 4.0)])
+        dn.append([{"id": 5, "day": "b", "value": 5.0}])
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "write_mode": "append"})
+        dn.write(df)
+        dn.write([])
+        assert dn.read()["id"].tolist() == [4, 5, 1, 2, 3]
+
+        dn = SQLTableDataNode(
+            "sqlite_dn",
+            Scope.SCENARIO,
+            properties={**properties, "write_mode": "upsert", "primary_keys": ["id", "day"], "write_chunksize": 2},
+        )
+        dn.write(pd.DataFrame({"id": [1, 6, 6, 2], "day": ["a", "c", "c", "b"], "value": [10.0, 6.0, 60.0, 20.0]}))
+        rows = dn.read().sort_values(["id", "day"]).fillna(0).to_dict(orient="records")
+        assert [(row["id"], row["day"], row["value"]) for row in rows] == [
+            (1, "a", 10.0),
+            (2, "a", 2.0),
+            (2, "b", 20.0),
+            (3, "a", 0),
+            (4, "b", 4.0),
+            (5, "b", 5.0),
+            (6, "c", 60.0),
+        ]
+
+        dn = SQLTableDataNode(
+            "sqlite_dn", Scope.SCENARIO, properties={**properties, "write_mode": "upsert", "primary_keys": "id"}
+        )
+        dn.append([{"id": 4, "day": "d", "value": 40.0}])
+        assert dn.read().query("id == 4").to_dict(orient="list") == {"id": [4], "day": ["d"], "value": [40.0]}
+        with pytest.raises(MissingRequiredProperty):
+            dn.write([{"day": "d", "value": 40.0}])
+
+    @pytest.mark.parametrize("pandas_properties", __pandas_properties)
+    def test_raise_error_invalid_write_mode(self, pandas_properties):
+        properties = pandas_properties.copy()
+        properties.pop("db_extra_args")
+        with pytest.raises(UnknownSQLWriteMode):
+            SQLTableDataNode("foo", Scope.SCENARIO, properties={**properties, "write_mode": "foo"})
+        with pytest.raises(MissingRequiredProperty):
+            SQLTableDataNode("foo", Scope.SCENARIO, properties={**properties, "write_mode": "upsert"})
+
+    def test_postgresql_copy_writer(self):
+        connection = mock.MagicMock()
+        connection.dialect.identifier_preparer.format_table.return_value = "example"
+        connection.dialect.identifier_preparer.quote.side_effect = lambda column: f'"{column}"'
+        cursor = connection.connection.driver_connection.cursor.return_value
+
+        _postgresql_copy_writer(connection, mock.Mock(), ["id", "name"], [(1, 'a "b"'), (2, None), (3, "")])
+
+        statement, buffer = cursor.copy_expert.call_args[0]
+        assert statement == 'COPY example ("id", "name") FROM STDIN WITH (FORMAT csv)'
+        assert buffer.getvalue() == '"1","a ""b"""\n"2",\n"3",""\n'
+        cursor.close.assert_called_once()
@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import timedelta
-from time import sleep
+from time import perf_counter, sleep
 from typing import Union
 from unittest import mock
 from unittest.mock import MagicMock
@@ -23,6 +23,7 @@ from src.taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core.config.job_config import JobConfig
 from src.taipy.core.data.in_memory import InMemoryDataNode
+from src.taipy.core.job._job_callback_executor import _JobCallbackExecutor, _synchronous_callback
 from src.taipy.core.job._job_manager import _JobManager
 from src.taipy.core.job.job import Job
 from src.taipy.core.job.status import Status
@@ -142,6 +143,19 @@ def test_status_job(job):
     assert job.is_skipped()
 
 
+def test_status_timestamps(job):
+    assert job.status_timestamps == {Status.SUBMITTED: job.creation_date}
+
+    job.pending()
+    job.running()
+    job.completed()
+
+    timestamps = job.status_timestamps
+    assert list(timestamps.keys()) == [Status.SUBMITTED, Status.PENDING, Status.RUNNING, Status.COMPLETED]
+    assert timestamps[Status.SUBMITTED] <= timestamps[Status.PENDING] <= timestamps[Status.RUNNING]
+    assert timestamps[Status.RUNNING] <= timestamps[Status.COMPLETED]
+
+
 def test_notification_job(job):
     subscribe = MagicMock()
     job._on_status_change(subscribe)
@@ -158,6 +172,40 @@ def test_notification_job(job):
     subscribe.assert_called_once_with(job)
 
 
+def test_notification_job_with_callback_threads(job):
+    Config.configure_job_executions(max_nb_of_callback_threads=2)
+    _JobManager._set(job)
+    notifications = []
+
+    def slow_subscriber(j):
+        start = perf_counter()
+        sleep(0.1)
+        notifications.append((start, perf_counter(), j.status))
+
+    def failing_subscriber(j):
+        raise Exception
+
+    synchronous_subscriber = _synchronous_callback(MagicMock())
+    job._on_status_change(slow_subscriber, failing_subscriber, synchronous_subscriber)
+
+    try:
+        job.pending()
+        job.running()
+        job.completed()
+        assert synchronous_subscriber.call_count == 3
+        assert len(notifications) < 3
+
+        _JobCallbackExecutor._shutdown()
+        assert len(notifications) == 3
+        # The notifications of a job are processed one at a time, in order.
+        assert notifications[0][1] <= notifications[1][0] and notifications[1][1] <= notifications[2][0]
+        # Each notification sees the status of the transition that triggered it.
+        assert [status for _, _, status in notifications] == [Status.PENDING, Status.RUNNING, Status.COMPLETED]
+        assert _JobCallbackExecutor._pending_notifications == {}
+    finally:
+        _JobCallbackExecutor._shutdown()
+
+
 def test_handle_exception_in_user_function(task_id, job_id):
     task = Task(config_id="name", properties={}, input=[], function=_error, output=[], id=task_id)
     job = Job(job_id, task, "submit_id", "scenario_entity_id")
@@ -18,6 +18,7 @@ from src.taipy.core.exceptions import ModelNotFound
 from src.taipy.core.job._job_fs_repository import _JobFSRepository
 from src.taipy.core.job._job_sql_repository import _JobSQLRepository
 from src.taipy.core.job.job import Job, JobId, Task
+from src.taipy.core.job.status import Status
 from src.taipy.core.task._task_fs_repository import _TaskFSRepository
 
 
@@ -31,10 +32,14 @@ class TestJobRepository:
 
         repository = repo()
         repository.base_path = tmpdir
+        job._metadata = {"read_cache": {"hits": 1, "misses": 0}}
+        job.pending()
         repository._save(job)
 
         obj = repository._load(job.id)
         assert isinstance(obj, Job)
+        assert obj._metadata == {"read_cache": {"hits": 1, "misses": 0}}
+        assert obj._status_timestamps == job._status_timestamps
 
     @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLRepository])
     def test_exists(self, tmpdir, data_node, job, repo):
@@ -80,6 +85,26 @@ class TestJobRepository:
 
         assert len(objs) == 1
 
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLRepository])
+    def test_load_all_by_status(self, tmpdir, data_node, job, repo):
+        repository = repo()
+        repository.base_path = tmpdir
+        _DataFSRepository()._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        _TaskFSRepository()._save(task)
+        job._task = task
+
+        statuses = [Status.PENDING, Status.RUNNING, Status.COMPLETED, Status.BLOCKED, Status.FAILED]
+        for i, status in enumerate(statuses):
+            job.id = JobId(f"job-{i}")
+            job._status = status
+            repository._save(job)
+        objs = repository._load_all_by_status([Status.BLOCKED, Status.PENDING, Status.RUNNING])
+
+        assert sorted(obj.id for obj in objs) == ["job-0", "job-1", "job-3"]
+        assert repository._load_all_by_status([Status.CANCELED]) == []
+        assert len(repository._load_all_by_status([Status.PENDING], filters=[{"id": "job-0"}])) == 1
+
     @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLRepository])
     def test_delete(self, tmpdir, data_node, job, repo):
         repository = repo()
@@ -166,6 +166,7 @@ def test_submit():
             submit_entity_id: Optional[str] = None,
             callbacks: Optional[Iterable[Callable]] = None,
             force: bool = False,
+            priority: int = 0,
         ):
             cls.submit_calls.append(task)
             return None  # type: ignore
@@ -887,9 +887,10 @@ def test_submit():
             submit_entity_id: Optional[str] = None,
             callbacks: Optional[Iterable[Callable]] = None,
             force: bool = False,
+            priority: int = 0,
         ) -> Job:
             cls.submit_calls.append(task.id)
-            return super()._submit_task(task, submit_id, submit_entity_id, callbacks, force)
+            return super()._submit_task(task, submit_id, submit_entity_id, callbacks, force, priority)
 
     with patch("src.taipy.core.task._task_manager._TaskManager._orchestrator", new=MockOrchestrator):
         with pytest.raises(NonExistingScenario):
@@ -259,4 +259,4 @@ def test_get_parents(task):
 def test_submit_task(task: Task):
     with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mock_submit:
         task.submit([], True)
-        mock_submit.assert_called_once_with(task, [], True, False, None)
+        mock_submit.assert_called_once_with(task, [], True, False, None, 0)
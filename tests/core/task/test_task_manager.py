@@ -295,7 +295,7 @@ def test_submit_task():
         submit_calls = []
         submit_ids = []
 
-        def submit_task(self, task, submit_id=None, callbacks=None, force=False, wait=False, timeout=None):
+        def submit_task(self, task, submit_id=None, callbacks=None, force=False, wait=False, timeout=None, priority=0):
             submit_id = submit_id if submit_id else f"SUBMISSION_{str(uuid.uuid4())}"
             self.submit_calls.append(task)
             self.submit_ids.append(submit_id)
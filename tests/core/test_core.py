@@ -9,6 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from unittest import mock
+
 import pytest
 
 from src.taipy.core import Core
@@ -16,6 +18,8 @@ from src.taipy.core._orchestrator._dispatcher import _DevelopmentJobDispatcher,
 from src.taipy.core._orchestrator._orchestrator import _Orchestrator
 from src.taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from src.taipy.core.config.job_config import JobConfig
+from src.taipy.core.data._sql_engine_registry import _SQLEngineRegistry
+from src.taipy.core.exceptions.exceptions import ModeNotAvailable
 from taipy.config import Config
 from taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
 
@@ -70,6 +74,33 @@ class TestCore:
         assert core._dispatcher.is_running()
         assert _OrchestratorFactory._dispatcher.is_running()
 
+    def test_resize_workers(self):
+        _OrchestratorFactory._dispatcher = None
+
+        core = Core()
+        Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+        core.run()
+        with pytest.raises(ModeNotAvailable):
+            core.resize_workers(2)
+        core.stop()
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+        core.run()
+        core.resize_workers(4, min_nb_of_workers=1)
+        assert core._dispatcher._nb_available_workers == 4
+        assert core._dispatcher._min_nb_of_workers == 1
+        core.stop()
+
+    def test_stop_disposes_sql_engines(self):
+        engine = _SQLEngineRegistry._get_engine("sqlite://")
+        core = Core()
+        Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+        core.run()
+        with mock.patch.object(engine, "dispose", wraps=engine.dispose) as dispose:
+            core.stop()
+            dispose.assert_called_once()
+        assert _SQLEngineRegistry._get_engine("sqlite://") is not engine
+
     def test_block_config_update_when_core_service_is_running_development_mode(self):
         _OrchestratorFactory._dispatcher = None
 
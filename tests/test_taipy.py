@@ -127,31 +127,34 @@ class TestTaipy:
     def test_submit(self, scenario, pipeline, task):
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario)
-            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.pipeline._pipeline_manager._PipelineManager._submit") as mck:
             tp.submit(pipeline)
-            mck.assert_called_once_with(pipeline, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(pipeline, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task)
-            mck.assert_called_once_with(task, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(task, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario, False, False, None)
-            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.pipeline._pipeline_manager._PipelineManager._submit") as mck:
             tp.submit(pipeline, False, False, None)
-            mck.assert_called_once_with(pipeline, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(pipeline, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task, False, False, None)
-            mck.assert_called_once_with(task, force=False, wait=False, timeout=None)
+            mck.assert_called_once_with(task, force=False, wait=False, timeout=None, priority=0)
         with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
             tp.submit(scenario, True, True, 60)
-            mck.assert_called_once_with(scenario, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(scenario, force=True, wait=True, timeout=60, priority=0)
         with mock.patch("src.taipy.core.pipeline._pipeline_manager._PipelineManager._submit") as mck:
             tp.submit(pipeline, True, True, 60)
-            mck.assert_called_once_with(pipeline, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(pipeline, force=True, wait=True, timeout=60, priority=0)
         with mock.patch("src.taipy.core.task._task_manager._TaskManager._submit") as mck:
             tp.submit(task, True, True, 60)
-            mck.assert_called_once_with(task, force=True, wait=True, timeout=60)
+            mck.assert_called_once_with(task, force=True, wait=True, timeout=60, priority=0)
+        with mock.patch("src.taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
+            tp.submit(scenario, priority=10)
+            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None, priority=10)
 
     def test_warning_no_core_service_running(self, scenario):
         _OrchestratorFactory._remove_dispatcher()
@@ -366,6 +369,11 @@ class TestTaipy:
             tp.cancel_job("job_id")
             mck.assert_called_once_with("job_id")
 
+    def test_get_metrics(self):
+        with mock.patch("src.taipy.core._orchestrator._metrics_registry._MetricsRegistry._get_metrics") as mck:
+            tp.get_metrics()
+            mck.assert_called_once_with()
+
     def test_block_config_when_core_is_running_in_development_mode(self):
         Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
 